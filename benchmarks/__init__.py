@@ -0,0 +1 @@
+"""Benchmarks of fefu_music."""
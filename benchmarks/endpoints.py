@@ -0,0 +1,359 @@
+r"""
+Benchmark of the catalog and landing routes under concurrent load.
+
+Every route is requested by 'concurrency' clients at once, for each of
+the concurrency levels. The requests per second, the 50th and the 99th
+percentiles of the latency and the errors are printed and saved as JSON.
+With a baseline saved by an earlier run the results are compared, and
+the benchmark fails when a route got slower by more than the tolerance.
+
+By default the application runs in the process of the benchmark with the fake
+Yandex Music API of 'benchmarks.fake_upstream', the landing blocks are stored
+in an in-memory SQLite database::
+
+    python -m benchmarks.endpoints --latency 0.02 --output results.json \
+        --baseline previous.json
+
+A running application can be benchmarked with '--target', it has to use
+the fake API through the 'yandex_music_base_url' setting.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess  # noqa: S404
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from httpx import ASGITransport, AsyncClient
+from tortoise import Tortoise
+
+from benchmarks.fake_upstream import FakeUpstream, Faults, serve
+from fefu_music.db.config import MODELS_MODULES
+from fefu_music.services import yandex_music_api
+from fefu_music.settings import settings
+from fefu_music.web.application import get_app
+
+# Paths of the catalog and landing routes by their names.
+ROUTES = {
+    "get_track": "/api/tracks/{id}?download_info=false",
+    "get_tracks": "/api/tracks?ids={id},{next_id}",
+    "get_download_info": "/api/tracks/{id}/download-info",
+    "get_album": "/api/albums/{id}",
+    "stream_album_tracks": "/api/albums/{id}/tracks",
+    "get_playlist": "/api/users/1/playlists/{id}",
+    "stream_playlist_tracks": "/api/users/1/playlists/{id}/tracks",
+    "get_chart": "/api/charts",
+    "get_new_releases": "/api/new-releases",
+    "get_new_year_playlists": "/api/playlists/new-year",
+}
+LANDING_DB_URL = "sqlite://:memory:"
+DEFAULT_CONCURRENCY = (1, 10, 50)
+DEFAULT_REQUESTS = 500
+DEFAULT_IDS = 100
+DEFAULT_TOLERANCE = 0.2
+PERCENTILES = 100
+
+
+@dataclass
+class RouteResult:
+    """Measurements of a route at a concurrency level."""
+
+    route: str
+    concurrency: int
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p99_ms: float
+
+
+class RouteLoad:
+    """Concurrent requests of a route with their latencies and errors."""
+
+    def __init__(self, client: AsyncClient, path: str, ids: int) -> None:
+        self.client = client
+        self.path = path
+        self.ids = ids
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    async def run(self, requests: int, concurrency: int) -> float:
+        """
+        Send the requests by concurrent clients.
+
+        :param requests: The number of requests.
+        :param concurrency: The number of concurrent clients.
+        :return: Seconds all the requests took.
+        """
+        remaining = iter(range(requests))
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(self._request_all(remaining) for _ in range(concurrency)),
+        )
+        return time.perf_counter() - started_at
+
+    async def _request_all(self, remaining: Iterator[int]) -> None:
+        """
+        Send the requests one by one until none is remaining.
+
+        :param remaining: The requests shared by the clients.
+        """
+        for _ in remaining:
+            await self._request()
+
+    async def _request(self) -> None:
+        """Send a request with a random ID and record its latency."""
+        item_id = random.randint(1, self.ids)  # noqa: S311
+        url = self.path.format(id=item_id, next_id=item_id + 1)
+        started_at = time.perf_counter()
+        response = await self.client.get(url)
+        self.latencies.append(time.perf_counter() - started_at)
+        self.errors += int(response.is_error)
+
+
+async def measure(
+    client: AsyncClient,
+    route: str,
+    concurrency: int,
+    args: argparse.Namespace,
+) -> RouteResult:
+    """
+    Measure the route at the concurrency level and print the measurements.
+
+    :param client: The HTTP client of the application.
+    :param route: The name of the route.
+    :param concurrency: The number of concurrent clients.
+    :param args: The arguments of the benchmark.
+    :return: The measurements.
+    """
+    route_load = RouteLoad(client, ROUTES[route], args.ids)
+    elapsed = await route_load.run(args.requests, concurrency)
+    quantiles = statistics.quantiles(
+        route_load.latencies,
+        n=PERCENTILES,
+        method="inclusive",
+    )
+    route_result = RouteResult(
+        route=route,
+        concurrency=concurrency,
+        requests=args.requests,
+        errors=route_load.errors,
+        rps=args.requests / elapsed,
+        p50_ms=quantiles[49] * 1000,  # noqa: WPS432
+        p99_ms=quantiles[98] * 1000,  # noqa: WPS432
+    )
+    print_result(route_result)
+    return route_result
+
+
+async def run(args: argparse.Namespace) -> List[RouteResult]:
+    """
+    Run the benchmark of every route at every concurrency level.
+
+    :param args: The arguments of the benchmark.
+    :return: The measurements.
+    """
+    async with AsyncExitStack() as stack:
+        client = await stack.enter_async_context(await open_client(args, stack))
+        results = [
+            await measure(client, route, concurrency, args)
+            for route in ROUTES
+            for concurrency in args.concurrency
+        ]
+    return results
+
+
+async def open_client(args: argparse.Namespace, stack: AsyncExitStack) -> AsyncClient:
+    """
+    Create the client of the benchmarked application.
+
+    Without a target the fake Yandex Music API is served and the application
+    is created in the process, only the Yandex Music client and the database
+    of the landing blocks are started.
+
+    :param args: The arguments of the benchmark.
+    :param stack: The stack the fake API and the database are served in.
+    :return: The client.
+    """
+    if args.target is not None:
+        return AsyncClient(base_url=args.target)
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    settings.yandex_music_base_url = await stack.enter_async_context(
+        serve(FakeUpstream(faults), port=args.upstream_port),
+    )
+    settings.yandex_music_token = settings.yandex_music_token or "benchmark"
+    await Tortoise.init(db_url=LANDING_DB_URL, modules={"models": MODELS_MODULES})
+    stack.push_async_callback(Tortoise.close_connections)
+    await Tortoise.generate_schemas()
+    app = get_app()
+    yandex_music_api.startup(app=app)
+    transport = ASGITransport(
+        app=app,  # type: ignore[arg-type]
+        raise_app_exceptions=False,
+    )
+    return AsyncClient(transport=transport, base_url="http://benchmark")
+
+
+def print_result(route_result: RouteResult) -> None:
+    """
+    Print the measurements of a route.
+
+    :param route_result: The measurements.
+    """
+    print(  # noqa: WPS421
+        f"{route_result.route:24} c={route_result.concurrency:<4}",
+        f"{route_result.rps:9.1f} rps",
+        f"p50 {route_result.p50_ms:8.2f} ms",
+        f"p99 {route_result.p99_ms:8.2f} ms",
+        f"errors {route_result.errors}",
+    )
+
+
+def current_commit() -> Optional[str]:
+    """
+    Get the commit of the benchmarked code.
+
+    :return: The hash of the commit or None outside of a git repository.
+    """
+    try:
+        output = subprocess.run(  # noqa: S603, S607
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def find_regressions(
+    results: Sequence[RouteResult],
+    baseline: Dict[str, Any],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compare the measurements with the baseline.
+
+    :param results: The measurements.
+    :param baseline: The saved results of an earlier run.
+    :param tolerance: The allowed relative slowdown.
+    :return: The descriptions of the routes which got slower.
+    """
+    baseline_results = {
+        (baseline_result["route"], baseline_result["concurrency"]): baseline_result
+        for baseline_result in baseline["results"]
+    }
+    regressions = []
+    for route_result in results:
+        previous = baseline_results.get((route_result.route, route_result.concurrency))
+        if previous is None:
+            continue
+        if route_result.p99_ms > previous["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{route_result.route} c={route_result.concurrency}: p99 "
+                + f"{previous['p99_ms']:.2f} -> {route_result.p99_ms:.2f} ms",
+            )
+        if route_result.rps < previous["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{route_result.route} c={route_result.concurrency}: rps "
+                + f"{previous['rps']:.1f} -> {route_result.rps:.1f}",
+            )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the arguments of the benchmark.
+
+    :return: The arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", default=None)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=DEFAULT_CONCURRENCY,
+    )
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--ids", type=int, default=DEFAULT_IDS)
+    add_upstream_arguments(parser.add_argument_group("fake Yandex Music API"))
+    add_report_arguments(parser.add_argument_group("results"))
+    return parser.parse_args()
+
+
+def add_upstream_arguments(group: argparse._ArgumentGroup) -> None:  # noqa: WPS437
+    """
+    Add the arguments of the fake Yandex Music API served by the benchmark.
+
+    :param group: The group of the arguments.
+    """
+    group.add_argument("--upstream-port", type=int, default=0)
+    group.add_argument("--latency", type=float, default=0)
+    group.add_argument("--jitter", type=float, default=0)
+    group.add_argument("--error-rate", type=float, default=0)
+
+
+def add_report_arguments(group: argparse._ArgumentGroup) -> None:  # noqa: WPS437
+    """
+    Add the arguments of saving and comparing the results.
+
+    :param group: The group of the arguments.
+    """
+    group.add_argument("--output", type=Path, default=None)
+    group.add_argument("--baseline", type=Path, default=None)
+    group.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+
+def save_results(results: Sequence[RouteResult], args: argparse.Namespace) -> None:
+    """
+    Save the measurements with the commit and the arguments as JSON.
+
+    :param results: The measurements.
+    :param args: The arguments of the benchmark.
+    """
+    report = {
+        "commit": current_commit(),
+        "created_at": time.time(),
+        "arguments": {
+            "target": args.target,
+            "requests": args.requests,
+            "ids": args.ids,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+        },
+        "results": [asdict(route_result) for route_result in results],
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+
+
+def main() -> None:
+    """
+    Run the benchmark, save the results and compare them with the baseline.
+
+    :raises SystemExit: If a route got slower than in the baseline.
+    """
+    args = parse_args()
+    results = asyncio.run(run(args))
+    if args.output is not None:
+        save_results(results, args)
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            raise SystemExit("\n".join(["Regressions:", *regressions]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+r"""
+Fake Yandex Music API replaying fixtures, for benchmarks and offline runs.
+
+It answers the catalog methods used by the application: tracks, their
+download information, albums, playlists and the landing blocks. Recorded
+responses are replayed from a directory, the response of 'tracks/1' from
+'tracks/1.json', the other requests are answered with responses generated
+by 'benchmarks.fixtures'.
+Latency and errors can be injected::
+
+    python -m benchmarks.fake_upstream --latency 0.05 --jitter 0.02 \
+        --error-rate 0.01 --rate-limit-rate 0.01
+
+The application uses it with the 'yandex_music_base_url' setting::
+
+    FEFU_MUSIC_YANDEX_MUSIC_BASE_URL=http://127.0.0.1:8081/
+"""
+import argparse
+import asyncio
+import json
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from aiohttp import web
+
+from benchmarks import fixtures
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8081
+ALBUM_TRACKS = 12
+PLAYLIST_TRACKS = 100
+CHART_TRACKS = 100
+NEW_RELEASES = 50
+COMPILATION_PLAYLISTS = 10
+# Seconds rate limited clients are asked to wait.
+RATE_LIMIT_RETRY_AFTER = 1
+
+
+@dataclass
+class Faults:
+    """Latency and errors injected into the responses."""
+
+    # Seconds every response is delayed by.
+    latency: float = 0
+    # Maximum random deviation of the delay in seconds.
+    jitter: float = 0
+    # Share of the requests answered with 500.
+    error_rate: float = 0
+    # Share of the requests answered with 429.
+    rate_limit_rate: float = 0
+
+    def delay(self) -> float:
+        """
+        Get the delay of a response.
+
+        :return: Seconds to wait before the response.
+        """
+        deviation = random.uniform(-self.jitter, self.jitter)  # noqa: S311
+        return max(self.latency + deviation, 0)
+
+
+def envelope(result: Any) -> web.Response:
+    """
+    Wrap the result into the response of Yandex Music API.
+
+    :param result: The raw result.
+    :return: The response.
+    """
+    return web.json_response(
+        {
+            "invocationInfo": {
+                "hostname": "fake-upstream",
+                "req-id": "fake-upstream",
+                "exec-duration-millis": 0,
+            },
+            "result": result,
+        },
+    )
+
+
+class FakeUpstream:
+    """Fake Yandex Music API with the injected faults."""
+
+    def __init__(self, faults: Faults, recorded_dir: Optional[Path] = None) -> None:
+        self.faults = faults
+        self.recorded_dir = recorded_dir
+        self.requests = 0
+
+    def application(self) -> web.Application:
+        """
+        Create the web application of the fake API.
+
+        :return: The application.
+        """
+        app = web.Application(middlewares=[self._inject_faults, self._replay])
+        app.router.add_routes(
+            [
+                web.get("/tracks", self.get_tracks),
+                web.get("/tracks/{track_id}", self.get_track),
+                web.get("/tracks/{track_id}/download-info", self.get_download_info),
+                web.get("/download-info/{track_id}/{codec}", self.get_direct_url_info),
+                web.get("/albums/{album_id}/with-tracks", self.get_album),
+                web.get("/users/{user_id}/playlists/{kind}", self.get_playlist),
+                web.get("/landing/block/chart", self.get_chart),
+                web.get(
+                    "/landing/block/editorial/new-releases/{block_type}",
+                    self.get_new_releases,
+                ),
+                web.get(
+                    "/landing/block/editorial/compilation/{block_type}",
+                    self.get_compilation,
+                ),
+            ],
+        )
+        return app
+
+    async def get_track(self, request: web.Request) -> web.Response:
+        """
+        Answer the track.
+
+        :param request: The request.
+        :return: The list with the track.
+        """
+        return envelope([fixtures.make_track(int(request.match_info["track_id"]))])
+
+    async def get_tracks(self, request: web.Request) -> web.Response:
+        """
+        Answer the tracks.
+
+        :param request: The request with the 'track_ids'.
+        :return: The tracks.
+        """
+        track_ids = request.query.getall("track_ids", [])
+        return envelope([fixtures.make_track(int(track_id)) for track_id in track_ids])
+
+    async def get_download_info(self, request: web.Request) -> web.Response:
+        """
+        Answer the download information of the track.
+
+        The direct URL information is requested from this server too.
+
+        :param request: The request.
+        :return: The download information of every codec.
+        """
+        base_url = f"{request.scheme}://{request.host}/"
+        track_id = int(request.match_info["track_id"])
+        return envelope(fixtures.make_raw_download_info(track_id, base_url))
+
+    async def get_direct_url_info(self, request: web.Request) -> web.Response:
+        """
+        Answer the direct URL information of the track signed now.
+
+        :param request: The request.
+        :return: The direct URL information.
+        """
+        track_id = int(request.match_info["track_id"])
+        return web.json_response(fixtures.make_raw_direct_url_info(track_id))
+
+    async def get_album(self, request: web.Request) -> web.Response:
+        """
+        Answer the album with tracks.
+
+        :param request: The request.
+        :return: The album.
+        """
+        album_id = int(request.match_info["album_id"])
+        return envelope(fixtures.make_raw_album(album_id, ALBUM_TRACKS))
+
+    async def get_playlist(self, request: web.Request) -> web.Response:
+        """
+        Answer the playlist.
+
+        :param request: The request.
+        :return: The playlist.
+        """
+        kind = int(request.match_info["kind"])
+        return envelope(fixtures.make_raw_playlist(PLAYLIST_TRACKS, kind=kind))
+
+    async def get_chart(self, request: web.Request) -> web.Response:
+        """
+        Answer the chart block of the landing.
+
+        The landing blocks are not wrapped into the result.
+
+        :param request: The request.
+        :return: The chart block.
+        """
+        return web.json_response(fixtures.make_raw_chart_block(CHART_TRACKS))
+
+    async def get_new_releases(self, request: web.Request) -> web.Response:
+        """
+        Answer the new releases of the landing.
+
+        :param request: The request.
+        :return: The new releases.
+        """
+        return web.json_response(fixtures.make_raw_new_releases(NEW_RELEASES))
+
+    async def get_compilation(self, request: web.Request) -> web.Response:
+        """
+        Answer the editorial compilation of playlists of the landing.
+
+        :param request: The request.
+        :return: The compilation.
+        """
+        return web.json_response(fixtures.make_raw_compilation(COMPILATION_PLAYLISTS))
+
+    @web.middleware
+    async def _inject_faults(
+        self,
+        request: web.Request,
+        handler: Any,
+    ) -> web.StreamResponse:
+        """
+        Delay the response and answer some requests with errors.
+
+        :param request: The request.
+        :param handler: The next handler.
+        :return: The response.
+        """
+        self.requests += 1
+        await asyncio.sleep(self.faults.delay())
+        roll = random.random()  # noqa: S311
+        if roll < self.faults.rate_limit_rate:
+            return web.json_response(
+                {"error": {"name": "rate-limited", "message": "Too many requests"}},
+                status=web.HTTPTooManyRequests.status_code,
+                headers={"Retry-After": str(RATE_LIMIT_RETRY_AFTER)},
+            )
+        if roll < self.faults.rate_limit_rate + self.faults.error_rate:
+            return web.json_response(
+                {"error": {"name": "fake-error", "message": "Injected error"}},
+                status=web.HTTPInternalServerError.status_code,
+            )
+        return await handler(request)
+
+    @web.middleware
+    async def _replay(
+        self,
+        request: web.Request,
+        handler: Any,
+    ) -> web.StreamResponse:
+        """
+        Answer the recorded response of the path if there is one.
+
+        :param request: The request.
+        :param handler: The handler generating the response.
+        :return: The response.
+        """
+        if self.recorded_dir is not None:
+            recorded_path = self.recorded_dir / f"{request.path.strip('/')}.json"
+            if recorded_path.is_file():
+                return web.json_response(json.loads(recorded_path.read_text()))
+        return await handler(request)
+
+
+@asynccontextmanager
+async def serve(
+    upstream: FakeUpstream,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> AsyncIterator[str]:
+    """
+    Serve the fake API while in the context.
+
+    :param upstream: The fake API.
+    :param host: The host to listen on.
+    :param port: The port to listen on, any free port if it is 0.
+    :yields: The base URL of the fake API.
+    """
+    runner = web.AppRunner(upstream.application())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    bound_host, bound_port = runner.addresses[0][:2]
+    try:
+        yield f"http://{bound_host}:{bound_port}/"
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Parse the arguments and serve the fake API."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--recorded", type=Path, default=None)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0)
+    args = parser.parse_args()
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+    upstream = FakeUpstream(faults, recorded_dir=args.recorded)
+    web.run_app(upstream.application(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+import time
+from typing import Any, Dict, List
+
+from ymdantic.models import Playlist
+
+RELEASE_DATE = "2023-12-01T00:00:00+03:00"
+TRACK_DURATION_MS = 180000
+# Timestamps of signed URLs are hexadecimal numbers of microseconds.
+SIGNED_URL_TS_SCALE = 10**6
+
+
+def make_artist(artist_id: int) -> Dict[str, Any]:
+    """
+    Make the raw data of an artist as it is returned by Yandex Music.
+
+    :param artist_id: The ID of the artist.
+    :return: The raw artist.
+    """
+    return {
+        "id": artist_id,
+        "name": f"Artist {artist_id}",
+        "various": False,
+        "composer": False,
+        "genres": [],
+        "disclaimers": [],
+        "cover": {
+            "type": "from-album-cover",
+            "uri": f"avatars.yandex.net/get-music-content/{artist_id}/%%",
+            "prefix": f"{artist_id}",
+        },
+    }
+
+
+def make_track(track_id: int, artists_count: int = 2) -> Dict[str, Any]:
+    """
+    Make the raw data of a track as it is returned by Yandex Music.
+
+    :param track_id: The ID of the track.
+    :param artists_count: The number of artists of the track.
+    :return: The raw track.
+    """
+    return {
+        "id": str(track_id),
+        "realId": str(track_id),
+        "title": f"Track {track_id}",
+        "trackSource": "OWN",
+        "type": "music",
+        "available": True,
+        "availableForPremiumUsers": True,
+        "availableFullWithoutPermission": False,
+        "disclaimers": [],
+        "artists": [
+            make_artist(track_id + artist_index)
+            for artist_index in range(artists_count)
+        ],
+        "albums": [],
+        "lyricsAvailable": False,
+        "rememberPosition": False,
+        "coverUri": f"avatars.yandex.net/get-music-content/{track_id}/%%",
+        "trackSharingFlag": "COVER_ONLY",
+        "storageDir": "",
+        "lyricsInfo": {
+            "hasAvailableSyncLyrics": False,
+            "hasAvailableTextLyrics": False,
+        },
+        "durationMs": TRACK_DURATION_MS,
+        "previewDurationMs": 30000,
+        "fileSize": 0,
+        "availableForOptions": [],
+    }
+
+
+def make_playlist_tracks(tracks_count: int) -> List[Dict[str, Any]]:
+    """
+    Make the raw tracks of a playlist.
+
+    :param tracks_count: The number of tracks.
+    :return: The raw playlist tracks.
+    """
+    return [
+        {
+            "id": track_id,
+            "track": make_track(track_id),
+            "timestamp": RELEASE_DATE,
+            "recent": False,
+            "originalIndex": track_id,
+            "originalShuffleIndex": track_id,
+        }
+        for track_id in range(1, tracks_count + 1)
+    ]
+
+
+def make_raw_playlist(tracks_count: int, kind: int = 3) -> Dict[str, Any]:
+    """
+    Make the raw data of a playlist as it is returned by Yandex Music.
+
+    :param tracks_count: The number of tracks.
+    :param kind: The kind of the playlist.
+    :return: The raw playlist.
+    """
+    return {
+        "owner": {
+            "uid": 1,
+            "login": "fefu",
+            "name": "fefu",
+            "sex": "unknown",
+            "verified": False,
+        },
+        "available": True,
+        "uid": 1,
+        "kind": kind,
+        "title": "Benchmark",
+        "revision": 1,
+        "snapshot": 1,
+        "trackCount": tracks_count,
+        "visibility": "public",
+        "collective": False,
+        "created": RELEASE_DATE,
+        "modified": RELEASE_DATE,
+        "isBanner": False,
+        "isPremiere": False,
+        "durationMs": TRACK_DURATION_MS * tracks_count,
+        "ogImage": "avatars.yandex.net/get-music-content/playlist/%%",
+        "cover": {
+            "type": "pic",
+            "dir": "playlist",
+            "version": "1",
+            "uri": "avatars.yandex.net/get-music-content/playlist/%%",
+            "custom": True,
+        },
+        "tags": [],
+        "description": "Benchmark playlist",
+        "likesCount": 1,
+        "similarPlaylists": [],
+        "tracks": make_playlist_tracks(tracks_count),
+        "pager": {"page": 0, "perPage": tracks_count, "total": tracks_count},
+    }
+
+
+def make_playlist(tracks_count: int) -> Playlist:
+    """
+    Make a playlist with the given number of tracks.
+
+    :param tracks_count: The number of tracks.
+    :return: The playlist.
+    """
+    return Playlist.model_validate(make_raw_playlist(tracks_count))
+
+
+def make_raw_album(album_id: int, tracks_count: int) -> Dict[str, Any]:
+    """
+    Make the raw data of an album with tracks as it is returned by Yandex Music.
+
+    :param album_id: The ID of the album.
+    :param tracks_count: The number of tracks.
+    :return: The raw album.
+    """
+    first_track_id = album_id * tracks_count
+    return {
+        "id": album_id,
+        "title": f"Album {album_id}",
+        "metaType": "music",
+        "ogImage": f"avatars.yandex.net/get-music-content/{album_id}/%%",
+        "coverUri": f"avatars.yandex.net/get-music-content/{album_id}/%%",
+        "trackCount": tracks_count,
+        "recent": False,
+        "veryImportant": False,
+        "artists": [make_artist(album_id)],
+        "labels": [{"id": 1, "name": "Benchmark"}],
+        "available": True,
+        "availableForPremiumUsers": True,
+        "availableForMobile": True,
+        "availablePartially": False,
+        "bests": [],
+        "disclaimers": [],
+        "year": 2023,
+        "releaseDate": RELEASE_DATE,
+        "likesCount": 1,
+        "type": "music",
+        "volumes": [
+            [
+                make_track(track_id)
+                for track_id in range(first_track_id, first_track_id + tracks_count)
+            ],
+        ],
+        "sortOrder": "asc",
+        "pager": {"page": 0, "perPage": tracks_count, "total": tracks_count},
+    }
+
+
+def make_raw_download_info(track_id: int, base_url: str) -> List[Dict[str, Any]]:
+    """
+    Make the raw download information of a track.
+
+    The URLs of the direct URL information point to the given server.
+
+    :param track_id: The ID of the track.
+    :param base_url: The URL of the server answering the direct URL information.
+    :return: The raw download information of every codec.
+    """
+    return [
+        {
+            "codec": codec,
+            "gain": False,
+            "preview": False,
+            "downloadInfoUrl": f"{base_url}download-info/{track_id}/{codec}",
+            "direct": False,
+            "bitrateInKbps": bitrate,
+        }
+        for codec, bitrate in (("mp3", 320), ("aac", 192))  # noqa: WPS432
+    ]
+
+
+def make_raw_direct_url_info(track_id: int) -> Dict[str, Any]:
+    """
+    Make the raw direct URL information of a track, signed now.
+
+    :param track_id: The ID of the track.
+    :return: The raw direct URL information.
+    """
+    signed_at = int(time.time() * SIGNED_URL_TS_SCALE)
+    return {
+        "s": f"{track_id:032x}",
+        "ts": f"{signed_at:x}",
+        "path": f"/music/{track_id}.mp3",
+        "host": "storage.example.com",
+    }
+
+
+def make_landing_cover(item_id: int) -> Dict[str, Any]:
+    """
+    Make the raw cover of an item on the landing.
+
+    :param item_id: The ID of the item.
+    :return: The raw cover.
+    """
+    return {
+        "uri": f"avatars.yandex.net/get-music-content/{item_id}/%%",
+        "color": "#000000",
+        "derivedColors": {
+            "average": "#000000",
+            "waveText": "#ffffff",
+            "miniPlayer": "#000000",
+            "accent": "#ffffff",
+        },
+    }
+
+
+def make_raw_chart_block(tracks_count: int) -> Dict[str, Any]:
+    """
+    Make the raw chart block of the landing as it is returned by Yandex Music.
+
+    :param tracks_count: The number of tracks in the chart.
+    :return: The raw chart block.
+    """
+    chart_tracks = [
+        {
+            "id": track_id,
+            "track": make_track(track_id),
+            "timestamp": RELEASE_DATE,
+            "recent": False,
+            "chart": {
+                "position": track_id,
+                "progress": "same",
+                "listeners": 1,
+                "shift": 0,
+            },
+            "playCount": 1,
+        }
+        for track_id in range(1, tracks_count + 1)
+    ]
+    return {
+        "id": "chart",
+        "type": "chart",
+        "typeForFrom": "chart",
+        "title": "Chart",
+        "menu": {"items": [{"title": "Russia", "url": "russia", "selected": True}]},
+        "chartDescription": "Benchmark chart",
+        "chart": {
+            "owner": {
+                "uid": 1,
+                "login": "fefu",
+                "name": "fefu",
+                "sex": "unknown",
+                "verified": False,
+            },
+            "available": True,
+            "uid": 1,
+            "kind": 1,
+            "title": "Chart",
+            "revision": 1,
+            "snapshot": 1,
+            "trackCount": tracks_count,
+            "visibility": "public",
+            "collective": False,
+            "created": RELEASE_DATE,
+            "modified": RELEASE_DATE,
+            "isBanner": False,
+            "isPremiere": False,
+            "durationMs": TRACK_DURATION_MS * tracks_count,
+            "ogImage": "avatars.yandex.net/get-music-content/chart/%%",
+            "description": "Benchmark chart",
+            "descriptionFormatted": "Benchmark chart",
+            "likesCount": 1,
+            "backgroundImageUrl": "avatars.yandex.net/get-music-content/chart/%%",
+            "backgroundVideoUrl": "https://storage.example.com/chart.mp4",
+            "tracks": chart_tracks,
+        },
+    }
+
+
+def make_raw_new_releases(albums_count: int) -> Dict[str, Any]:
+    """
+    Make the raw new releases block of the landing.
+
+    :param albums_count: The number of released albums.
+    :return: The raw new releases.
+    """
+    return {
+        "newReleases": [
+            {
+                "cover": {"uri": f"avatars.yandex.net/get-music-content/{album_id}/%%"},
+                "artists": [
+                    {
+                        "id": album_id,
+                        "name": f"Artist {album_id}",
+                        "cover": make_landing_cover(album_id),
+                    },
+                ],
+                "album": {
+                    "id": album_id,
+                    "title": f"Album {album_id}",
+                    "cover": make_landing_cover(album_id),
+                    "albumType": "single",
+                },
+                "releaseDate": RELEASE_DATE,
+            }
+            for album_id in range(1, albums_count + 1)
+        ],
+    }
+
+
+def make_raw_compilation(playlists_count: int) -> Dict[str, Any]:
+    """
+    Make the raw editorial compilation of liked playlists on the landing.
+
+    :param playlists_count: The number of playlists.
+    :return: The raw compilation.
+    """
+    return {
+        "items": [
+            {
+                "type": "liked_playlist_item",
+                "data": {
+                    "playlist": {
+                        "uid": 1,
+                        "playlistUuid": f"playlist-{kind}",
+                        "kind": kind,
+                        "title": f"Playlist {kind}",
+                        "cover": {
+                            "uri": f"avatars.yandex.net/get-music-content/{kind}/%%",
+                        },
+                    },
+                    "likesCount": 1,
+                },
+            }
+            for kind in range(1, playlists_count + 1)
+        ],
+    }
@@ -0,0 +1,203 @@
+"""
+Benchmark of the projection of a large playlist to the DTO.
+
+The projection is compared with the former path, where every DTO was
+validated from attributes of a copy of the ymdantic model and every cover
+URL was parsed again::
+
+    python -m benchmarks.projection --tracks 1000
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+
+from pydantic import BaseModel, ConfigDict, HttpUrl, computed_field, model_validator
+from ymdantic.models import Artist, Playlist, TrackType
+
+from benchmarks.fixtures import make_playlist
+from fefu_music.services.yandex_music_api import utils
+from fefu_music.web.api.playlists.schema import PlaylistDTO
+
+DEFAULT_TRACKS = 1000
+DEFAULT_NUMBER = 20
+
+
+class LegacyArtistDTO(BaseModel):
+    """Artist DTO validated from a copy of the artist."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    cover_url: Optional[HttpUrl] = None
+
+    @model_validator(mode="before")
+    def cover_url_validator(cls, obj: Artist) -> Artist:
+        """
+        Inject cover url to object.
+
+        :param obj: The artist to inject.
+        :return: The artist with injected field.
+        """
+        return obj.model_copy(
+            update={"cover_url": obj.get_cover_image_url("100x100")},
+        )
+
+
+class LegacyTrackDTO(BaseModel):
+    """Track DTO validated from a copy of the track."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    available: bool
+    type: str
+    title: str
+    cover_url: Optional[HttpUrl] = None
+    duration_ms: int
+    artists: List[LegacyArtistDTO]
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def duration_text(self) -> str:
+        """
+        Get duration text by formatting duration in milliseconds.
+
+        :return: The duration text.
+        """
+        return utils.format_duration(self.duration_ms)
+
+    @model_validator(mode="before")
+    def cover_url_validator(cls, obj: TrackType) -> TrackType:
+        """
+        Inject cover url to object.
+
+        :param obj: The track to inject.
+        :return: The track with injected field.
+        """
+        return obj.model_copy(
+            update={"cover_url": obj.get_cover_image_url("100x100")},
+        )
+
+
+class LegacyPlaylistDTO(BaseModel):
+    """Playlist DTO validated from a copy of the playlist."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    uid: int
+    kind: int
+    title: str
+    cover_url: HttpUrl
+    description: str
+    track_count: int
+    duration_ms: int
+    modified: datetime
+    likes_count: Optional[int] = None
+    tracks: List[LegacyTrackDTO]
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def duration_text(self) -> str:
+        """
+        Get duration text by formatting duration in milliseconds.
+
+        :return: The duration text.
+        """
+        return utils.format_duration(self.duration_ms)
+
+    @model_validator(mode="before")
+    def tracks_validator(cls, obj: Playlist) -> Playlist:
+        """
+        Inject cover url and tracks to object.
+
+        :param obj: The playlist to inject.
+        :return: The playlist with injected fields.
+        """
+        return obj.model_copy(
+            update={
+                "cover_url": obj.get_cover_image_url("400x400"),
+                "tracks": [playlist_track.track for playlist_track in obj.tracks],
+            },
+        )
+
+
+def legacy_path(playlist: Playlist) -> str:
+    """
+    Validate the playlist DTO from the playlist and serialize it.
+
+    :param playlist: The playlist.
+    :return: The serialized DTO.
+    """
+    return LegacyPlaylistDTO.model_validate(playlist).model_dump_json()
+
+
+def projection_path(playlist: Playlist) -> str:
+    """
+    Project the playlist to the DTO and serialize it.
+
+    :param playlist: The playlist.
+    :return: The serialized DTO.
+    """
+    return PlaylistDTO.project(playlist).model_dump_json()
+
+
+def measure(path: Callable[[Playlist], str], playlist: Playlist, number: int) -> float:
+    """
+    Measure the best time of one run of the path.
+
+    :param path: The path to measure.
+    :param playlist: The playlist to project.
+    :param number: The number of runs in a measurement.
+    :return: The best time of one run in milliseconds.
+    """
+    timings = timeit.repeat(lambda: path(playlist), number=number, repeat=5)
+    return min(timings) / number * 1000
+
+
+def same_output(playlist: Playlist) -> bool:
+    """
+    Check that both paths produce the same fields.
+
+    :param playlist: The playlist.
+    :return: True if the common fields are equal.
+    """
+    legacy: Any = json.loads(legacy_path(playlist))
+    projected: Any = json.loads(projection_path(playlist))
+    legacy_fields = legacy.items()
+    return all(projected[key] == field for key, field in legacy_fields)
+
+
+def run(tracks_count: int, number: int) -> None:
+    """
+    Run the benchmark and print the results.
+
+    :param tracks_count: The number of tracks in the playlist.
+    :param number: The number of runs in a measurement.
+    :raises SystemExit: If the projection differs from the former path.
+    """
+    playlist = make_playlist(tracks_count)
+    if not same_output(playlist):
+        raise SystemExit("The projection differs from the former path")
+
+    legacy_ms = measure(legacy_path, playlist, number)
+    projection_ms = measure(projection_path, playlist, number)
+    print(f"playlist of {tracks_count} tracks")  # noqa: WPS421
+    print(f"model_copy + validation: {legacy_ms:8.2f} ms")  # noqa: WPS421
+    print(f"projection:              {projection_ms:8.2f} ms")  # noqa: WPS421
+    print(f"speedup:                 {legacy_ms / projection_ms:8.2f}x")  # noqa: WPS421
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=DEFAULT_TRACKS)
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER)
+    args = parser.parse_args()
+    run(args.tracks, args.number)
+
+
+if __name__ == "__main__":
+    main()
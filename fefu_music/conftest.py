@@ -10,6 +10,7 @@ from httpx import AsyncClient
 from tortoise import Tortoise
 from tortoise.contrib.test import finalizer, initializer
 
+from benchmarks.fake_upstream import FakeUpstream, Faults, serve
 from fefu_music.db.config import MODELS_MODULES, TORTOISE_CONFIG
 from fefu_music.db.dao.refresh_token_dao import RefreshTokenDAO
 from fefu_music.db.dao.user_dao import UserDAO
@@ -67,15 +68,21 @@ def fastapi_app() -> FastAPI:
 @pytest.fixture(autouse=True)
 async def initialize_yandex_music_client(
     fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> AsyncGenerator[None, None]:
     """
-    Initialize a Yandex Music client.
+    Initialize a Yandex Music client reading the fake Yandex Music API.
 
     :param fastapi_app: Current FastAPI application.
+    :param monkeypatch: The pytest fixture to point the client to the fake API.
     :yields: Nothing
     """
-    yandex_music_api.startup(app=fastapi_app)
-    yield
+    async with serve(FakeUpstream(Faults()), port=0) as base_url:
+        monkeypatch.setattr(settings, "yandex_music_base_url", base_url)
+        monkeypatch.setattr(settings, "yandex_music_token", "test")
+        monkeypatch.setattr(settings, "yandex_music_tokens", [])
+        yandex_music_api.startup(app=fastapi_app)
+        yield
 
 
 @pytest.fixture
@@ -0,0 +1,86 @@
+"""Tortoise backend recording the latency of asyncpg queries and pool usage."""
+import time
+from typing import Any
+
+import asyncpg
+from asyncpg.connection import LoggedQuery
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+from tortoise.backends.base.client import PoolConnectionWrapper
+
+from fefu_music.services.metrics import (
+    db_query_duration,
+    record_db_pool_acquire,
+    record_db_pool_usage,
+)
+
+# Operations the queries are recorded by, the rest are recorded as 'OTHER'.
+DB_OPERATIONS = frozenset(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH"))
+
+
+def record_query(query: LoggedQuery) -> None:
+    """
+    Record the latency of the query by its operation.
+
+    :param query: The query logged by asyncpg.
+    """
+    words = query.query.split(maxsplit=1)
+    operation = words[0].upper() if words else ""
+    if operation not in DB_OPERATIONS:
+        operation = "OTHER"
+    db_query_duration.labels(operation).observe(query.elapsed)
+
+
+async def add_query_logger(connection: asyncpg.Connection) -> None:
+    """
+    Record the queries of a new connection of the pool.
+
+    :param connection: The connection.
+    """
+    connection.add_query_logger(record_query)
+
+
+class TimedPoolConnectionWrapper(PoolConnectionWrapper):
+    """Connection of the pool recording the wait for it and the pool usage."""
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        started_at = time.perf_counter()
+        connection = await super().__aenter__()
+        record_db_pool_acquire(
+            time.perf_counter() - started_at,
+            size=self.pool.get_size(),
+            idle=self.pool.get_idle_size(),
+            max_size=self.pool.get_max_size(),
+        )
+        return connection
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await super().__aexit__(*exc_info)
+        record_db_pool_usage(
+            size=self.pool.get_size(),
+            idle=self.pool.get_idle_size(),
+            max_size=self.pool.get_max_size(),
+        )
+
+
+class TimedAsyncpgDBClient(AsyncpgDBClient):
+    """Asyncpg client of Tortoise recording the latency of every query."""
+
+    def acquire_connection(self) -> TimedPoolConnectionWrapper:
+        """
+        Get the connection of the pool recording the wait for it.
+
+        :return: The context of the connection.
+        """
+        return TimedPoolConnectionWrapper(self)
+
+    async def create_pool(self, **kwargs: Any) -> asyncpg.Pool:
+        """
+        Create the pool of connections recording their queries.
+
+        :param kwargs: The parameters of the pool.
+        :return: The pool.
+        """
+        return await asyncpg.create_pool(None, init=add_query_logger, **kwargs)
+
+
+client_class = TimedAsyncpgDBClient
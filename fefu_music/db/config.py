@@ -1,15 +1,32 @@
 from typing import List
 
+from tortoise.backends.base.config_generator import expand_db_url
+
 from fefu_music.settings import settings
 
 MODELS_MODULES: List[str] = [
     "fefu_music.db.models.user_model",
     "fefu_music.db.models.refresh_token_model",
+    "fefu_music.db.models.landing_block_model",
 ]  # noqa: WPS407
 
 TORTOISE_CONFIG = {  # noqa: WPS407
     "connections": {
-        "default": str(settings.db_url),
+        "default": {
+            # Asyncpg backend recording the latency of the queries.
+            "engine": "fefu_music.db.backend",
+            "credentials": {
+                **expand_db_url(str(settings.db_url))["credentials"],
+                "minsize": settings.db_pool_min_size,
+                "maxsize": settings.db_pool_max_size,
+                "max_queries": settings.db_pool_max_queries,
+                "max_inactive_connection_lifetime": (
+                    settings.db_pool_max_inactive_lifetime
+                ),
+                "statement_cache_size": settings.db_statement_cache_size,
+                "command_timeout": settings.db_command_timeout,
+            },
+        },
     },
     "apps": {
         "models": {
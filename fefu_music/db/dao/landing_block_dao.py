@@ -0,0 +1,52 @@
+from typing import Any, Optional
+
+from tortoise.expressions import Subquery
+
+from fefu_music.db.models.landing_block_model import LandingBlockModel
+
+
+class LandingBlockDAO:
+    """Class for accessing landing block table."""
+
+    @staticmethod
+    async def get_by_key(key: str) -> Optional[LandingBlockModel]:
+        """
+        Get landing block by key if exists.
+
+        :param key: Landing block key.
+        :return: Landing block model if exists.
+        """
+        return await LandingBlockModel.get_or_none(key=key)
+
+    @staticmethod
+    async def save(key: str, payload: Any) -> LandingBlockModel:
+        """
+        Create or replace landing block.
+
+        :param key: Landing block key.
+        :param payload: Serialized content of the block.
+        :return: Landing block model.
+        """
+        landing_block, _ = await LandingBlockModel.update_or_create(
+            defaults={"payload": payload},
+            key=key,
+        )
+        return landing_block
+
+    @staticmethod
+    async def delete_old_versions(key: str, keep: int) -> None:
+        """
+        Delete old versions of landing block.
+
+        Versions are stored under keys like ``<key>@<version>``.
+
+        :param key: Landing block key.
+        :param keep: Number of the latest versions to keep.
+        """
+        subquery = Subquery(
+            LandingBlockModel.filter(key__startswith=f"{key}@")
+            .order_by("-updated_at")
+            .offset(keep)
+            .values("key"),
+        )
+        await LandingBlockModel.filter(key__in=subquery).delete()
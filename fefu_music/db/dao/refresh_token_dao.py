@@ -1,10 +1,47 @@
-from datetime import datetime
-from typing import Optional, Union
-from uuid import UUID
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from uuid import UUID, uuid4
 
+from tortoise import connections
 from tortoise.expressions import Subquery
 
 from fefu_music.db.models.refresh_token_model import RefreshTokenModel
+from fefu_music.db.models.user_model import UserModel
+from fefu_music.settings import settings
+
+# Refresh tokens of a user kept besides the created one.
+KEPT_REFRESH_TOKENS = 4
+# Deletes the valid refresh token, the old tokens of its user over the limit
+# and creates the new token in one statement, returning it with the user.
+ROTATE_QUERY = """
+WITH "rotated" AS (
+    DELETE FROM "refreshtokenmodel"
+    WHERE "id" = $1 AND "expires_at" >= $2
+    RETURNING "user_id"
+), "trimmed" AS (
+    DELETE FROM "refreshtokenmodel"
+    WHERE "id" IN (
+        SELECT "token"."id" FROM "refreshtokenmodel" AS "token"
+        JOIN "rotated" ON "token"."user_id" = "rotated"."user_id"
+        WHERE "token"."id" <> $1
+        ORDER BY "token"."created_at" DESC
+        OFFSET $3
+    )
+), "created" AS (
+    INSERT INTO "refreshtokenmodel" ("id", "expires_at", "created_at", "user_id")
+    SELECT $4::uuid, $5::timestamptz, $2, "user_id" FROM "rotated"
+    RETURNING "id", "user_id"
+)
+SELECT "created"."id" AS "refresh_token_id", "usermodel".*
+FROM "created" JOIN "usermodel" ON "usermodel"."id" = "created"."user_id"
+"""
+
+
+class RotatedRefreshToken(NamedTuple):
+    """Refresh token created by the rotation with its user."""
+
+    id: UUID
+    user: UserModel
 
 
 class RefreshTokenDAO:
@@ -36,31 +73,56 @@ class RefreshTokenDAO:
         subquery = Subquery(
             RefreshTokenModel.filter(user_id=user_id)
             .order_by("-created_at")
-            .offset(4)
+            .offset(KEPT_REFRESH_TOKENS)
             .values("id"),
         )
         await RefreshTokenModel.filter(id__in=subquery).delete()
 
     @staticmethod
-    async def get_by_id(
-        refresh_token: str,
-    ) -> Optional[RefreshTokenModel]:
+    async def delete_expired(limit: int) -> int:
         """
-        Check the existence of refresh token.
+        Delete a batch of expired refresh tokens.
 
-        :param refresh_token: Refresh token id.
-        :return: True if refresh token exists.
+        :param limit: Maximum number of deleted refresh tokens.
+        :return: Number of deleted refresh tokens.
         """
-        return await RefreshTokenModel.get_or_none(
-            id=refresh_token,
-            expires_at__gte=datetime.utcnow(),
-        ).prefetch_related("user")
+        subquery = Subquery(
+            RefreshTokenModel.filter(expires_at__lt=datetime.utcnow())
+            .limit(limit)
+            .values("id"),
+        )
+        return await RefreshTokenModel.filter(id__in=subquery).delete()
 
     @staticmethod
-    async def delete_by_id(refresh_token: Union[str, UUID]) -> None:
+    async def rotate(refresh_token: UUID) -> Optional[RotatedRefreshToken]:
         """
-        Delete refresh token by id.
+        Replace the valid refresh token with a new one.
+
+        The token is deleted, the old tokens of its user are trimmed to the
+        limit and the new token is created by a single statement, so the
+        rotation is atomic and takes one round trip. A token rotated
+        concurrently is rotated only once.
 
         :param refresh_token: Refresh token id.
+        :return: The new refresh token with its user or None
+            if the refresh token is invalid.
         """
-        await RefreshTokenModel.filter(id=refresh_token).delete()
+        created_at = datetime.now(timezone.utc)
+        rows = await connections.get("default").execute_query_dict(
+            ROTATE_QUERY,
+            [
+                refresh_token,
+                created_at,
+                KEPT_REFRESH_TOKENS,
+                uuid4(),
+                created_at + settings.refresh_token_expire_timedelta,
+            ],
+        )
+        if not rows:
+            return None
+        user_row = rows[0]
+        refresh_token_id = user_row.pop("refresh_token_id")
+        return RotatedRefreshToken(
+            id=refresh_token_id,
+            user=UserModel._init_from_db(**user_row),  # noqa: WPS437
+        )
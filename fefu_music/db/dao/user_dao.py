@@ -1,7 +1,19 @@
 from typing import Optional
+from uuid import UUID, uuid4
+
+from tortoise import connections
 
 from fefu_music.db.models.user_model import UserModel
 
+# Creates the user or refreshes the name and the avatar of the existing one.
+UPSERT_BY_EMAIL_QUERY = """
+INSERT INTO "usermodel" ("id", "name", "email", "avatar_url")
+VALUES ($1, $2, $3, $4)
+ON CONFLICT ("email") DO UPDATE
+SET "name" = EXCLUDED."name", "avatar_url" = EXCLUDED."avatar_url"
+RETURNING *
+"""
+
 
 class UserDAO:
     """Class for accessing user table."""
@@ -26,6 +38,29 @@ class UserDAO:
             avatar_url=avatar_url,
         )
 
+    @staticmethod
+    async def upsert_by_email(
+        name: str,
+        email: str,
+        avatar_url: str,
+    ) -> UserModel:
+        """
+        Create user or update name and avatar of user with the same email.
+
+        It is a single statement, so concurrent upserts of the same email
+        do not violate its uniqueness.
+
+        :param name: Full name.
+        :param email: User email.
+        :param avatar_url: Avatar URL.
+        :return: User model.
+        """
+        rows = await connections.get("default").execute_query_dict(
+            UPSERT_BY_EMAIL_QUERY,
+            [uuid4(), name, email, avatar_url],
+        )
+        return UserModel._init_from_db(**rows[0])  # noqa: WPS437
+
     @staticmethod
     async def get_by_email(email: str) -> Optional[UserModel]:
         """
@@ -37,7 +72,7 @@ class UserDAO:
         return await UserModel.get_or_none(email=email)
 
     @staticmethod
-    async def get_by_id(user_id: int) -> UserModel:
+    async def get_by_id(user_id: UUID) -> UserModel:
         """
         Get user by id.
 
@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "landingblockmodel" (
+    "key" VARCHAR(64) NOT NULL  PRIMARY KEY,
+    "payload" JSONB NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP
+);
+COMMENT ON TABLE "landingblockmodel" IS 'Model for pre-fetched landing blocks.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "landingblockmodel";"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_refreshtoke_user_id_792459" ON "refreshtokenmodel" ("user_id", "created_at");
+        CREATE INDEX "idx_refreshtoke_expires_60ae12" ON "refreshtokenmodel" ("expires_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX "idx_refreshtoke_expires_60ae12";
+        DROP INDEX "idx_refreshtoke_user_id_792459";"""
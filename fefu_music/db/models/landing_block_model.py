@@ -0,0 +1,9 @@
+from tortoise import fields, models
+
+
+class LandingBlockModel(models.Model):
+    """Model for pre-fetched landing blocks."""
+
+    key = fields.CharField(pk=True, max_length=64)  # noqa: WPS432
+    payload = fields.JSONField()
+    updated_at = fields.DatetimeField(auto_now=True)
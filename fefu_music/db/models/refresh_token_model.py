@@ -22,9 +22,12 @@ class RefreshTokenModel(models.Model):
     """Model for refresh tokens."""
 
     id = fields.UUIDField(pk=True)
-    expires_at = fields.DatetimeField(default=expires_at)
+    expires_at = fields.DatetimeField(default=expires_at, index=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
     user: fields.ForeignKeyRelation["UserModel"] = fields.ForeignKeyField(
         model_name="models.UserModel",
     )
+
+    class Meta:
+        indexes = (("user_id", "created_at"),)
@@ -0,0 +1,19 @@
+"""Audio streaming proxy service."""
+from fefu_music.services.audio_stream.dependencies import (
+    get_audio_cache,
+    get_audio_session,
+)
+from fefu_music.services.audio_stream.disk_cache import AudioDiskCache
+from fefu_music.services.audio_stream.files import serve_audio_file
+from fefu_music.services.audio_stream.lifetime import shutdown, startup
+from fefu_music.services.audio_stream.proxy import proxy_audio
+
+__all__ = (
+    "startup",
+    "shutdown",
+    "get_audio_session",
+    "get_audio_cache",
+    "proxy_audio",
+    "serve_audio_file",
+    "AudioDiskCache",
+)
@@ -0,0 +1,26 @@
+from typing import Optional
+
+import aiohttp
+from fastapi import Request
+
+from fefu_music.services.audio_stream.disk_cache import AudioDiskCache
+
+
+async def get_audio_session(request: Request) -> aiohttp.ClientSession:
+    """
+    Get the pooled session of the audio streaming proxy.
+
+    :param request: The request object associated with the current HTTP request.
+    :return: The session stored in the application state.
+    """
+    return request.app.state.audio_session
+
+
+async def get_audio_cache(request: Request) -> Optional[AudioDiskCache]:
+    """
+    Get the cache of the audio files.
+
+    :param request: The request object associated with the current HTTP request.
+    :return: The cache stored in the application state, None if it is disabled.
+    """
+    return request.app.state.audio_cache
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from fastapi import Response
+
+from fefu_music.services.audio_stream.files import serve_audio_file
+from fefu_music.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the files being downloaded.
+PARTIAL_SUFFIX = ".part"
+
+# Modification time, path and size of a cached file.
+CachedFile = Tuple[float, Path, int]
+
+
+class AudioDiskCache:
+    """
+    Bounded LRU cache of audio files on the disk.
+
+    Every track is kept in one file named after the track and its codec.
+    When the total size of the files exceeds the budget, the least recently
+    played files are removed.
+
+    A missing file is downloaded in the background, once for all concurrent
+    requests. It is written to a temporary file first and renamed when it is
+    complete, so a partially downloaded file is never served.
+
+    All the workers share the directory. The modification time of a file is
+    the time it was last played, and the index of every worker is rebuilt
+    from the directory whenever a file is added, so the budget bounds the
+    files of all the workers. Files removed by another worker are treated as
+    misses.
+    """
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        # Paths and sizes of the files, from the least recently played.
+        self._files: "OrderedDict[int, Tuple[Path, int]]" = OrderedDict()
+        self._fills: "Dict[int, asyncio.Task[None]]" = {}
+
+    def load(self) -> None:
+        """Create the directory and index the files left from previous runs."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._remove_abandoned_partials()
+        self._index(self._scan())
+        self._evict()
+
+    def get(self, track_id: int) -> Optional[Path]:
+        """
+        Get the cached audio file of a track.
+
+        :param track_id: The ID of the track.
+        :return: The path of the file or None if it is not cached.
+        """
+        cached_file = self._files.get(track_id)
+        if cached_file is None:
+            return None
+        try:
+            # Tells the other workers that the file is played.
+            os.utime(cached_file[0])
+        except FileNotFoundError:
+            # Removed by another worker.
+            self._forget(track_id)
+            return None
+        self._files.move_to_end(track_id)
+        return cached_file[0]
+
+    def serve(self, track_id: int, range_header: Optional[str]) -> Optional[Response]:
+        """
+        Send the cached audio file of a track or the requested range of it.
+
+        :param track_id: The ID of the track.
+        :param range_header: The value of the Range header of the request.
+        :return: Response with the audio or None if it is not cached.
+        """
+        path = self.get(track_id)
+        if path is None:
+            return None
+        try:
+            return serve_audio_file(path, range_header)
+        except FileNotFoundError:
+            # Removed by another worker.
+            self._forget(track_id)
+            return None
+
+    def remove(self, track_id: int) -> None:
+        """
+        Remove the file of a track from the cache.
+
+        :param track_id: The ID of the track.
+        """
+        path = self._forget(track_id)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def fill(
+        self,
+        track_id: int,
+        codec: str,
+        url: str,
+        session: aiohttp.ClientSession,
+    ) -> None:
+        """
+        Download the audio file of a track in the background.
+
+        Nothing is done if the file is already being downloaded.
+
+        :param track_id: The ID of the track.
+        :param codec: The codec of the audio, used as the file extension.
+        :param url: The URL of the audio file.
+        :param session: The pooled session of the audio streaming proxy.
+        """
+        if track_id in self._fills:
+            return
+        fill_task = asyncio.create_task(
+            self._download(
+                track_id,
+                self.directory / f"{track_id}.{codec}",
+                url,
+                session,
+            ),
+        )
+        self._fills[track_id] = fill_task
+        fill_task.add_done_callback(lambda done: self._fill_done(track_id, done))
+
+    async def _download(
+        self,
+        track_id: int,
+        path: Path,
+        url: str,
+        session: aiohttp.ClientSession,
+    ) -> None:
+        """
+        Download the audio file and add it to the cache.
+
+        :param track_id: The ID of the track.
+        :param path: The path of the cached file.
+        :param url: The URL of the audio file.
+        :param session: The pooled session of the audio streaming proxy.
+        :raises Exception: If the download fails, the partial file is removed.
+        """
+        partial_path = path.with_name(
+            f"{path.name}.{uuid.uuid4().hex}{PARTIAL_SUFFIX}",
+        )
+        try:
+            await _write_audio(partial_path, url, session)
+        except Exception:
+            partial_path.unlink(missing_ok=True)
+            raise
+        self.remove(track_id)
+        os.replace(partial_path, path)
+        self._index(await asyncio.to_thread(self._scan))
+        self._evict()
+
+    def _fill_done(self, track_id: int, fill_task: "asyncio.Task[None]") -> None:
+        """
+        Forget the finished download and log its failure.
+
+        :param track_id: The ID of the track.
+        :param fill_task: The finished download.
+        """
+        del self._fills[track_id]  # noqa: WPS420
+        if fill_task.cancelled():
+            return
+        exception = fill_task.exception()
+        if exception is not None:
+            logger.warning(
+                "Failed to cache the audio of track %s: %r",
+                track_id,
+                exception,
+            )
+
+    def _remove_abandoned_partials(self) -> None:
+        """
+        Remove the partially downloaded files left by failed workers.
+
+        Files being downloaded by the other workers are written to all the
+        time, only the files unchanged for a while are removed.
+        """
+        abandoned_before = time.time() - settings.audio_cache_partial_ttl
+        for partial_path in self.directory.glob(f"*{PARTIAL_SUFFIX}"):
+            try:
+                modified_at = partial_path.stat().st_mtime
+            except FileNotFoundError:
+                # Completed or removed by another worker.
+                continue
+            if modified_at < abandoned_before:
+                partial_path.unlink(missing_ok=True)
+
+    def _scan(self) -> List[CachedFile]:
+        """
+        List the cached files of all the workers in the directory.
+
+        :return: The files, from the least recently played.
+        """
+        cached_files = []
+        for path in self.directory.iterdir():
+            if path.suffix == PARTIAL_SUFFIX or not path.stem.isdigit():
+                continue
+            try:
+                file_stat = path.stat()
+            except FileNotFoundError:
+                # Removed by another worker.
+                continue
+            cached_files.append((file_stat.st_mtime, path, file_stat.st_size))
+        cached_files.sort()
+        return cached_files
+
+    def _index(self, cached_files: List[CachedFile]) -> None:
+        """
+        Replace the index with the files found in the directory.
+
+        :param cached_files: The files, from the least recently played.
+        """
+        self._files.clear()
+        self.size = 0
+        for _, path, file_size in cached_files:
+            track_id = int(path.stem)
+            # Only the last played codec of a track is kept.
+            self.remove(track_id)
+            self._files[track_id] = (path, file_size)
+            self.size += file_size
+
+    def _forget(self, track_id: int) -> Optional[Path]:
+        """
+        Remove the file of a track from the index, keeping it on the disk.
+
+        :param track_id: The ID of the track.
+        :return: The path of the file or None if it is not indexed.
+        """
+        cached_file = self._files.pop(track_id, None)
+        if cached_file is None:
+            return None
+        path, file_size = cached_file
+        self.size -= file_size
+        return path
+
+    def _evict(self) -> None:
+        """Remove the least recently played files until the cache fits the budget."""
+        while self.size > self.max_size and self._files:
+            self.remove(next(iter(self._files)))
+
+
+async def _write_audio(
+    path: Path,
+    url: str,
+    session: aiohttp.ClientSession,
+) -> None:
+    """
+    Download the audio file to the path.
+
+    :param path: The path to write the file to.
+    :param url: The URL of the audio file.
+    :param session: The pooled session of the audio streaming proxy.
+    :raises ValueError: If the audio file is empty.
+    """
+    async with session.get(url) as response:
+        response.raise_for_status()
+        chunks = response.content.iter_chunked(settings.audio_stream_chunk_size)
+        with path.open("wb") as audio_file:
+            async for chunk in chunks:
+                await asyncio.to_thread(audio_file.write, chunk)
+    if not path.stat().st_size:
+        raise ValueError("Empty audio file")
@@ -0,0 +1,165 @@
+import asyncio
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+
+from fefu_music.settings import settings
+
+ByteRange = Tuple[int, int]
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+CONTENT_TYPES = {
+    "mp3": "audio/mpeg",
+    "aac": "audio/aac",
+}
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[ByteRange]:
+    """
+    Parse a single byte range of the Range header.
+
+    :param range_header: The value of the Range header.
+    :param size: The size of the file.
+    :raises ValueError: If the range can not be satisfied.
+    :return: The first and the last byte of the range, None for the whole file.
+    """
+    if range_header is None:
+        return None
+    match = RANGE_PATTERN.fullmatch(range_header.strip())
+    if match is None:
+        # Malformed and multiple ranges are ignored, the whole file is sent.
+        return None
+    first, last = match.groups()
+    if not first:
+        return _parse_suffix_range(last, size)
+    first_byte = int(first)
+    last_byte = size - 1
+    if last:
+        last_byte = min(int(last), last_byte)
+    if first_byte > last_byte:
+        raise ValueError("Range not satisfiable")
+    return first_byte, last_byte
+
+
+def _parse_suffix_range(last: str, size: int) -> Optional[ByteRange]:
+    """
+    Parse the suffix range, which is the last bytes of the file.
+
+    :param last: The number of the last bytes.
+    :param size: The size of the file.
+    :raises ValueError: If the range is empty.
+    :return: The first and the last byte of the range, None for the whole file.
+    """
+    if not last:
+        return None
+    if not int(last):
+        raise ValueError("Range not satisfiable")
+    return max(size - int(last), 0), size - 1
+
+
+def serve_audio_file(path: Path, range_header: Optional[str]) -> Response:
+    """
+    Send an audio file or the requested range of it.
+
+    The file is memory-mapped and sent in chunks, so the range is read
+    straight from the page cache without loading the whole file. It is
+    mapped before the response starts, the mapping stays readable even if
+    the file is removed while it is sent.
+
+    :param path: The path of the audio file.
+    :param range_header: The value of the Range header of the request.
+    :return: Response with the audio.
+    """
+    with path.open("rb") as audio_file:
+        size = os.fstat(audio_file.fileno()).st_size
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        mapped_file = mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ)
+    status_code = status.HTTP_206_PARTIAL_CONTENT
+    if byte_range is None:
+        byte_range = (0, size - 1)
+        status_code = status.HTTP_200_OK
+    return _stream_range(path, mapped_file, byte_range, status_code)
+
+
+def _stream_range(
+    path: Path,
+    mapped_file: mmap.mmap,
+    byte_range: ByteRange,
+    status_code: int,
+) -> StreamingResponse:
+    """
+    Stream the range of the audio file.
+
+    :param path: The path of the audio file.
+    :param mapped_file: The memory-mapped audio file.
+    :param byte_range: The first and the last byte of the range.
+    :param status_code: The status of the response.
+    :return: Streaming response with the range.
+    """
+    first_byte, last_byte = byte_range
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Type": CONTENT_TYPES.get(path.suffix[1:], DEFAULT_CONTENT_TYPE),
+        "Content-Length": str(last_byte - first_byte + 1),
+    }
+    if status_code == status.HTTP_206_PARTIAL_CONTENT:
+        size = mapped_file.size()
+        headers["Content-Range"] = f"bytes {first_byte}-{last_byte}/{size}"
+    return StreamingResponse(
+        _read_range(mapped_file, first_byte, last_byte + 1),
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+async def _read_range(
+    mapped_file: mmap.mmap,
+    start: int,
+    stop: int,
+) -> AsyncIterator[bytes]:
+    """
+    Read the range of the memory-mapped file chunk by chunk.
+
+    The chunks are read in a thread, the page faults of a file which is not
+    in the page cache do not block the loop. The mapping is closed when the
+    body is sent or its sending is aborted.
+
+    :param mapped_file: The memory-mapped audio file.
+    :param start: The first byte of the range.
+    :param stop: The byte after the range.
+    :yields: Chunks of the range.
+    """
+    chunk_size = settings.audio_stream_chunk_size
+    with mapped_file:
+        for chunk_start in range(start, stop, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, stop)
+            yield await asyncio.to_thread(
+                _read_chunk,
+                mapped_file,
+                chunk_start,
+                chunk_stop,
+            )
+
+
+def _read_chunk(mapped_file: mmap.mmap, start: int, stop: int) -> bytes:
+    """
+    Read the chunk of the memory-mapped file.
+
+    :param mapped_file: The memory-mapped audio file.
+    :param start: The first byte of the chunk.
+    :param stop: The byte after the chunk.
+    :return: The chunk.
+    """
+    return mapped_file[start:stop]
@@ -0,0 +1,42 @@
+import aiohttp
+from fastapi import FastAPI
+
+from fefu_music.services.audio_stream.disk_cache import AudioDiskCache
+from fefu_music.settings import settings
+
+
+def startup(app: FastAPI) -> None:
+    """
+    Create the pooled session and the cache of the audio streaming proxy.
+
+    Connections to the audio storage are kept alive and reused by all streams,
+    at most 'audio_stream_connections' of them at once. The audio files cache
+    is loaded as well, unless it is disabled.
+
+    :param app: The FastAPI application.
+    """
+    app.state.audio_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=settings.audio_stream_connections),
+        timeout=aiohttp.ClientTimeout(
+            sock_connect=settings.audio_stream_connect_timeout,
+            sock_read=settings.audio_stream_read_timeout,
+        ),
+        # Audio is forwarded to the client as it is.
+        auto_decompress=False,
+    )
+    app.state.audio_cache = None
+    if settings.audio_cache_dir is not None:
+        app.state.audio_cache = AudioDiskCache(
+            directory=settings.audio_cache_dir,
+            max_size=settings.audio_cache_max_size,
+        )
+        app.state.audio_cache.load()
+
+
+async def shutdown(app: FastAPI) -> None:
+    """
+    Close the session of the audio streaming proxy.
+
+    :param app: The FastAPI application.
+    """
+    await app.state.audio_session.close()
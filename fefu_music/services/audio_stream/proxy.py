@@ -0,0 +1,104 @@
+import asyncio
+from typing import AsyncIterator, Mapping
+
+import aiohttp
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from fefu_music.settings import settings
+
+# Headers of the client request forwarded to the audio storage.
+FORWARDED_REQUEST_HEADERS = ("Range", "If-Range")
+# Headers of the audio storage response forwarded to the client.
+FORWARDED_RESPONSE_HEADERS = (
+    "Content-Type",
+    "Content-Length",
+    "Content-Range",
+    "Accept-Ranges",
+    "ETag",
+    "Last-Modified",
+)
+PROXIED_STATUSES = frozenset(
+    (
+        status.HTTP_200_OK,
+        status.HTTP_206_PARTIAL_CONTENT,
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+    ),
+)
+
+
+async def proxy_audio(
+    session: aiohttp.ClientSession,
+    url: str,
+    request_headers: Mapping[str, str],
+) -> StreamingResponse:
+    """
+    Proxy an audio file from the audio storage.
+
+    The Range header of the client is forwarded, so the storage answers with
+    the requested part of the file and its status and content headers are
+    passed back to the client.
+
+    The file is never read as a whole: every chunk is read from the storage
+    only after the previous one is sent to the client, so a slow client slows
+    down the reading instead of filling the memory.
+
+    :param session: The pooled session of the audio streaming proxy.
+    :param url: The URL of the audio file.
+    :param request_headers: Headers of the client request.
+    :raises HTTPException: If the audio storage is unavailable or fails.
+    :return: Streaming response with the audio.
+    """
+    headers = {
+        header: request_headers[header]
+        for header in FORWARDED_REQUEST_HEADERS
+        if header in request_headers
+    }
+    try:
+        upstream_response = await session.get(url, headers=headers)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Audio storage is unavailable",
+        )
+    if upstream_response.status not in PROXIED_STATUSES:
+        upstream_response.release()
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Audio storage failed to send the track",
+        )
+    return StreamingResponse(
+        _forward_chunks(upstream_response),
+        status_code=upstream_response.status,
+        headers={
+            header: upstream_response.headers[header]
+            for header in FORWARDED_RESPONSE_HEADERS
+            if header in upstream_response.headers
+        },
+        # Runs when the stream ends or the client disconnects.
+        background=BackgroundTask(_release, upstream_response),
+    )
+
+
+async def _forward_chunks(
+    upstream_response: aiohttp.ClientResponse,
+) -> AsyncIterator[bytes]:
+    """
+    Read the audio from the storage chunk by chunk.
+
+    :param upstream_response: The response of the audio storage.
+    :yields: Chunks of the audio.
+    """
+    chunks = upstream_response.content.iter_chunked(settings.audio_stream_chunk_size)
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _release(upstream_response: aiohttp.ClientResponse) -> None:
+    """
+    Return the connection to the pool, or close it if the audio was not read.
+
+    :param upstream_response: The response of the audio storage.
+    """
+    upstream_response.release()
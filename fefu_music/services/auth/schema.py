@@ -36,6 +36,14 @@ class User(BaseModel):
     status: UserStatusEnum
 
 
+class AccessClaims(BaseModel):
+    """Compact claims of the access token."""
+
+    id: UUID4
+    status: UserStatusEnum
+    version: int
+
+
 class RefreshDeletionEnum(Enum):
     """Enum for refresh deletion."""
 
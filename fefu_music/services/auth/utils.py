@@ -1,18 +1,65 @@
-from fastapi import HTTPException, Response, Security
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, Response, Security
 from fastapi_jwt import JwtAccessBearer, JwtAuthorizationCredentials
 from passlib.context import CryptContext
 from starlette import status
+from tortoise.exceptions import DoesNotExist
 
 from fefu_music.db.dao.refresh_token_dao import RefreshTokenDAO
-from fefu_music.services.auth.schema import RefreshCookie, User
+from fefu_music.db.dao.user_dao import UserDAO
+from fefu_music.services.auth.schema import AccessClaims, RefreshCookie, User
+from fefu_music.services.metrics import record_cache_lookup
+from fefu_music.services.yandex_music_api.cache import TTLCache
 from fefu_music.settings import settings
 
+TOKEN_DIGEST_SIZE = 32
+
+
+class CachedJwtAccessBearer(JwtAccessBearer):
+    """
+    Bearer of access tokens remembering the verified ones.
+
+    Digests of the verified tokens are kept with their payloads in a bounded
+    LRU cache until the tokens expire, so a token sent again is not decoded
+    and verified again.
+    """
+
+    def __init__(self, cache_size: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.verified_tokens = TTLCache(max_size=cache_size)
+
+    def _decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the payload of the token, verifying it if it is not remembered.
+
+        :param token: The access token.
+        :return: The payload or None if the token is invalid.
+        """
+        digest = hashlib.blake2b(
+            token.encode(),
+            digest_size=TOKEN_DIGEST_SIZE,
+        ).digest()
+        payload = self.verified_tokens.get(digest)
+        record_cache_lookup("auth", "access_token", payload is not None)
+        if payload is None:
+            payload = super()._decode(token)
+            ttl = payload["exp"] - time.time() if payload else 0
+            if ttl > 0:
+                self.verified_tokens.set(digest, payload, ttl=ttl)
+        return payload
+
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-access_security = JwtAccessBearer(
+access_security = CachedJwtAccessBearer(
+    cache_size=settings.access_token_cache_size,
     secret_key=settings.secret_key,
     auto_error=False,
     access_expires_delta=settings.access_token_expire_timedelta,
 )
+user_cache = TTLCache(max_size=settings.user_cache_size)
 refresh_security = RefreshCookie(
     refresh_token_expire_timedelta=settings.refresh_token_expire_timedelta,
 )
@@ -25,14 +72,15 @@ def validate_access_security(
     Function to validate access security.
 
     This function checks if the credentials from the access token are valid. If the
-    credentials are not valid, it raises an HTTPException with a status code of
-    401 (Unauthorized).
+    credentials are not valid or their claims are of another version, it raises
+    an HTTPException with a status code of 401 (Unauthorized).
 
     :param credentials: The credentials from the access token.
     :raises HTTPException: If the credentials are invalid.
     :return: The credentials if they are valid.
     """
-    if not credentials:
+    version = credentials.subject.get("version") if credentials else None
+    if version != settings.access_claims_version:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
@@ -40,6 +88,66 @@ def validate_access_security(
     return credentials
 
 
+async def get_current_user(
+    credentials: JwtAuthorizationCredentials = Depends(validate_access_security),
+    user_dao: UserDAO = Depends(),
+) -> User:
+    """
+    Get the profile of the user of the access token.
+
+    Profiles are kept in memory for 'user_cache_ttl' seconds, so repeated
+    requests of a user do not query the database.
+
+    :param credentials: The valid credentials from the access token.
+    :param user_dao: The User Data Access Object (DAO).
+    :raises HTTPException: If the user does not exist anymore.
+    :return: The user.
+    """
+    claims = AccessClaims.model_validate(credentials.subject)
+    user = user_cache.get(claims.id)
+    record_cache_lookup("user", "get_by_id", user is not None)
+    if user is None:
+        try:
+            user = User.model_validate(await user_dao.get_by_id(claims.id))
+        except DoesNotExist:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        cache_user(user)
+    return user
+
+
+def cache_user(user_dto: User) -> None:
+    """
+    Keep the profile of the user in memory for 'user_cache_ttl' seconds.
+
+    It replaces the cached profile when the user is updated.
+
+    :param user_dto: The user.
+    """
+    user_cache.set(user_dto.id, user_dto, ttl=settings.user_cache_ttl)
+
+
+def create_access_token(user_dto: User) -> str:
+    """
+    Create an access token with the compact claims of the user.
+
+    The claims are the ID, the status and the version of the claims.
+
+    :param user_dto: The user to create the access token for.
+    :return: The created access token.
+    """
+    claims = AccessClaims(
+        id=user_dto.id,
+        status=user_dto.status,
+        version=settings.access_claims_version,
+    )
+    return access_security.create_access_token(
+        subject=claims.model_dump(mode="json"),
+    )
+
+
 async def create_and_get_access_data(
     response: Response,
     user_dto: User,
@@ -48,8 +156,7 @@ async def create_and_get_access_data(
     Asynchronous function to create and set a refresh token.
 
     This function creates a new refresh token for the specified user and sets it in
-    the response. It also creates an access token with the user's ID and any
-    additional data provided.
+    the response. It also creates an access token of the user.
 
     :param response: The response object to set the refresh token in.
     :param user_dto: The user to create the refresh token for.
@@ -58,13 +165,10 @@ async def create_and_get_access_data(
     refresh_token_dao = RefreshTokenDAO()
     await refresh_token_dao.delete_old_when_limit(user_id=user_dto.id)
 
-    access_token = access_security.create_access_token(
-        subject=user_dto.model_dump(mode="json"),
-    )
     refresh_token = await refresh_token_dao.create(user_id=user_dto.id)
 
     refresh_security.set_refresh_cookie(response, refresh_token.id)
-    return access_token
+    return create_access_token(user_dto)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
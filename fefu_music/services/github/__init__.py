@@ -1 +1,7 @@
 """GitHub service."""
+from fefu_music.services.github.lifetime import shutdown, startup
+
+__all__ = (
+    "startup",
+    "shutdown",
+)
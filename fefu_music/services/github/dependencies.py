@@ -1,7 +1,8 @@
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Mapping
 
 import aiohttp
-from fastapi import Body, Depends, HTTPException
+from fastapi import Body, Depends, HTTPException, Request
 from pydantic import ValidationError
 from starlette import status
 
@@ -10,18 +11,30 @@ from fefu_music.services.github.schema import GithubUser, PrivateUser, PublicUse
 from fefu_music.settings import settings
 
 
+async def get_github_session(request: Request) -> aiohttp.ClientSession:
+    """
+    Get the pooled session of the GitHub client.
+
+    :param request: The request object associated with the current HTTP request.
+    :return: The session stored in the application state.
+    """
+    return request.app.state.github_session
+
+
 async def get_github_access_token(
     code: str = Body(embed=True),
+    session: aiohttp.ClientSession = Depends(get_github_session),
 ) -> GithubOAuthResponse:
     """
     Asynchronous function to get a GitHub access token.
 
     This function sends a POST request to GitHub's OAuth access token endpoint with
     the necessary data to exchange a temporary code for an access token. The function
-    is asynchronous and uses aiohttp's ClientSession to send the request.
+    is asynchronous and uses the pooled aiohttp ClientSession to send the request.
 
     :param code: The temporary code received as a response to the
                  OAuth authorization request.
+    :param session: The pooled session of the GitHub client.
     :raises HTTPException: If the response does not contain an access token.
     :return: The response text from the POST request,
              which should contain the access token.
@@ -36,31 +49,33 @@ async def get_github_access_token(
         "code": code,
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, data=data, headers=headers) as response:
-            try:
-                return GithubOAuthResponse(**(await response.json()))
-            except ValidationError:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid github temporary code",
-                )
+    async with session.post(url, data=data, headers=headers) as response:
+        try:
+            return GithubOAuthResponse(**(await response.json()))
+        except ValidationError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid github temporary code",
+            )
 
 
 async def get_github_user_data(
     github_oauth_response: GithubOAuthResponse = Depends(get_github_access_token),
+    session: aiohttp.ClientSession = Depends(get_github_session),
 ) -> GithubUser:
     """
     Asynchronous function to get a GitHub user's data.
 
-    This function sends a GET request to GitHub's user endpoint with
-    the necessary headers including the access token. The function
-    is asynchronous and uses aiohttp's ClientSession to send the request.
+    This function sends GET requests to GitHub's user and user emails endpoints
+    concurrently with the necessary headers including the access token. The function
+    is asynchronous and uses the pooled aiohttp ClientSession to send the requests.
+    When one of the requests fails, the other one is cancelled.
 
     :param github_oauth_response: The response from the OAuth access token request.
+    :param session: The pooled session of the GitHub client.
+    :raises Exception: If one of the requests fails.
+    :raises asyncio.CancelledError: If the login is cancelled.
     :return: A GithubUser object which can be either a PrivateUser or PublicUser.
-    :raises HTTPException: If the response status is not 200, an HTTPException
-                           is raised with status code 401.
     """
     headers = {
         "Accept": "application/vnd.github+json",
@@ -68,26 +83,53 @@ async def get_github_user_data(
         "X-GitHub-Api-Version": "2022-11-28",
     }
 
-    async with aiohttp.ClientSession(headers=headers) as session:
-        emails = await get_github_user_emails(session=session)
-        async with session.get(
-            url="https://api.github.com/user",
-        ) as user_response:
-            if user_response.status != 200:  # noqa: WPS432
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Not authenticated to GitHub",
-                )
+    user_task = asyncio.create_task(
+        get_github_user(session=session, headers=headers),
+    )
+    emails_task = asyncio.create_task(
+        get_github_user_emails(session=session, headers=headers),
+    )
+    try:
+        user_data, emails = await asyncio.gather(user_task, emails_task)
+    except (Exception, asyncio.CancelledError):
+        # The other request is not needed when one of them fails.
+        user_task.cancel()
+        emails_task.cancel()
+        raise
+    user_data.pop("email", None)
+    if "business_plus" in user_data:
+        return PrivateUser(email=emails[0]["email"], **user_data)
+    return PublicUser(email=emails[0]["email"], **user_data)
+
+
+async def get_github_user(
+    session: aiohttp.ClientSession,
+    headers: Mapping[str, str],
+) -> Dict[str, Any]:
+    """
+    Asynchronous function to get a GitHub user's profile.
 
-            user_data = await user_response.json()
-            user_data.pop("email", None)
-            if "business_plus" in user_data:
-                return PrivateUser(email=emails[0]["email"], **user_data)
-            return PublicUser(email=emails[0]["email"], **user_data)
+    :param session: The aiohttp ClientSession to use for the request.
+    :param headers: The headers of the request with the access token.
+    :return: The profile of the user.
+    :raises HTTPException: If the response status is not 200, an HTTPException
+                           is raised with status code 401.
+    """
+    async with session.get(
+        url="https://api.github.com/user",
+        headers=headers,
+    ) as user_response:
+        if user_response.status != 200:  # noqa: WPS432
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated to GitHub",
+            )
+        return await user_response.json()
 
 
 async def get_github_user_emails(
     session: aiohttp.ClientSession,
+    headers: Mapping[str, str],
 ) -> List[Dict[str, Any]]:
     """
     Asynchronous function to get a GitHub user's emails.
@@ -97,11 +139,13 @@ async def get_github_user_emails(
     is asynchronous and uses aiohttp's ClientSession to send the request.
 
     :param session: The aiohttp ClientSession to use for the request.
+    :param headers: The headers of the request with the access token.
     :return: A list of dictionaries, each representing an email associated
              with the user.
     """
     async with session.get(
         url="https://api.github.com/user/emails",
+        headers=headers,
     ) as email_response:
         # TODO: Rewrite
         return await email_response.json()
@@ -0,0 +1,31 @@
+import aiohttp
+from fastapi import FastAPI
+
+from fefu_music.settings import settings
+
+
+def startup(app: FastAPI) -> None:
+    """
+    Create the pooled session of the GitHub client.
+
+    Connections to GitHub are kept alive and reused by all logins, resolved
+    addresses of GitHub are cached for 'github_dns_cache_ttl' seconds.
+
+    :param app: The FastAPI application.
+    """
+    app.state.github_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=settings.github_connections,
+            ttl_dns_cache=settings.github_dns_cache_ttl,
+        ),
+        timeout=aiohttp.ClientTimeout(total=settings.github_timeout),
+    )
+
+
+async def shutdown(app: FastAPI) -> None:
+    """
+    Close the session of the GitHub client.
+
+    :param app: The FastAPI application.
+    """
+    await app.state.github_session.close()
@@ -0,0 +1,26 @@
+"""Metrics of the application in the format of Prometheus."""
+from fefu_music.services.metrics.registry import (  # noqa: WPS235
+    db_query_duration,
+    http_request_duration,
+    http_requests_in_flight,
+    loop_lag,
+    record_cache_lookup,
+    record_db_pool_acquire,
+    record_db_pool_usage,
+    render_metrics,
+    upstream_request_duration,
+    upstream_requests_in_flight,
+)
+
+__all__ = (
+    "http_request_duration",
+    "http_requests_in_flight",
+    "upstream_request_duration",
+    "upstream_requests_in_flight",
+    "db_query_duration",
+    "loop_lag",
+    "record_cache_lookup",
+    "record_db_pool_acquire",
+    "record_db_pool_usage",
+    "render_metrics",
+)
@@ -0,0 +1,296 @@
+import math
+from bisect import bisect_left
+from typing import Any, Dict, Generic, ItemsView, Iterator, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+ChildType = TypeVar("ChildType")
+
+# Buckets of latencies in seconds, from 5 milliseconds to 10 seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def format_value(metric_value: float) -> str:
+    """
+    Format the value of a sample in the text format of Prometheus.
+
+    :param metric_value: The value.
+    :return: The formatted value.
+    """
+    if math.isinf(metric_value):
+        return "+Inf" if metric_value > 0 else "-Inf"
+    return repr(float(metric_value))
+
+
+def escape_label(label_value: str) -> str:
+    """
+    Escape the value of a label in the text format of Prometheus.
+
+    :param label_value: The value.
+    :return: The value with escaped backslashes, quotes and line breaks.
+    """
+    return label_value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(names: Sequence[str], label_values: Sequence[str]) -> str:
+    """
+    Format the labels of a sample in the text format of Prometheus.
+
+    :param names: The names of the labels.
+    :param label_values: The values of the labels.
+    :return: The formatted labels in braces or an empty string.
+    """
+    if not names:
+        return ""
+    labels = ",".join(
+        f'{name}="{escape_label(label_value)}"'
+        for name, label_value in zip(names, label_values)
+    )
+    return f"{{{labels}}}"
+
+
+class CounterChild:
+    """Value of a counter with one set of labels."""
+
+    def __init__(self) -> None:
+        self.metric_value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increase the counter.
+
+        :param amount: The amount to add.
+        """
+        self.metric_value += amount
+
+
+ValueChildType = TypeVar("ValueChildType", bound=CounterChild)
+
+
+class GaugeChild(CounterChild):
+    """Value of a gauge with one set of labels."""
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Decrease the gauge.
+
+        :param amount: The amount to subtract.
+        """
+        self.metric_value -= amount
+
+    def set(self, metric_value: float) -> None:  # noqa: WPS125
+        """
+        Set the gauge.
+
+        :param metric_value: The new value.
+        """
+        self.metric_value = metric_value
+
+
+class HistogramChild:
+    """Buckets of a histogram with one set of labels."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        # The last count is of the values above all the buckets.
+        self.counts = [0 for _ in range(len(buckets) + 1)]
+        self.total: float = 0
+        self.count = 0
+
+    def observe(self, metric_value: float) -> None:
+        """
+        Record the value in its bucket.
+
+        :param metric_value: The observed value.
+        """
+        self.counts[bisect_left(self.buckets, metric_value)] += 1
+        self.total += metric_value
+        self.count += 1
+
+
+class Metric(Generic[ChildType]):
+    """
+    Metric kept in the memory of the worker.
+
+    The values of every set of labels are kept in a child created on
+    the first use. The metrics are only changed from the event loop, so they
+    need no locks, and the hot path is a dictionary lookup and an addition.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children: Dict[LabelValues, ChildType] = {}
+
+    def labels(self, *label_values: str) -> ChildType:
+        """
+        Get the child of the set of labels.
+
+        :param label_values: The values of the labels in the order of names.
+        :return: The child.
+        """
+        child = self._children.get(label_values)
+        if child is None:
+            child = self._new_child()
+            self._children[label_values] = child
+        return child
+
+    def children(self) -> ItemsView[LabelValues, ChildType]:
+        """
+        Get the children of all the sets of labels.
+
+        :return: The values of the labels with their children.
+        """
+        return self._children.items()
+
+    def render(self) -> Iterator[str]:
+        """
+        Render the metric in the text format of Prometheus.
+
+        :yields: The lines of the metric.
+        """
+        yield from (
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        )
+        for label_values, child in list(self._children.items()):
+            yield from self._samples(label_values, child)
+
+    def _new_child(self) -> ChildType:
+        """
+        Create the child of a new set of labels.
+
+        :raises NotImplementedError: In the base class.
+        """
+        raise NotImplementedError
+
+    def _samples(self, label_values: LabelValues, child: ChildType) -> Iterator[str]:
+        """
+        Render the samples of the child.
+
+        :param label_values: The values of the labels of the child.
+        :param child: The child.
+        :raises NotImplementedError: In the base class.
+        """
+        raise NotImplementedError
+
+
+class ValueMetric(Metric[ValueChildType]):
+    """Metric with a single value per set of labels."""
+
+    def _samples(
+        self,
+        label_values: LabelValues,
+        child: ValueChildType,
+    ) -> Iterator[str]:
+        """
+        Render the value of the child.
+
+        :param label_values: The values of the labels of the child.
+        :param child: The child.
+        :yields: The line of the sample.
+        """
+        labels = format_labels(self.label_names, label_values)
+        yield f"{self.name}{labels} {format_value(child.metric_value)}"
+
+
+class Counter(ValueMetric[CounterChild]):
+    """Counter only going up."""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        """
+        Create the counter of a new set of labels.
+
+        :return: The counter starting at zero.
+        """
+        return CounterChild()
+
+
+class Gauge(ValueMetric[GaugeChild]):
+    """Gauge going up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        """
+        Create the gauge of a new set of labels.
+
+        :return: The gauge starting at zero.
+        """
+        return GaugeChild()
+
+
+class Histogram(Metric[HistogramChild]):
+    """
+    Histogram of observed values.
+
+    The counts of the buckets are allocated once per set of labels, so
+    an observation does not allocate memory.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_label_names = (*self.label_names, "le")
+        bounds = (*self.buckets, math.inf)
+        self._bounds = tuple(format_value(bound) for bound in bounds)
+
+    def _new_child(self) -> HistogramChild:
+        """
+        Create the buckets of a new set of labels.
+
+        :return: The empty buckets.
+        """
+        return HistogramChild(self.buckets)
+
+    def _samples(
+        self,
+        label_values: LabelValues,
+        child: HistogramChild,
+    ) -> Iterator[str]:
+        """
+        Render the cumulative buckets, the sum and the count of the child.
+
+        :param label_values: The values of the labels of the child.
+        :param child: The buckets.
+        :yields: The lines of the samples.
+        """
+        cumulative_count = 0
+        for bound, count in zip(self._bounds, child.counts):
+            cumulative_count += count
+            labels = format_labels(self._bucket_label_names, (*label_values, bound))
+            yield f"{self.name}_bucket{labels} {cumulative_count}"
+        labels = format_labels(self.label_names, label_values)
+        yield from (
+            f"{self.name}_sum{labels} {format_value(child.total)}",
+            f"{self.name}_count{labels} {child.count}",
+        )
+
+
+def render(metrics: Sequence[Metric[Any]]) -> str:
+    """
+    Render the metrics in the text format of Prometheus.
+
+    :param metrics: The metrics.
+    :return: The exposition of the metrics.
+    """
+    lines = [line for metric in metrics for line in metric.render()]
+    lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,124 @@
+from fefu_music.services.metrics.instruments import Counter, Gauge, Histogram, render
+
+http_request_duration = Histogram(
+    "fefu_music_http_request_duration_seconds",
+    "Latency of HTTP requests until the response is sent.",
+    labels=("route", "status"),
+)
+http_requests_in_flight = Gauge(
+    "fefu_music_http_requests_in_flight",
+    "HTTP requests being handled.",
+)
+upstream_request_duration = Histogram(
+    "fefu_music_yandex_music_request_duration_seconds",
+    "Latency of requests to Yandex Music.",
+    labels=("method", "outcome"),
+)
+upstream_requests_in_flight = Gauge(
+    "fefu_music_yandex_music_requests_in_flight",
+    "Requests to Yandex Music waiting for the response.",
+    labels=("method",),
+)
+cache_requests = Counter(
+    "fefu_music_cache_requests_total",
+    "Lookups in the caches by their result.",
+    labels=("cache", "name", "result"),
+)
+cache_hit_ratio = Gauge(
+    "fefu_music_cache_hit_ratio",
+    "Share of the lookups in the caches answered from the cache.",
+    labels=("cache", "name"),
+)
+db_query_duration = Histogram(
+    "fefu_music_db_query_duration_seconds",
+    "Latency of database queries.",
+    labels=("operation",),
+)
+db_pool_acquire_duration = Histogram(
+    "fefu_music_db_pool_acquire_duration_seconds",
+    "Time waited for a connection of the database pool.",
+)
+db_pool_connections = Gauge(
+    "fefu_music_db_pool_connections",
+    "Connections of the database pool by their state.",
+    labels=("state",),
+)
+db_pool_utilization = Gauge(
+    "fefu_music_db_pool_utilization",
+    "Share of the maximum size of the database pool in use.",
+)
+loop_lag = Gauge(
+    "fefu_music_event_loop_lag_seconds",
+    "Delay of callbacks scheduled in the event loop.",
+)
+
+METRICS = (
+    http_request_duration,
+    http_requests_in_flight,
+    upstream_request_duration,
+    upstream_requests_in_flight,
+    cache_requests,
+    cache_hit_ratio,
+    db_query_duration,
+    db_pool_acquire_duration,
+    db_pool_connections,
+    db_pool_utilization,
+    loop_lag,
+)
+
+
+def record_cache_lookup(cache: str, name: str, hit: bool) -> None:
+    """
+    Count the lookup in the cache.
+
+    :param cache: The name of the cache.
+    :param name: The name of the cached method or route.
+    :param hit: Whether the value is found in the cache.
+    """
+    cache_requests.labels(cache, name, "hit" if hit else "miss").inc()
+
+
+def record_db_pool_acquire(waited: float, size: int, idle: int, max_size: int) -> None:
+    """
+    Record the wait for a connection of the database pool and its usage.
+
+    :param waited: Seconds waited for the connection.
+    :param size: Number of open connections of the pool.
+    :param idle: Number of open connections not in use.
+    :param max_size: Maximum number of connections of the pool.
+    """
+    db_pool_acquire_duration.labels().observe(waited)
+    record_db_pool_usage(size, idle, max_size)
+
+
+def record_db_pool_usage(size: int, idle: int, max_size: int) -> None:
+    """
+    Record the connections of the database pool in use and idle.
+
+    :param size: Number of open connections of the pool.
+    :param idle: Number of open connections not in use.
+    :param max_size: Maximum number of connections of the pool.
+    """
+    db_pool_connections.labels("in_use").set(size - idle)
+    db_pool_connections.labels("idle").set(idle)
+    db_pool_utilization.labels().set((size - idle) / max_size)
+
+
+def render_metrics() -> str:
+    """
+    Render all the metrics of the worker in the text format of Prometheus.
+
+    The hit ratios of the caches are computed from their lookups.
+
+    :return: The exposition of the metrics.
+    """
+    _update_cache_hit_ratios()
+    return render(METRICS)
+
+
+def _update_cache_hit_ratios() -> None:
+    """Compute the hit ratios of the caches from the counted lookups."""
+    for cache, name, _ in list(dict(cache_requests.children())):
+        hits = cache_requests.labels(cache, name, "hit").metric_value
+        misses = cache_requests.labels(cache, name, "miss").metric_value
+        cache_hit_ratio.labels(cache, name).set(hits / (hits + misses))
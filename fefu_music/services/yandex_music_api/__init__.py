@@ -1,5 +1,18 @@
 """Yandex Music API service."""
+from fefu_music.services.yandex_music_api.circuit_breaker import CircuitOpenError
+from fefu_music.services.yandex_music_api.client import CachedYMClient
+from fefu_music.services.yandex_music_api.deadline import deadline_scope
 from fefu_music.services.yandex_music_api.dependencies import get_ymclient
 from fefu_music.services.yandex_music_api.lifetime import startup
+from fefu_music.services.yandex_music_api.pool import UpstreamServerError
+from fefu_music.services.yandex_music_api.staleness import track_staleness
 
-__all__ = ("startup", "get_ymclient")
+__all__ = (
+    "startup",
+    "get_ymclient",
+    "CachedYMClient",
+    "CircuitOpenError",
+    "UpstreamServerError",
+    "track_staleness",
+    "deadline_scope",
+)
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with a time to live for every entry.
+
+    When the cache is full, the least recently used entry is evicted. Expired
+    entries are dropped lazily, when they are looked up.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+
+        :param key: The key of the value.
+        :param default: Value to return if the key is missing or expired.
+        :return: The cached value or the default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, cached_value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]  # noqa: WPS420
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return cached_value
+
+    def set(self, key: Hashable, cached_value: Any, ttl: float) -> None:
+        """
+        Put a value to the cache.
+
+        :param key: The key of the value.
+        :param cached_value: The value to cache.
+        :param ttl: Time to live of the value in seconds.
+        """
+        self._entries[key] = (time.monotonic() + ttl, cached_value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all values and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Get the share of lookups answered from the cache.
+
+        :return: Hit ratio between 0 and 1.
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
@@ -0,0 +1,110 @@
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit breaker."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__("Circuit is open")
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of the calls to one upstream endpoint.
+
+    The breaker is closed while the upstream is healthy. It keeps the outcomes
+    of the last 'window_size' calls, a call is failed if it raises or takes
+    longer than 'slow_call_duration' seconds. When the window is full and
+    the share of failed calls reaches 'failure_ratio', the breaker opens.
+
+    The open breaker rejects calls for 'open_duration' seconds. Then it is
+    half-open: one probe call is let through, its success closes the breaker
+    and its failure opens it again. A probe that never reports back is
+    replaced by a new one after 'open_duration' seconds.
+    """
+
+    def __init__(
+        self,
+        window_size: int,
+        failure_ratio: float,
+        slow_call_duration: float,
+        open_duration: float,
+    ) -> None:
+        self.failure_ratio = failure_ratio
+        self.slow_call_duration = slow_call_duration
+        self.open_duration = open_duration
+        self._failures: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """
+        Get the state of the breaker.
+
+        :return: 'closed', 'open' or 'half_open'.
+        """
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.open_duration:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> None:
+        """
+        Check whether a call can be made, taking the probe in the half-open state.
+
+        :raises CircuitOpenError: If the breaker is open or the probe is running.
+        """
+        now = time.monotonic()
+        if self._opened_at is None:
+            return
+        retry_after = self._opened_at + self.open_duration - now
+        if retry_after > 0:
+            raise CircuitOpenError(retry_after)
+        probe_started_at = self._probe_started_at
+        if probe_started_at is not None:
+            if now - probe_started_at < self.open_duration:
+                raise CircuitOpenError(self.open_duration)
+        self._probe_started_at = now
+
+    def record(self, duration: float, failed: bool) -> None:
+        """
+        Record the outcome of a call.
+
+        :param duration: Seconds the call took.
+        :param failed: Whether the call raised an upstream error.
+        """
+        failed = failed or duration > self.slow_call_duration
+        if self._probe_started_at is not None:
+            self._finish_probe(failed)
+        elif self._opened_at is None:
+            self._failures.append(failed)
+            if self._should_open():
+                self._opened_at = time.monotonic()
+
+    def _finish_probe(self, failed: bool) -> None:
+        """
+        Close the breaker after a successful probe or open it again.
+
+        :param failed: Whether the probe failed.
+        """
+        self._probe_started_at = None
+        if failed:
+            self._opened_at = time.monotonic()
+            return
+        self._opened_at = None
+        self._failures.clear()
+
+    def _should_open(self) -> bool:
+        """
+        Check whether the window of calls is full and fails too often.
+
+        :return: True if the breaker should open.
+        """
+        if len(self._failures) < (self._failures.maxlen or 0):
+            return False
+        return sum(self._failures) >= self.failure_ratio * len(self._failures)
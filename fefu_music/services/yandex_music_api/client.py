@@ -0,0 +1,475 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from ymdantic import enums, models
+from ymdantic.exceptions import YandexMusicError
+
+from fefu_music.services.metrics import (
+    record_cache_lookup,
+    upstream_request_duration,
+    upstream_requests_in_flight,
+)
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.circuit_breaker import CircuitBreaker
+from fefu_music.services.yandex_music_api.deadline import remaining_time
+from fefu_music.services.yandex_music_api.hedging import Hedger
+from fefu_music.services.yandex_music_api.pool import YMClientPool
+from fefu_music.services.yandex_music_api.single_flight import SingleFlight
+from fefu_music.services.yandex_music_api.staleness import mark_stale
+from fefu_music.settings import settings
+
+MISSING = object()
+EditorialCompilation = Union[
+    List[models.LandingAlbumItemData],
+    List[models.LandingLikedPlaylistItemData],
+]
+TrackWithDownloadInfo = Tuple[models.TrackType, List[models.DownloadInfoDirect]]
+ResponseTTL = Callable[[Any], Optional[float]]
+CacheKey = Tuple[Any, ...]
+# Timestamps of signed URLs are hexadecimal numbers of microseconds.
+SIGNED_URL_TS_BASE = 16
+SIGNED_URL_TS_SCALE = 10**6
+
+
+def download_info_ttl(
+    download_info: List[models.DownloadInfoDirect],
+) -> Optional[float]:
+    """
+    Get the time to live of the download information from its signed URLs.
+
+    The download information is cached until the first of its direct URLs
+    expires.
+
+    :param download_info: The download information of a track.
+    :return: Seconds until the first URL expires or None if there is none.
+    """
+    if not download_info:
+        return None
+    signed_at = min(
+        int(track_download_info.direct_url_info.ts, SIGNED_URL_TS_BASE)
+        / SIGNED_URL_TS_SCALE
+        for track_download_info in download_info
+    )
+    expires_at = signed_at + settings.yandex_music_direct_url_lifetime
+    return expires_at - time.time()
+
+
+class CachedYMClient:
+    """
+    Caching layer around the pool of Yandex Music clients.
+
+    Responses of the catalog methods are kept in a bounded LRU cache keyed by
+    the method name and its arguments. Every method has its own time to live,
+    methods without a configured time to live are not cached.
+
+    Responses of some methods expire on their own, their time to live is
+    computed from the response. Download information is cached until its
+    signed direct URLs expire.
+
+    Identical concurrent calls that miss the cache are coalesced into one
+    upstream request.
+
+    Every upstream request is limited by 'yandex_music_request_timeout', and
+    every call waits for it until the deadline of the current request at most.
+    A call past its deadline is cancelled, the shared upstream request is left
+    running for the other callers.
+
+    Slow requests of the methods listed in 'yandex_music_hedged_methods' are
+    hedged with identical requests.
+
+    Upstream requests of every method go through its own circuit breaker.
+    The last good responses of the cached methods are kept in the stale cache,
+    they are used when the upstream fails or the breaker is open. Errors
+    reported by Yandex Music, like a missing track, are not upstream failures.
+    """
+
+    response_ttls: Mapping[str, ResponseTTL] = {
+        "get_track_download_info_direct": download_info_ttl,
+    }
+
+    def __init__(
+        self,
+        client: YMClientPool,
+        cache: TTLCache,
+        ttls: Mapping[str, float],
+        stale_cache: Optional[TTLCache] = None,
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.ttls = ttls
+        self.stale_cache = stale_cache
+        self.single_flight = SingleFlight()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.hedger = Hedger(
+            window_size=settings.yandex_music_hedge_window,
+            percentile=settings.yandex_music_hedge_percentile,
+            budget_ratio=settings.yandex_music_hedge_budget_ratio,
+            max_hedges=settings.yandex_music_hedge_max_budget,
+        )
+
+    async def get_track(self, track_id: Union[int, str]) -> models.TrackType:
+        """
+        Get a track by its ID.
+
+        :param track_id: The ID of the track.
+        :return: The track.
+        """
+        return await self._call("get_track", track_id=track_id)
+
+    async def get_tracks(self, track_ids: List[int]) -> List[models.TrackType]:
+        """
+        Get tracks by their IDs.
+
+        Cached tracks are taken from the cache, all missing tracks are requested
+        in one upstream request and cached one by one, so they are shared with
+        'get_track'.
+
+        :param track_ids: The IDs of the tracks.
+        :return: The found tracks in the order of the IDs.
+        """
+        unique_ids = list(dict.fromkeys(track_ids))
+        tracks = self._cached_tracks(unique_ids)
+        missing_ids = [
+            missing_id for missing_id in unique_ids if missing_id not in tracks
+        ]
+        if missing_ids:
+            fetched_tracks = await self._call_tracks(missing_ids)
+            tracks = {**tracks, **fetched_tracks}
+        return [tracks[found_id] for found_id in track_ids if found_id in tracks]
+
+    async def get_album_with_tracks(self, album_id: Union[int, str]) -> models.Album:
+        """
+        Get an album with its tracks by its ID.
+
+        :param album_id: The ID of the album.
+        :return: The album with tracks.
+        """
+        return await self._call("get_album_with_tracks", album_id=album_id)
+
+    async def get_playlist(
+        self,
+        playlist_id: Union[int, str],
+        user_id: Optional[Union[int, str]] = None,
+    ) -> models.Playlist:
+        """
+        Get a playlist by its kind and the ID of its owner.
+
+        :param playlist_id: The kind of the playlist.
+        :param user_id: The ID of the owner.
+        :return: The playlist.
+        """
+        return await self._call(
+            "get_playlist",
+            playlist_id=playlist_id,
+            user_id=user_id,
+        )
+
+    async def get_chart(self, limit: Optional[int] = None) -> models.ChartBlock:
+        """
+        Get the chart block.
+
+        :param limit: The maximum number of tracks in the chart.
+        :return: The chart block.
+        """
+        return await self._call("get_chart", limit=limit)
+
+    async def get_editorial_new_releases(
+        self,
+        block_type: enums.EditorialNewReleasesEnum,
+    ) -> List[models.NewRelease]:
+        """
+        Get the editorial block of new releases.
+
+        :param block_type: The type of the block.
+        :return: The new releases.
+        """
+        return await self._call("get_editorial_new_releases", block_type=block_type)
+
+    async def get_editorial_compilation(
+        self,
+        block_type: enums.EditorialCompilationEnum,
+    ) -> EditorialCompilation:
+        """
+        Get the editorial compilation block.
+
+        :param block_type: The type of the block.
+        :return: The items of the compilation.
+        """
+        return await self._call("get_editorial_compilation", block_type=block_type)
+
+    async def get_track_download_info_direct(
+        self,
+        track_id: Union[int, str],
+        codec: Optional[str] = None,
+    ) -> List[models.DownloadInfoDirect]:
+        """
+        Get the download information of a track with direct links.
+
+        All codecs of the track are resolved and cached at once, the codec only
+        filters the cached download information.
+
+        :param track_id: The ID of the track.
+        :param codec: The codec of the audio, all codecs by default.
+        :return: The download information.
+        """
+        download_info = await self._call(
+            "get_track_download_info_direct",
+            track_id=track_id,
+        )
+        if codec is None:
+            return download_info
+        return [
+            track_download_info
+            for track_download_info in download_info
+            if track_download_info.codec == codec
+        ]
+
+    async def get_track_with_download_info(
+        self,
+        track_id: Union[int, str],
+    ) -> TrackWithDownloadInfo:
+        """
+        Get a track and its download information concurrently.
+
+        The download information is requested while the track is being fetched
+        and is dropped if the track is unavailable.
+
+        :param track_id: The ID of the track.
+        :raises Exception: If the track fails, the download is cancelled.
+        :raises asyncio.CancelledError: If the request is cancelled,
+            the download is cancelled too.
+        :return: The track and its download information, which is empty
+            for unavailable tracks.
+        """
+        download_task = asyncio.create_task(
+            self.get_track_download_info_direct(track_id),
+        )
+        try:
+            track = await self.get_track(track_id)
+        except (Exception, asyncio.CancelledError):
+            # Cancellation of the request is not an Exception.
+            download_task.cancel()
+            raise
+        if not track.available:
+            download_task.cancel()
+            return track, []
+        return track, await download_task
+
+    def _cached_tracks(self, track_ids: List[int]) -> Mapping[int, models.TrackType]:
+        """
+        Get the tracks found in the cache.
+
+        :param track_ids: The IDs of the tracks.
+        :return: The cached tracks by their IDs.
+        """
+        tracks = {}
+        for track_id in track_ids:
+            track = self.cache.get(self._track_key(track_id), MISSING)
+            record_cache_lookup("yandex_music", "get_track", track is not MISSING)
+            if track is not MISSING:
+                tracks[track_id] = track
+        return tracks
+
+    async def _call_tracks(
+        self,
+        track_ids: List[int],
+    ) -> Mapping[int, models.TrackType]:
+        """
+        Request the missing tracks at once until the deadline.
+
+        :param track_ids: The IDs of the tracks.
+        :return: The found tracks by their IDs.
+        """
+        batch_key = ("get_tracks", tuple(track_ids))
+        return await asyncio.wait_for(
+            self.single_flight.do(batch_key, partial(self._fetch_tracks, track_ids)),
+            timeout=remaining_time(),
+        )
+
+    async def _fetch_tracks(
+        self,
+        track_ids: List[int],
+    ) -> Mapping[int, models.TrackType]:
+        """
+        Request the tracks in one upstream request and cache every track.
+
+        :param track_ids: The IDs of the tracks.
+        :return: The found tracks by their IDs.
+        """
+        fetched_tracks = await self._request("get_tracks", {"track_ids": track_ids})
+        tracks = {int(track.id): track for track in fetched_tracks}
+        ttl = self.ttls.get("get_track")
+        if ttl is not None:
+            for track_id, track in tracks.items():
+                self.cache.set(self._track_key(track_id), track, ttl=ttl)
+        return tracks
+
+    def _track_key(self, track_id: int) -> CacheKey:
+        """
+        Get the cache key of a track, the same as of the 'get_track' call.
+
+        :param track_id: The ID of the track.
+        :return: The cache key.
+        """
+        return ("get_track", (("track_id", track_id),))
+
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        """
+        Call the client method, answering from the cache when possible.
+
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :raises Exception: If the call fails and there is no stale response.
+        :return: The result of the method.
+        """
+        key = (method, tuple(sorted(kwargs.items())))
+        if method in self.ttls or method in self.response_ttls:
+            cached_value = self.cache.get(key, MISSING)
+            record_cache_lookup("yandex_music", method, cached_value is not MISSING)
+            if cached_value is not MISSING:
+                return cached_value
+
+        try:
+            return await asyncio.wait_for(
+                self.single_flight.do(key, partial(self._fetch, key, method, kwargs)),
+                timeout=remaining_time(),
+            )
+        except Exception as error:
+            stale_response = self._stale(key, error)
+            if stale_response is MISSING:
+                raise
+            return stale_response
+
+    async def _fetch(
+        self,
+        key: CacheKey,
+        method: str,
+        kwargs: Mapping[str, Any],
+    ) -> Any:
+        """
+        Request the upstream and cache the response.
+
+        :param key: The cache key of the call.
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :return: The result of the method.
+        """
+        response = await self._request(method, kwargs)
+        ttl = self.ttls.get(method)
+        response_ttl = self.response_ttls.get(method)
+        if response_ttl is not None:
+            # Expired responses are useless as stale ones too.
+            ttl = response_ttl(response)
+        elif ttl is not None and self.stale_cache is not None:
+            stale_entry = (time.monotonic(), response)
+            self.stale_cache.set(key, stale_entry, ttl=settings.yandex_music_stale_ttl)
+        if ttl is not None and ttl > 0:
+            self.cache.set(key, response, ttl=ttl)
+        return response
+
+    async def _request(self, method: str, kwargs: Mapping[str, Any]) -> Any:
+        """
+        Request the upstream through the circuit breaker of the method.
+
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :raises YandexMusicError: If Yandex Music reports an error.
+        :raises Exception: If the request fails, the failure is recorded.
+        :raises asyncio.CancelledError: If the request is cancelled.
+        :return: The result of the method.
+        """
+        breaker = self._breaker(method)
+        breaker.allow()
+        upstream_requests_in_flight.labels(method).inc()
+        started_at = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self._hedged(method, kwargs),
+                timeout=settings.yandex_music_request_timeout,
+            )
+        except YandexMusicError:
+            self._record(breaker, method, started_at, "upstream_error")
+            raise
+        except Exception:
+            self._record(breaker, method, started_at, "failure")
+            raise
+        except asyncio.CancelledError:
+            self._record(breaker, method, started_at, "cancelled")
+            raise
+        self._record(breaker, method, started_at, "success")
+        return response
+
+    def _record(
+        self,
+        breaker: CircuitBreaker,
+        method: str,
+        started_at: float,
+        outcome: str,
+    ) -> None:
+        """
+        Record the outcome of the upstream request in the breaker and metrics.
+
+        Errors of the request reported by Yandex Music, like not-found, are
+        not failures of the upstream, unlike its server errors. Cancelled
+        requests are not recorded in the breaker.
+
+        :param breaker: The circuit breaker of the method.
+        :param method: The name of the YMClient method.
+        :param started_at: The time the request started.
+        :param outcome: 'success', 'upstream_error', 'failure' or 'cancelled'.
+        """
+        duration = time.monotonic() - started_at
+        upstream_requests_in_flight.labels(method).dec()
+        upstream_request_duration.labels(method, outcome).observe(duration)
+        if outcome != "cancelled":
+            breaker.record(duration, failed=outcome == "failure")
+
+    async def _hedged(self, method: str, kwargs: Mapping[str, Any]) -> Any:
+        """
+        Request the upstream, hedging the request if the method allows it.
+
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :return: The result of the method.
+        """
+        upstream_call = partial(getattr(self.client, method), **kwargs)
+        if method not in settings.yandex_music_hedged_methods:
+            return await upstream_call()
+        return await self.hedger.run(method, upstream_call)
+
+    def _breaker(self, method: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of the method, creating it on the first call.
+
+        :param method: The name of the YMClient method.
+        :return: The circuit breaker.
+        """
+        breaker = self._breakers.get(method)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                window_size=settings.yandex_music_breaker_window,
+                failure_ratio=settings.yandex_music_breaker_failure_ratio,
+                slow_call_duration=settings.yandex_music_breaker_slow_call,
+                open_duration=settings.yandex_music_breaker_open_duration,
+            )
+            self._breakers[method] = breaker
+        return breaker
+
+    def _stale(self, key: CacheKey, error: Exception) -> Any:
+        """
+        Get the last good response while handling an upstream failure.
+
+        :param key: The cache key of the call.
+        :param error: The error of the call.
+        :return: The stale response or MISSING if it can not be used.
+        """
+        if isinstance(error, YandexMusicError) or self.stale_cache is None:
+            return MISSING
+        stale_entry = self.stale_cache.get(key)
+        if stale_entry is None:
+            return MISSING
+        fetched_at, response = stale_entry
+        mark_stale(time.monotonic() - fetched_at)
+        return response
@@ -0,0 +1,40 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Monotonic time by which the current request must be answered.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(budget: float) -> Iterator[None]:
+    """
+    Set the deadline of the calls made in the block.
+
+    A nested scope can only shorten the deadline.
+
+    :param budget: Seconds the block may take.
+    :yields: Nothing.
+    """
+    deadline = time.monotonic() + budget
+    outer_deadline = _deadline.get()
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Get the time left until the deadline.
+
+    :return: Seconds left, negative if the deadline passed, None if there is none.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -1,16 +1,19 @@
 from fastapi import Request
-from ymdantic import YMClient
+from taskiq import TaskiqDepends
 
+from fefu_music.services.yandex_music_api.client import CachedYMClient
 
-async def get_ymclient(request: Request) -> YMClient:
+
+async def get_ymclient(request: Request = TaskiqDepends()) -> CachedYMClient:
     """
     Asynchronous function to get the Yandex Music client from the application state.
 
     This function retrieves the Yandex Music client stored in the application state
     during startup. The client is retrieved from the state of the FastAPI application
-    that is handling the current request.
+    that is handling the current request. It can be used as a dependency
+    of taskiq tasks as well.
 
     :param request: The request object associated with the current HTTP request.
-    :return: The Yandex Music client stored in the application state.
+    :return: The cached Yandex Music client stored in the application state.
     """
     return request.app.state.ym_client
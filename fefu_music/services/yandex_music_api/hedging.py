@@ -0,0 +1,136 @@
+import asyncio
+import time
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, DefaultDict, Deque, List, Optional
+
+UpstreamCall = Callable[[], Awaitable[Any]]
+
+
+class Hedger:
+    """
+    Hedging of slow idempotent upstream calls.
+
+    The latencies of the last 'window_size' calls are kept per method. When
+    a call has not answered within the 'percentile' of them, an identical
+    hedge call is started and the first successful response wins, the other
+    call is cancelled. Nothing is hedged until the window of the method is
+    full.
+
+    Hedges are limited by a budget shared by all methods: every call earns
+    'budget_ratio' of a hedge, at most 'max_hedges' are saved up. So hedging
+    can not multiply the load when the upstream is slow as a whole.
+    """
+
+    def __init__(
+        self,
+        window_size: int,
+        percentile: float,
+        budget_ratio: float,
+        max_hedges: float,
+    ) -> None:
+        self.window_size = window_size
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.max_hedges = max_hedges
+        self.hedges = 0
+        self._budget: float = 0
+        self._latencies: DefaultDict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window_size),
+        )
+
+    def threshold(self, method: str) -> Optional[float]:
+        """
+        Get the time after which a call of the method is hedged.
+
+        :param method: The name of the method.
+        :return: Seconds to wait for the call or None if it is not hedged yet.
+        """
+        latencies = self._latencies[method]
+        if len(latencies) < self.window_size:
+            return None
+        index = int(len(latencies) * self.percentile)
+        return sorted(latencies)[min(index, len(latencies) - 1)]
+
+    async def run(self, method: str, call: UpstreamCall) -> Any:
+        """
+        Run the call, hedging it if it is slow.
+
+        :param method: The name of the method.
+        :param call: Function starting the call.
+        :raises Exception: If all the calls fail.
+        :raises asyncio.CancelledError: If the caller is cancelled, the calls
+            are cancelled too.
+        :return: The first successful response.
+        """
+        self._budget = min(self._budget + self.budget_ratio, self.max_hedges)
+        tasks: List["asyncio.Future[Any]"] = [
+            asyncio.ensure_future(self._timed(method, call)),
+        ]
+        try:
+            response = await self._hedge(method, call, tasks)
+        except (Exception, asyncio.CancelledError):
+            _cancel(tasks)
+            raise
+        _cancel(tasks)
+        return response
+
+    async def _hedge(
+        self,
+        method: str,
+        call: UpstreamCall,
+        tasks: List["asyncio.Future[Any]"],
+    ) -> Any:
+        """
+        Start the hedge call if the first one is slow and wait for the winner.
+
+        :param method: The name of the method.
+        :param call: Function starting the call.
+        :param tasks: The running calls, the hedge call is added to them.
+        :return: The first successful response.
+        """
+        done, _ = await asyncio.wait(tasks, timeout=self.threshold(method))
+        if not done and self._budget >= 1:
+            self._budget -= 1
+            self.hedges += 1
+            tasks.append(asyncio.ensure_future(self._timed(method, call)))
+        return await _first_success(tasks)
+
+    async def _timed(self, method: str, call: UpstreamCall) -> Any:
+        """
+        Run the call and record its latency.
+
+        :param method: The name of the method.
+        :param call: Function starting the call.
+        :return: The response.
+        """
+        started_at = time.monotonic()
+        response = await call()
+        self._latencies[method].append(time.monotonic() - started_at)
+        return response
+
+
+async def _first_success(tasks: List["asyncio.Future[Any]"]) -> Any:
+    """
+    Wait for the first successful one of at most two tasks.
+
+    :param tasks: The tasks of the identical calls.
+    :return: The first successful response, the error of the last failed task
+        is raised if all of them fail.
+    """
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    for finished in done:
+        if finished.exception() is None:
+            return finished.result()
+    if pending:
+        return await pending.pop()
+    return done.pop().result()
+
+
+def _cancel(tasks: List["asyncio.Future[Any]"]) -> None:
+    """
+    Cancel the calls which are still running.
+
+    :param tasks: The tasks of the identical calls.
+    """
+    for task in tasks:
+        task.cancel()
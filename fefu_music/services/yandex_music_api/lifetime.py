@@ -1,6 +1,8 @@
 from fastapi import FastAPI
-from ymdantic import YMClient
 
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.client import CachedYMClient
+from fefu_music.services.yandex_music_api.pool import YMClientPool
 from fefu_music.settings import settings
 
 
@@ -8,11 +10,20 @@ def startup(app: FastAPI) -> None:
     """
     Function to initialize the Yandex Music client when the FastAPI application starts.
 
-    This function is called when the FastAPI application starts up. It creates a new
-    instance of the Yandex Music client using the Yandex Music token from the
-    application settings, and assigns it to the application state.
+    This function is called when the FastAPI application starts up. It creates a pool
+    of Yandex Music clients, one for every Yandex Music token from the application
+    settings, wraps it with the caching layer and assigns it to the application
+    state. The stale cache keeps the last good responses for upstream failures.
 
     :param app: The FastAPI application.
     """
+    tokens = settings.yandex_music_tokens
     if settings.yandex_music_token:
-        app.state.ym_client = YMClient(token=settings.yandex_music_token)
+        tokens = [settings.yandex_music_token, *tokens]
+    if tokens:
+        app.state.ym_client = CachedYMClient(
+            client=YMClientPool(list(dict.fromkeys(tokens))),
+            cache=TTLCache(max_size=settings.yandex_music_cache_size),
+            ttls=settings.yandex_music_cache_ttl,
+            stale_cache=TTLCache(max_size=settings.yandex_music_cache_size),
+        )
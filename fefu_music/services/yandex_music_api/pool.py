@@ -0,0 +1,198 @@
+import asyncio
+import time
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from dataclass_rest.http_request import HttpRequest
+from ymdantic import YMClient
+
+from fefu_music.settings import settings
+
+# Number of the last characters of a token shown in the usage.
+TOKEN_SUFFIX_SIZE = 4
+
+
+class RateLimitError(Exception):
+    """Raised when Yandex Music limits the rate of requests of a token."""
+
+    def __init__(self, retry_after: Optional[float]) -> None:
+        self.retry_after = retry_after
+        super().__init__("Too many requests")
+
+
+class UpstreamServerError(Exception):
+    """Raised when Yandex Music answers with a server error."""
+
+    def __init__(self, status: int) -> None:
+        self.status = status
+        super().__init__(f"Yandex Music answered {status}")
+
+
+class RateLimitedYMClient(YMClient):
+    """
+    Yandex Music client raising RateLimitError on 429 responses.
+
+    Server errors raise UpstreamServerError, otherwise ymdantic would report
+    them as YandexMusicError, like the errors of the request itself.
+    """
+
+    async def do_request(self, request: HttpRequest) -> Any:
+        """
+        Send the request, checking whether it is rate limited or failed.
+
+        :param request: The request.
+        :raises RateLimitError: If the token is rate limited.
+        :raises UpstreamServerError: If Yandex Music answers with a server error.
+        :return: The response.
+        """
+        response = await super().do_request(request)
+        if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = response.headers.get("Retry-After", "")
+            raise RateLimitError(float(retry_after) if retry_after.isdigit() else None)
+        if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            raise UpstreamServerError(response.status)
+        return response
+
+
+class PooledClient:
+    """Client of one token with its load and usage."""
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+        self.client = RateLimitedYMClient(
+            token=token,
+            base_url=settings.yandex_music_base_url,
+        )
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limits = 0
+        self.backoff_until: float = 0
+        self._backoff: float = 0
+
+    async def call(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Call the method with the client, counting the request.
+
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :raises Exception: If the call fails.
+        :raises asyncio.CancelledError: If the call is cancelled.
+        :return: The result of the method.
+        """
+        self.in_flight += 1
+        self.requests += 1
+        try:
+            response = await getattr(self.client, method)(**kwargs)
+        except (Exception, asyncio.CancelledError):
+            self.in_flight -= 1
+            raise
+        self.in_flight -= 1
+        self._backoff = 0
+        return response
+
+    def back_off(self, retry_after: Optional[float]) -> None:
+        """
+        Stop using the client for a while after a rate limited request.
+
+        Without 'Retry-After' the pause is doubled on every rate limited
+        request in a row.
+
+        :param retry_after: Seconds to wait, sent by Yandex Music.
+        """
+        self.rate_limits += 1
+        self._backoff = min(
+            self._backoff * 2 or settings.yandex_music_backoff_min,
+            settings.yandex_music_backoff_max,
+        )
+        self.backoff_until = time.monotonic() + (retry_after or self._backoff)
+
+    def usage(self) -> Dict[str, Any]:
+        """
+        Get the usage of the token.
+
+        :return: The usage with the token masked.
+        """
+        return {
+            "token": f"...{self.token[-TOKEN_SUFFIX_SIZE:]}",
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "rate_limits": self.rate_limits,
+            "backing_off": self.backoff_until > time.monotonic(),
+        }
+
+
+class YMClientPool:
+    """
+    Pool of Yandex Music clients, one per token.
+
+    It has the methods of YMClient, every call is made by the least loaded
+    client, the one with the fewest requests in flight. A client whose token
+    is rate limited is not used until its backoff ends, the call is retried
+    with another client.
+    """
+
+    def __init__(self, tokens: Sequence[str]) -> None:
+        self.clients = [PooledClient(token) for token in tokens]
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        return partial(self.call, method)
+
+    async def call(self, method: str, **kwargs: Any) -> Any:
+        """
+        Call the method of YMClient with the least loaded healthy client.
+
+        :param method: The name of the YMClient method.
+        :param kwargs: The arguments of the method.
+        :raises RateLimitError: If all the tokens are rate limited.
+        :return: The result of the method.
+        """
+        for _ in self.clients:
+            pooled_client = self._select()
+            if pooled_client is None:
+                break
+            try:
+                return await pooled_client.call(method, kwargs)
+            except RateLimitError as error:
+                pooled_client.back_off(error.retry_after)
+        raise RateLimitError(self._retry_after())
+
+    def usage(self) -> List[Dict[str, Any]]:
+        """
+        Get the usage of every token.
+
+        :return: The usages of the tokens.
+        """
+        return [pooled_client.usage() for pooled_client in self.clients]
+
+    def _select(self) -> Optional[PooledClient]:
+        """
+        Select the least loaded client which is not backing off.
+
+        :return: The client or None if all of them are backing off.
+        """
+        now = time.monotonic()
+        healthy_clients = [
+            pooled_client
+            for pooled_client in self.clients
+            if pooled_client.backoff_until <= now
+        ]
+        if not healthy_clients:
+            return None
+        return min(
+            healthy_clients,
+            key=lambda pooled_client: (pooled_client.in_flight, pooled_client.requests),
+        )
+
+    def _retry_after(self) -> float:
+        """
+        Get the time until the first client stops backing off.
+
+        :return: Seconds to wait.
+        """
+        backoff_until = min(
+            pooled_client.backoff_until for pooled_client in self.clients
+        )
+        return max(backoff_until - time.monotonic(), 0)
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalescing of identical concurrent calls.
+
+    The first caller for a key starts the call, every caller that comes while
+    it is in flight awaits the same future. The result or the exception of
+    the call is delivered to all of them.
+    """
+
+    def __init__(self) -> None:
+        self._calls: "Dict[Hashable, asyncio.Future[Any]]" = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the call once for all concurrent callers with the same key.
+
+        The call runs in its own task, so cancelling one of the callers does not
+        cancel the call for the others.
+
+        :param key: The key identifying the call.
+        :param func: Function starting the call.
+        :return: The result of the call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: "asyncio.Future[Any]") -> None:
+        """
+        Remove the finished call, so the next caller starts a new one.
+
+        :param key: The key identifying the call.
+        :param call: The finished call.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]  # noqa: WPS420
+        if not call.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled.
+            call.exception()
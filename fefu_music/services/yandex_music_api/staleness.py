@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class Staleness:
+    """Age of the oldest stale response used while handling a request."""
+
+    def __init__(self) -> None:
+        self.age: Optional[float] = None
+
+    def mark(self, age: float) -> None:
+        """
+        Mark that a stale response was used.
+
+        :param age: Seconds since the response was fetched.
+        """
+        if self.age is None or age > self.age:
+            self.age = age
+
+
+# The holder is shared with tasks started while handling the request.
+_staleness: ContextVar[Optional[Staleness]] = ContextVar("staleness", default=None)
+
+
+@contextmanager
+def track_staleness() -> Iterator[Staleness]:
+    """
+    Track stale responses used in the block.
+
+    :yields: The staleness of the responses used in the block.
+    """
+    staleness = Staleness()
+    token = _staleness.set(staleness)
+    try:
+        yield staleness
+    finally:
+        _staleness.reset(token)
+
+
+def mark_stale(age: float) -> None:
+    """
+    Mark that a stale response was used, if the staleness is tracked.
+
+    :param age: Seconds since the response was fetched.
+    """
+    staleness = _staleness.get()
+    if staleness is not None:
+        staleness.mark(age)
@@ -1,3 +1,15 @@
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from ymdantic.models import DownloadInfoDirect, TrackType
+from ymdantic.models.landing.cover import LandingPlaylistCover
+from ymdantic.models.playlists import PlaylistCover, PlaylistTrack
+from ymdantic.models.playlists.cover import PlaylistCoverMosaic
+
+PositionedTrack = Tuple[Tuple[int, ...], TrackType]
+AnyPlaylistCover = Union[PlaylistCover, LandingPlaylistCover]
+
+
 def format_duration(duration_ms: int) -> str:
     """
     Formats a duration in milliseconds to a string in the format hh:mm:ss, mm:ss or ss.
@@ -18,3 +30,106 @@ def format_duration(duration_ms: int) -> str:
     duration_parts.append(f"{seconds}".zfill(2))
 
     return ":".join(duration_parts)
+
+
+def cover_image_url(cover_uri: Optional[str], size: str) -> Optional[str]:
+    """
+    Builds the URL of a cover image with the given size.
+
+    URIs of the covers come from Yandex Music, so the URL is not validated.
+
+    :param cover_uri: The URI of the cover with the size placeholder.
+    :param size: The size of the image, for example 100x100.
+    :return: The URL of the image or None if there is no cover.
+    """
+    if cover_uri is None:
+        return None
+    return f"https://{cover_uri.replace('%%', size)}"
+
+
+def playlist_cover_uri(cover: AnyPlaylistCover) -> str:
+    """
+    Gets the URI of a playlist cover.
+
+    The mosaic cover is represented by its first image.
+
+    :param cover: The cover of the playlist.
+    :return: The URI of the cover.
+    """
+    if isinstance(cover, PlaylistCoverMosaic):
+        return cover.items_uri[0]
+    return cover.uri
+
+
+def best_download_info(
+    download_info: Sequence[DownloadInfoDirect],
+) -> Optional[DownloadInfoDirect]:
+    """
+    Selects the download information of the best quality.
+
+    :param download_info: The download information of a track.
+    :return: The download information with the highest bitrate, if any.
+    """
+    if not download_info:
+        return None
+    return max(
+        download_info,
+        key=lambda track_download_info: track_download_info.bitrate_in_kbps,
+    )
+
+
+def iter_album_tracks(
+    volumes: List[List[TrackType]],
+    start_volume: int = 0,
+    start_index: int = 0,
+) -> Iterator[PositionedTrack]:
+    """
+    Iterates over the tracks of album volumes from the given position.
+
+    :param volumes: The volumes of the album.
+    :param start_volume: The index of the volume to start from.
+    :param start_index: The index of the track in the start volume.
+    :yields: The position of the track (volume index and track index) and the track.
+    """
+    album_volumes = islice(volumes, start_volume, None)
+    for volume_index, volume in enumerate(album_volumes, start_volume):
+        first_index = start_index if volume_index == start_volume else 0
+        yield from _iter_volume_tracks(volume_index, volume, first_index)
+
+
+def iter_playlist_tracks(
+    playlist_tracks: List[PlaylistTrack],
+    start_index: int = 0,
+) -> Iterator[PositionedTrack]:
+    """
+    Iterates over the tracks of a playlist from the given position.
+
+    :param playlist_tracks: The tracks of the playlist.
+    :param start_index: The index of the track to start from.
+    :return: Iterator over the positions of the tracks (their indexes) and the tracks.
+    """
+    tracks = islice(playlist_tracks, start_index, None)
+    return (
+        ((track_index,), playlist_track.track)
+        for track_index, playlist_track in enumerate(tracks, start_index)
+    )
+
+
+def _iter_volume_tracks(
+    volume_index: int,
+    volume: List[TrackType],
+    first_index: int,
+) -> Iterator[PositionedTrack]:
+    """
+    Iterates over the tracks of one album volume.
+
+    :param volume_index: The index of the volume.
+    :param volume: The tracks of the volume.
+    :param first_index: The index of the track to start from.
+    :return: Iterator over the positions of the tracks and the tracks.
+    """
+    tracks = islice(volume, first_index, None)
+    return (
+        ((volume_index, track_index), track)
+        for track_index, track in enumerate(tracks, first_index)
+    )
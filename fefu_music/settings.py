@@ -2,7 +2,7 @@ import enum
 from datetime import timedelta
 from pathlib import Path
 from tempfile import gettempdir
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
@@ -48,19 +48,182 @@ class Settings(BaseSettings):
     db_pass: str = "fefu_music"
     db_base: str = "fefu_music"
     db_echo: bool = False
+    # Connections of the database pool of every worker, the total for all
+    # workers is multiplied by workers_count and has to fit max_connections
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 5
+    # Queries after which a pooled connection is closed and replaced
+    db_pool_max_queries: int = 50000
+    # Seconds after which an idle pooled connection is closed
+    db_pool_max_inactive_lifetime: float = 300
+    # Number of prepared statements cached by every connection
+    db_statement_cache_size: int = 100
+    # Seconds a query may run, unlimited if not set
+    db_command_timeout: Optional[float] = None
 
     # Yandex Music API settings
     yandex_music_token: Optional[str] = None
+    # More tokens of Yandex Music, requests are spread over all tokens
+    yandex_music_tokens: List[str] = []
+    # URL of Yandex Music API, the fake upstream of benchmarks can be used instead
+    yandex_music_base_url: str = "https://api.music.yandex.net/"
+    # Seconds a rate limited token is not used for, doubled while it is limited
+    yandex_music_backoff_min: float = 1
+    yandex_music_backoff_max: float = 60
+    # Maximum number of upstream responses kept in memory
+    yandex_music_cache_size: int = 1024
+    # Seconds to keep upstream responses for, per YMClient method
+    yandex_music_cache_ttl: Dict[str, int] = {
+        "get_track": 3600,
+        "get_album_with_tracks": 3600,
+        "get_playlist": 300,
+        "get_chart": 300,
+        "get_editorial_new_releases": 900,
+        "get_editorial_compilation": 900,
+    }
+    # Seconds a signed direct URL of an audio file stays valid
+    yandex_music_direct_url_lifetime: int = 60
+    # Seconds one request to the Yandex Music API may take
+    yandex_music_request_timeout: float = 10
+    # Idempotent Yandex Music API methods to hedge when they are slow,
+    # for example ["get_track", "get_album_with_tracks"]
+    yandex_music_hedged_methods: List[str] = []
+    # Number of the last calls of a method its hedging threshold is computed from
+    yandex_music_hedge_window: int = 100
+    # Percentile of the latencies after which a call is hedged
+    yandex_music_hedge_percentile: float = 0.95
+    # Share of the calls which may be hedged, for all methods together
+    yandex_music_hedge_budget_ratio: float = 0.05
+    # Maximum number of hedges saved up in the budget
+    yandex_music_hedge_max_budget: float = 10
+    # Circuit breakers of the Yandex Music API methods.
+    # Number of the last calls the failure ratio is computed from
+    yandex_music_breaker_window: int = 20
+    # Share of failed calls which opens the breaker
+    yandex_music_breaker_failure_ratio: float = 0.5
+    # Seconds after which a call is counted as failed
+    yandex_music_breaker_slow_call: float = 5
+    # Seconds the breaker stays open before a probe call
+    yandex_music_breaker_open_duration: float = 30
+    # Seconds clients are asked to wait after a server error of Yandex Music
+    yandex_music_error_retry_after: int = 5
+    # Seconds to keep the last good responses for upstream failures
+    yandex_music_stale_ttl: int = 86400
+    # Maximum number of tracks requested at once
+    tracks_batch_max_size: int = 200
+
+    # Seconds a catalog route may take to answer, per route name
+    route_latency_budget: Dict[str, float] = {
+        "get_track": 3,
+        "get_tracks": 5,
+        "post_tracks": 5,
+        "get_download_info": 5,
+        "stream_track": 5,
+        "get_album": 5,
+        "get_playlist": 5,
+    }
+    # Latency budget of the catalog routes missing above
+    route_latency_budget_default: float = 10
+
+    # Maximum number of encoded responses kept in memory
+    response_cache_size: int = 1024
+    # Seconds to cache encoded responses for, per route name.
+    # Used for 'Cache-Control' max age as well.
+    response_cache_max_age: Dict[str, int] = {
+        "get_track": 10,
+        "get_album": 600,
+        "get_playlist": 120,
+        "get_chart": 60,
+        "get_new_releases": 300,
+        "get_new_year_playlists": 300,
+    }
+
+    # Audio streaming proxy settings
+    # Maximum number of pooled connections to the audio storage
+    audio_stream_connections: int = 100
+    # Size of audio chunks forwarded to the client, in bytes
+    audio_stream_chunk_size: int = 65536
+    # Seconds to wait for connecting to the audio storage and for its data
+    audio_stream_connect_timeout: float = 5
+    audio_stream_read_timeout: float = 30
+    # Directory of the audio files cache, the cache is disabled if not set.
+    # It is shared by all the workers.
+    audio_cache_dir: Optional[Path] = None
+    # Maximum total size of the cached audio files of all the workers, in bytes
+    audio_cache_max_size: int = 10 * 1024**3
+    # Seconds after which an unchanged partially downloaded file is abandoned
+    audio_cache_partial_ttl: int = 600
+
+    # Landing blocks settings
+    # Seconds after which a landing block is refreshed in the background
+    landing_soft_ttl: int = 300
+    # Seconds a worker keeps its local copy of a landing block
+    landing_local_ttl: int = 10
+    # Cron schedule of the landing blocks pre-fetching task
+    landing_refresh_cron: str = "*/5 * * * *"
+    # Number of chart versions kept for cursor pagination
+    landing_chart_versions: int = 3
 
     # Variables for the JWT
     secret_key: str = "secret"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 30
+    # Version of the access token claims, tokens of other versions are rejected
+    access_claims_version: int = 1
+    # Maximum number of verified access tokens remembered until they expire
+    access_token_cache_size: int = 10000
+    # Maximum number of user profiles kept in memory
+    user_cache_size: int = 1024
+    # Seconds a user profile is kept in memory
+    user_cache_ttl: float = 30
+    # Cron schedule of the expired refresh tokens purging task
+    refresh_token_purge_cron: str = "0 * * * *"
+    # Maximum number of expired refresh tokens deleted by one statement
+    refresh_token_purge_batch_size: int = 1000
 
     # GitHub OAuth settings
     github_client_id: Optional[str] = None
     github_client_secret: Optional[str] = None
+    # Maximum number of connections to GitHub
+    github_connections: int = 20
+    # Seconds to cache resolved addresses of GitHub for
+    github_dns_cache_ttl: int = 300
+    # Seconds to wait for a response of GitHub
+    github_timeout: int = 10
+
+    # Route groups isolated from each other by concurrency limits, by path prefixes
+    bulkhead_groups: Dict[str, List[str]] = {
+        "landing": ["/api/charts", "/api/new-releases", "/api/playlists/new-year"],
+        "catalog": ["/api/tracks", "/api/albums", "/api/users"],
+        "auth": ["/api/oauth"],
+    }
+    # Bounds of the concurrency limit of every group, adapted to the latency
+    bulkhead_min_limit: int = 4
+    bulkhead_max_limit: int = 64
+    # Seconds above which a request decreases the limit of its group
+    bulkhead_target_latency: float = 1
+    # Maximum number of requests waiting for a slot in a group
+    bulkhead_max_queue: int = 64
+    # Seconds a request waits for a slot before it is rejected
+    bulkhead_queue_timeout: float = 2
+    # Seconds rejected clients are asked to wait before retrying
+    bulkhead_retry_after: int = 1
+
+    # Seconds between samples of the event loop lag
+    loop_lag_interval: float = 0.5
+    # Seconds of the event loop lag above which low priority requests are rejected
+    loop_lag_threshold: float = 0.2
+    # Path prefixes of the low priority requests
+    loop_lag_low_priority_paths: List[str] = [
+        "/api/charts",
+        "/api/new-releases",
+        "/api/playlists/new-year",
+        "/api/users",
+        "/api/albums",
+    ]
+    # Seconds rejected clients are asked to wait before retrying
+    loop_lag_retry_after: int = 1
 
     # CORS settings
     cors_allow_origins: List[str] = ["*"]
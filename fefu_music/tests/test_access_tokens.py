@@ -0,0 +1,39 @@
+import secrets
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi_jwt import JwtAccessBearer
+
+from fefu_music.services.auth.utils import CachedJwtAccessBearer
+
+
+def test_verified_token_is_not_decoded_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a verified access token is remembered and not decoded again.
+
+    :param monkeypatch: The pytest fixture to count the decoded tokens.
+    """
+    decoded: List[str] = []
+    decode = JwtAccessBearer._decode  # noqa: WPS437
+
+    def counting_decode(  # noqa: WPS430
+        bearer: JwtAccessBearer,
+        token: str,
+    ) -> Optional[Dict[str, Any]]:
+        decoded.append(token)
+        return decode(bearer, token)
+
+    monkeypatch.setattr(JwtAccessBearer, "_decode", counting_decode)
+    bearer = CachedJwtAccessBearer(
+        cache_size=1,
+        secret_key=secrets.token_hex(),
+        auto_error=False,
+    )
+    token = bearer.create_access_token(subject={"id": "user"})
+
+    payloads = [bearer._decode(token) for _ in range(3)]  # noqa: WPS437
+
+    assert decoded == [token]
+    assert payloads[-1]["subject"] == {"id": "user"}  # type: ignore[index]
+    assert bearer._decode("invalid") is None  # noqa: WPS437
+    assert len(bearer.verified_tokens) == 1
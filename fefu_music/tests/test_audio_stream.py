@@ -0,0 +1,151 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import cast
+
+import pytest
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from fastapi.responses import StreamingResponse
+from starlette import status
+
+from fefu_music.services.audio_stream import AudioDiskCache, proxy_audio
+
+AUDIO = bytes(range(256)) * 1024
+
+
+async def get_audio(request: web.Request) -> web.Response:
+    """
+    Serve the audio file with the range support.
+
+    :param request: The request.
+    :return: The requested part of the audio file.
+    """
+    http_range = request.http_range
+    if http_range.start is None:
+        return web.Response(body=AUDIO, content_type="audio/mpeg")
+    first_byte, last_byte = http_range.start, http_range.stop - 1
+    content_range = f"bytes {first_byte}-{last_byte}/{len(AUDIO)}"
+    return web.Response(
+        body=AUDIO[http_range],
+        status=status.HTTP_206_PARTIAL_CONTENT,
+        content_type="audio/mpeg",
+        headers={"Content-Range": content_range},
+    )
+
+
+@pytest.mark.anyio
+async def test_proxy_audio_forwards_range() -> None:
+    """Test that the requested range of the audio is streamed to the client."""
+    application = web.Application()
+    application.router.add_get("/audio.mp3", get_audio)
+    async with TestServer(application) as server:
+        async with ClientSession() as session:
+            response = await proxy_audio(
+                session=session,
+                url=str(server.make_url("/audio.mp3")),
+                request_headers={"Range": "bytes=1000-1999"},
+            )
+            body = bytearray()
+            async for chunk in response.body_iterator:
+                body.extend(chunk)  # type: ignore[arg-type]
+            await response.background()  # type: ignore[misc]
+
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.headers["Content-Range"] == "bytes 1000-1999/262144"
+    assert body == AUDIO[1000:2000]
+
+
+@pytest.mark.anyio
+async def test_audio_cache_serves_range_and_evicts(tmp_path: Path) -> None:
+    """
+    Test that downloaded files are served from the disk within the budget.
+
+    :param tmp_path: Temporary directory of the cache.
+    """
+    audio_cache = AudioDiskCache(directory=tmp_path, max_size=len(AUDIO) * 2)
+    audio_cache.load()
+    application = web.Application()
+    application.router.add_get("/audio.mp3", get_audio)
+    async with TestServer(application) as server:
+        url = str(server.make_url("/audio.mp3"))
+        async with ClientSession() as session:
+            for track_id in (1, 2, 3):
+                audio_cache.fill(track_id, "mp3", url, session)
+                await asyncio.gather(*audio_cache._fills.values())  # noqa: WPS437
+
+    response = cast(StreamingResponse, audio_cache.serve(3, "bytes=-100"))
+    body = [chunk async for chunk in response.body_iterator]
+
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.headers["Content-Type"] == "audio/mpeg"
+    assert body == [AUDIO[-100:]]
+    assert audio_cache.serve(1, None) is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.mp3", "3.mp3"]
+
+
+@pytest.mark.anyio
+async def test_audio_cache_budget_is_shared_by_workers(tmp_path: Path) -> None:
+    """
+    Test that the budget bounds the files of all the workers sharing the directory.
+
+    :param tmp_path: Temporary directory of the caches.
+    """
+    worker_caches = [
+        AudioDiskCache(directory=tmp_path, max_size=len(AUDIO) * 2) for _ in range(2)
+    ]
+    for worker_cache in worker_caches:
+        worker_cache.load()
+    application = web.Application()
+    application.router.add_get("/audio.mp3", get_audio)
+    async with TestServer(application) as server:
+        url = str(server.make_url("/audio.mp3"))
+        async with ClientSession() as session:
+            for filling_cache, track_id in zip(worker_caches * 2, (1, 2, 3)):
+                filling_cache.fill(track_id, "mp3", url, session)
+                await asyncio.gather(*filling_cache._fills.values())  # noqa: WPS437
+                # Played in the order of the downloads.
+                os.utime(tmp_path / f"{track_id}.mp3", (track_id, track_id))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.mp3", "3.mp3"]
+    assert worker_caches[0].serve(1, None) is None
+
+
+@pytest.mark.anyio
+async def test_audio_cache_sends_removed_file(tmp_path: Path) -> None:
+    """
+    Test that a file removed by another worker after the response starts is sent.
+
+    :param tmp_path: Temporary directory of the cache.
+    """
+    audio_path = tmp_path / "1.mp3"
+    audio_path.write_bytes(AUDIO)
+    audio_cache = AudioDiskCache(directory=tmp_path, max_size=len(AUDIO))
+    audio_cache.load()
+
+    response = cast(StreamingResponse, audio_cache.serve(1, None))
+    audio_path.unlink()
+    body = bytearray()
+    async for chunk in response.body_iterator:
+        body.extend(chunk)  # type: ignore[arg-type]
+
+    assert response.headers["Content-Length"] == str(len(AUDIO))
+    assert body == AUDIO
+    assert audio_cache.serve(1, None) is None
+
+
+def test_audio_cache_keeps_downloads_of_workers(tmp_path: Path) -> None:
+    """
+    Test that a starting worker removes only the abandoned partial files.
+
+    :param tmp_path: Temporary directory of the cache.
+    """
+    abandoned_path = tmp_path / "1.mp3.abandoned.part"
+    downloading_path = tmp_path / "2.mp3.downloading.part"
+    for partial_path in (abandoned_path, downloading_path):
+        partial_path.write_bytes(AUDIO)
+    os.utime(abandoned_path, (0, 0))
+
+    AudioDiskCache(directory=tmp_path, max_size=len(AUDIO)).load()
+
+    assert list(tmp_path.iterdir()) == [downloading_path]
@@ -1,12 +1,17 @@
 import secrets
+from datetime import datetime, timedelta
 
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
 
+from fefu_music.db.dao.refresh_token_dao import RefreshTokenDAO
 from fefu_music.db.dao.user_dao import UserDAO
+from fefu_music.db.models.refresh_token_model import RefreshTokenModel
 from fefu_music.services.github.schema import GithubUser
+from fefu_music.settings import settings
+from fefu_music.web.api.auth.tasks import purge_expired_refresh_tokens
 
 
 @pytest.mark.anyio
@@ -84,3 +89,104 @@ async def test_auth_github_no_email(
     response = await client.post(url)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "detail" in response.json()
+
+
+@pytest.mark.anyio
+async def test_current_user_profile(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    mock_github_user: GithubUser,
+) -> None:
+    """
+    Test that the profile of the user is returned for the compact access token.
+
+    :param client: The HTTP client.
+    :param fastapi_app: The FastAPI application.
+    :param mock_github_user: The mocked GitHub user.
+    """
+    url = fastapi_app.url_path_for("request_access_token")
+    response = await client.post(url, json={"code": secrets.token_hex(20)})
+    access_token = response.json()["access_token"]
+
+    response = await client.get(
+        fastapi_app.url_path_for("get_current_user_profile"),
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["email"] == mock_github_user.email
+
+
+@pytest.mark.anyio
+async def test_rotate_refresh_token(mock_github_user: GithubUser) -> None:
+    """
+    Test that the rotation replaces the token once and trims the old tokens.
+
+    :param mock_github_user: The mocked GitHub user.
+    """
+    user = await UserDAO.create(
+        avatar_url=str(mock_github_user.avatar_url),
+        email=mock_github_user.email,  # type: ignore
+        name=mock_github_user.name,  # type: ignore
+    )
+    refresh_tokens = [await RefreshTokenDAO.create(user_id=user.id) for _ in range(7)]
+
+    rotated_refresh_token = await RefreshTokenDAO.rotate(refresh_tokens[-1].id)
+
+    assert rotated_refresh_token is not None
+    assert rotated_refresh_token.user.id == user.id
+    assert await RefreshTokenDAO.rotate(refresh_tokens[-1].id) is None
+    assert await RefreshTokenModel.filter(user_id=user.id).count() == 5
+
+
+@pytest.mark.anyio
+async def test_purge_expired_refresh_tokens(
+    mock_github_user: GithubUser,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the expired refresh tokens are purged in batches.
+
+    :param mock_github_user: The mocked GitHub user.
+    :param monkeypatch: The pytest fixture to make the batches small.
+    """
+    monkeypatch.setattr(settings, "refresh_token_purge_batch_size", 2)
+    user = await UserDAO.create(
+        avatar_url=str(mock_github_user.avatar_url),
+        email=mock_github_user.email,  # type: ignore
+        name=mock_github_user.name,  # type: ignore
+    )
+    expired_at = datetime.utcnow() - timedelta(days=1)
+    for _ in range(5):
+        await RefreshTokenModel.create(user_id=user.id, expires_at=expired_at)
+    refresh_token = await RefreshTokenDAO.create(user_id=user.id)
+
+    await purge_expired_refresh_tokens()
+
+    assert await RefreshTokenModel.filter(user_id=user.id).values_list(
+        "id",
+        flat=True,
+    ) == [refresh_token.id]
+
+
+@pytest.mark.anyio
+async def test_upsert_user_by_email(mock_github_user: GithubUser) -> None:
+    """
+    Test that the upsert refreshes the name and the avatar of the existing user.
+
+    :param mock_github_user: The mocked GitHub user.
+    """
+    user = await UserDAO.create(
+        avatar_url=str(mock_github_user.avatar_url),
+        email=mock_github_user.email,  # type: ignore
+        name="Old name",
+    )
+
+    upserted_user = await UserDAO.upsert_by_email(
+        name="New name",
+        email=mock_github_user.email,  # type: ignore
+        avatar_url="https://example.com/new.png",
+    )
+
+    assert upserted_user.id == user.id
+    assert upserted_user.name == "New name"
+    assert upserted_user.avatar_url == "https://example.com/new.png"
@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from fefu_music.web.bulkheads import AdaptiveLimiter
+
+
+@pytest.mark.anyio
+async def test_limiter_queues_and_sheds() -> None:
+    """Test that requests over the limit are queued up to the bound and shed after."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=1, target_latency=1, max_queue=1)
+
+    assert await limiter.acquire(timeout=1)
+    queued = asyncio.ensure_future(limiter.acquire(timeout=1))
+    await asyncio.sleep(0)
+    assert not await limiter.acquire(timeout=1)
+
+    limiter.release(latency=0, overloaded=False)
+    assert await queued
+    assert limiter.in_flight == 1
+
+
+def test_limiter_adapts_to_latency() -> None:
+    """Test that slow requests decrease the limit and fast ones increase it."""
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=10, target_latency=1, max_queue=0)
+    limiter.in_flight = 2
+
+    limiter.release(latency=2, overloaded=False)
+    assert limiter.limit == pytest.approx(9)
+    limiter.release(latency=0, overloaded=False)
+    assert limiter.limit == pytest.approx(9 + 1 / 9)
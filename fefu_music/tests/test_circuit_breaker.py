@@ -0,0 +1,93 @@
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from benchmarks.fake_upstream import FakeUpstream, Faults, serve
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from fefu_music.services.yandex_music_api.client import CachedYMClient
+from fefu_music.services.yandex_music_api.pool import UpstreamServerError, YMClientPool
+from fefu_music.services.yandex_music_api.staleness import track_staleness
+from fefu_music.settings import settings
+
+
+def test_breaker_opens_and_probes() -> None:
+    """Test that the breaker opens on failures and a successful probe closes it."""
+    breaker = CircuitBreaker(
+        window_size=4,
+        failure_ratio=0.5,
+        slow_call_duration=1,
+        open_duration=0.01,
+    )
+    for failed in (False, True, False):
+        breaker.record(0, failed=failed)
+    breaker.record(2, failed=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    time.sleep(0.01)
+
+    assert breaker.state == "half_open"
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    breaker.record(0, failed=False)
+    assert breaker.state == "closed"
+
+
+@pytest.mark.anyio
+async def test_cached_client_falls_back_to_stale() -> None:
+    """Test that the last good response is used when the upstream fails."""
+    album = Mock()
+    ym_client = Mock()
+    ym_client.get_album_with_tracks = AsyncMock(
+        side_effect=[album, ConnectionError()],
+    )
+    client = CachedYMClient(
+        client=ym_client,
+        cache=TTLCache(max_size=10),
+        ttls={"get_album_with_tracks": 0},
+        stale_cache=TTLCache(max_size=10),
+    )
+
+    await client.get_album_with_tracks(1)
+    with track_staleness() as staleness:
+        assert await client.get_album_with_tracks(1) is album
+        assert staleness.age is not None
+
+
+@pytest.mark.anyio
+async def test_upstream_server_errors_open_breaker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that server errors of Yandex Music are failures of the upstream.
+
+    They fall back to stale responses and open the breaker.
+
+    :param monkeypatch: The pytest fixture to point the pool to the fake API.
+    """
+    upstream = FakeUpstream(Faults())
+    monkeypatch.setattr(settings, "yandex_music_breaker_window", 3)
+    async with serve(upstream, port=0) as base_url:
+        monkeypatch.setattr(settings, "yandex_music_base_url", base_url)
+        pool = YMClientPool(["token"])
+        client = CachedYMClient(
+            client=pool,
+            cache=TTLCache(max_size=10),
+            ttls={"get_album_with_tracks": 0},
+            stale_cache=TTLCache(max_size=10),
+        )
+        album = await client.get_album_with_tracks(1)
+        upstream.faults.error_rate = 1
+        stale_album = await client.get_album_with_tracks(1)
+        with pytest.raises(UpstreamServerError):
+            await client.get_album_with_tracks(2)
+        with pytest.raises(CircuitOpenError):
+            await client.get_album_with_tracks(2)
+        await pool.clients[0].client.close()
+
+    assert stale_album is album
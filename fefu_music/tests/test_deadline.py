@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from benchmarks.fake_upstream import FakeUpstream, Faults, serve
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.pool import YMClientPool
+from fefu_music.settings import settings
+from fefu_music.web.api.deadline import DeadlineRoute
+
+BUDGET = 0.2
+
+
+@pytest.mark.anyio
+async def test_slow_upstream_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that a route waiting for a slow upstream answers 504 within its budget.
+
+    :param monkeypatch: The pytest fixture to set the budget and the fake API.
+    """
+    monkeypatch.setitem(settings.route_latency_budget, "fetch_slow_track", BUDGET)
+    router = APIRouter(route_class=DeadlineRoute)
+
+    @router.get("/tracks/{track_id}")
+    async def fetch_slow_track(  # noqa: WPS430
+        track_id: int,
+        yandex_music_client: CachedYMClient = Depends(get_ymclient),
+    ) -> None:
+        await yandex_music_client.get_track(track_id)
+
+    application = FastAPI()
+    application.include_router(router)
+    async with serve(FakeUpstream(Faults(latency=BUDGET * 5)), port=0) as base_url:
+        monkeypatch.setattr(settings, "yandex_music_base_url", base_url)
+        pool = YMClientPool(["token"])
+        application.state.ym_client = CachedYMClient(
+            client=pool,
+            cache=TTLCache(max_size=10),
+            ttls={},
+        )
+        async with AsyncClient(app=application, base_url="http://test") as client:
+            started_at = time.monotonic()
+            response = await client.get("/tracks/1")
+            elapsed = time.monotonic() - started_at
+        await pool.clients[0].client.close()
+
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert elapsed < BUDGET * 2
+
+
+@pytest.mark.anyio
+async def test_deadline_route_cancels_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the handler is cancelled when the budget of the route is exhausted.
+
+    :param monkeypatch: The pytest fixture to set the budget.
+    """
+    monkeypatch.setitem(settings.route_latency_budget, "wait_forever", BUDGET)
+    handler_cancelled = asyncio.Event()
+    router = APIRouter(route_class=DeadlineRoute)
+
+    @router.get("/forever")
+    async def wait_forever() -> None:  # noqa: WPS430
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            handler_cancelled.set()
+            raise
+
+    application = FastAPI()
+    application.include_router(router)
+    async with AsyncClient(app=application, base_url="http://test") as client:
+        response = await client.get("/forever")
+
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert handler_cancelled.is_set()
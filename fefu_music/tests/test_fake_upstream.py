@@ -0,0 +1,24 @@
+import pytest
+
+from benchmarks.fake_upstream import FakeUpstream, Faults, serve
+from fefu_music.services.yandex_music_api.pool import RateLimitError, YMClientPool
+from fefu_music.settings import settings
+
+
+@pytest.mark.anyio
+async def test_pool_reads_fake_upstream(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the pool reads the fake API and backs off injected rate limits."""
+    upstream = FakeUpstream(Faults())
+    async with serve(upstream, port=0) as base_url:
+        monkeypatch.setattr(settings, "yandex_music_base_url", base_url)
+        pool = YMClientPool(["token"])
+        tracks = await pool.get_tracks(track_ids=[1, 2])
+        download_info = await pool.get_track_download_info_direct(track_id=1)
+        upstream.faults.rate_limit_rate = 1
+        with pytest.raises(RateLimitError):
+            await pool.get_track(track_id=1)
+        await pool.clients[0].client.close()
+
+    assert [track.id for track in tracks] == ["1", "2"]
+    assert [codec_info.codec for codec_info in download_info] == ["mp3", "aac"]
+    assert pool.usage()[0]["backing_off"]
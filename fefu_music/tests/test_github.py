@@ -0,0 +1,163 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Mapping, Tuple, cast
+
+import aiohttp
+import pytest
+from fastapi import FastAPI, HTTPException
+from starlette import status
+
+from fefu_music.services import github
+from fefu_music.services.auth.schema import GithubOAuthResponse
+from fefu_music.services.github.dependencies import get_github_user_data
+from fefu_music.services.github.schema import PublicUser
+from fefu_music.settings import settings
+
+USER_URL = "https://api.github.com/user"
+EMAILS_URL = "https://api.github.com/user/emails"
+OAUTH_RESPONSE = GithubOAuthResponse(
+    access_token="token",  # noqa: S106
+    token_type="bearer",
+    scope="user:email",
+)
+USER = {
+    "login": "fefu",
+    "id": 1,
+    "node_id": "node",
+    "avatar_url": "https://avatars.githubusercontent.com/u/1",
+    "url": "https://api.github.com/users/fefu",
+    "html_url": "https://github.com/fefu",
+    "followers_url": "https://api.github.com/users/fefu/followers",
+    "following_url": "https://api.github.com/users/fefu/following",
+    "gists_url": "https://api.github.com/users/fefu/gists",
+    "starred_url": "https://api.github.com/users/fefu/starred",
+    "subscriptions_url": "https://api.github.com/users/fefu/subscriptions",
+    "organizations_url": "https://api.github.com/users/fefu/orgs",
+    "repos_url": "https://api.github.com/users/fefu/repos",
+    "events_url": "https://api.github.com/users/fefu/events",
+    "received_events_url": "https://api.github.com/users/fefu/received_events",
+    "type": "User",
+    "site_admin": False,
+    "email": None,
+    "public_repos": 0,
+    "public_gists": 0,
+    "followers": 0,
+    "following": 0,
+    "created_at": "2023-12-01T00:00:00Z",
+    "updated_at": "2023-12-01T00:00:00Z",
+    "plan": {"collaborators": 0, "name": "free", "space": 0, "private_repos": 0},
+    "private_gists": 0,
+    "total_private_repos": 0,
+    "owned_private_repos": 0,
+    "disk_usage": 0,
+    "collaborators": 0,
+}
+
+# URL and headers of a request sent to the stub session.
+StubRequest = Tuple[str, Mapping[str, str]]
+
+
+class StubResponse:
+    """Response of the stub GitHub session."""
+
+    def __init__(self, response_status: int, payload: Any) -> None:
+        self.status = response_status
+        self.payload = payload
+
+    async def json(self) -> Any:
+        """
+        Get the payload of the response.
+
+        :return: The payload.
+        """
+        return self.payload
+
+
+class StubSession:
+    """GitHub session answering the URLs with the given responses after delays."""
+
+    def __init__(self, responses: Mapping[str, Tuple[float, int, Any]]) -> None:
+        self.responses = responses
+        self.requests: List[StubRequest] = []
+        self.cancelled: List[str] = []
+
+    @asynccontextmanager
+    async def get(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> AsyncIterator[StubResponse]:
+        """
+        Answer the request after the delay of the URL.
+
+        :param url: The URL of the request.
+        :param headers: The headers of the request.
+        :raises asyncio.CancelledError: If the request is cancelled.
+        :yields: The response of the URL.
+        """
+        self.requests.append((url, headers))
+        delay, response_status, payload = self.responses[url]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        yield StubResponse(response_status, payload)
+
+
+@pytest.mark.anyio
+async def test_github_user_data_is_fetched_concurrently() -> None:
+    """Test that the profile and the emails are requested with the access token."""
+    emails: List[Dict[str, Any]] = [{"email": "fefu@example.com"}]
+    session = StubSession(
+        {
+            USER_URL: (0.01, status.HTTP_200_OK, dict(USER)),
+            EMAILS_URL: (0.01, status.HTTP_200_OK, emails),
+        },
+    )
+
+    github_user = await get_github_user_data(
+        github_oauth_response=OAUTH_RESPONSE,
+        session=cast(aiohttp.ClientSession, session),
+    )
+
+    assert isinstance(github_user, PublicUser)
+    assert github_user.email == "fefu@example.com"
+    assert sorted(url for url, _ in session.requests) == [USER_URL, EMAILS_URL]
+    assert {headers["Authorization"] for _, headers in session.requests} == {
+        "Bearer token",
+    }
+
+
+@pytest.mark.anyio
+async def test_github_user_error_cancels_emails() -> None:
+    """Test that the emails request is cancelled when the profile request fails."""
+    session = StubSession(
+        {
+            USER_URL: (0, status.HTTP_401_UNAUTHORIZED, {}),
+            EMAILS_URL: (10, status.HTTP_200_OK, []),
+        },
+    )
+
+    with pytest.raises(HTTPException) as error_info:
+        await get_github_user_data(
+            github_oauth_response=OAUTH_RESPONSE,
+            session=cast(aiohttp.ClientSession, session),
+        )
+    await asyncio.sleep(0)
+
+    assert error_info.value.status_code == status.HTTP_401_UNAUTHORIZED  # noqa: WPS441
+    assert session.cancelled == [EMAILS_URL]
+
+
+@pytest.mark.anyio
+async def test_github_session_is_pooled() -> None:
+    """Test that the session shared by the logins is bounded and closed on shutdown."""
+    application = FastAPI()
+    github.startup(app=application)
+    session: aiohttp.ClientSession = application.state.github_session
+
+    assert session.connector is not None
+    assert session.connector.limit == settings.github_connections
+    await github.shutdown(app=application)
+    assert session.closed
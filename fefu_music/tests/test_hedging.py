@@ -0,0 +1,23 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from fefu_music.services.yandex_music_api.hedging import Hedger
+
+
+@pytest.mark.anyio
+async def test_slow_call_is_hedged_within_budget() -> None:
+    """Test that a slow call is hedged once the budget allows, and the fast one wins."""
+    hedger = Hedger(window_size=2, percentile=0.5, budget_ratio=0.5, max_hedges=1)
+    delays: List[float] = [0, 0, 1, 0]
+
+    async def call() -> Any:  # noqa: WPS430
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    assert await hedger.run("get_track", call) == 0
+    assert await hedger.run("get_track", call) == 0
+    assert await hedger.run("get_track", call) == 0
+    assert hedger.hedges == 1
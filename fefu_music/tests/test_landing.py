@@ -1,8 +1,14 @@
+from unittest.mock import Mock
+
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
 from starlette import status
 
+from fefu_music.db.dao.landing_block_dao import LandingBlockDAO
+from fefu_music.web.api.landing import blocks
+from fefu_music.web.api.landing.store import LandingStore
+
 
 @pytest.mark.anyio
 async def test_get_chart_count(
@@ -78,6 +84,44 @@ async def test_get_chart_invalid_limit(
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+@pytest.mark.anyio
+async def test_get_chart_cursor(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test to verify that the cursor of a chart page returns the next page.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("get_chart")
+    response1 = await client.get(url, params={"limit": 20})
+    response2 = await client.get(
+        url,
+        params={"limit": 10, "cursor": response1.headers["X-Next-Cursor"]},
+    )
+    response3 = await client.get(url, params={"limit": 10, "offset": 20})
+    assert response2.status_code == status.HTTP_200_OK
+    assert response2.json() == response3.json()
+
+
+@pytest.mark.anyio
+async def test_get_chart_invalid_cursor(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test for error when a malformed cursor is provided to get_chart.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("get_chart")
+    response = await client.get(url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.anyio
 async def test_get_new_releases_count(
     fastapi_app: FastAPI,
@@ -150,3 +194,17 @@ async def test_get_new_releases_invalid_limit(
         },
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_landing_store_answers_from_database() -> None:
+    """Test that the landing store serves pre-fetched blocks without Yandex."""
+    payload = {"revision": 1, "tracks": [{"id": 1}]}
+    await LandingBlockDAO.save(key=blocks.CHART, payload=payload)
+    yandex_music_client = Mock()
+
+    landing_store = LandingStore()
+    chart = await landing_store.get(blocks.CHART, yandex_music_client)
+
+    assert chart == payload
+    yandex_music_client.get_chart.assert_not_called()
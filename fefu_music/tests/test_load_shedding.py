@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from fefu_music.settings import settings
+from fefu_music.web.application import get_app
+from fefu_music.web.bulkheads import BulkheadMiddleware
+from fefu_music.web.load_shedding import LoadSheddingMiddleware, LoopLagMonitor
+
+
+@pytest.mark.anyio
+async def test_monitor_measures_blocked_loop() -> None:
+    """Test that the monitor measures the time the loop is blocked."""
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)  # noqa: WPS432
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+    assert monitor.max_lag > 0.05  # noqa: WPS432, WPS459
+
+
+@pytest.mark.anyio
+async def test_low_priority_request_is_shed(monkeypatch: Any) -> None:
+    """Test that only low priority requests are rejected while the loop lags."""
+    handled: List[str] = []
+    sent: List[Message] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: WPS430
+        handled.append(scope["path"])
+
+    async def receive() -> Message:  # noqa: WPS430
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:  # noqa: WPS430
+        sent.append(message)
+
+    middleware = LoadSheddingMiddleware(app, low_priority_paths=["/api/charts"])
+    monkeypatch.setattr(
+        "fefu_music.web.load_shedding.loop_lag_monitor.lag",
+        settings.loop_lag_threshold + 1,
+    )
+    for path in ("/api/charts", "/api/tracks/1"):
+        await middleware({"type": "http", "path": path}, receive, send)
+
+    assert handled == ["/api/tracks/1"]
+    assert sent[0]["status"] == 503
+    assert middleware.shed == 1
+
+
+def test_load_shedding_wraps_bulkheads() -> None:
+    """Test that requests are shed before they wait for a slot of a bulkhead."""
+    middleware_classes = [middleware.cls for middleware in get_app().user_middleware]
+
+    assert middleware_classes.index(LoadSheddingMiddleware) < (
+        middleware_classes.index(BulkheadMiddleware)
+    )
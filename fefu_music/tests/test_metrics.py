@@ -0,0 +1,43 @@
+import pytest
+
+from fefu_music.services.metrics.instruments import Counter, Histogram, render
+from fefu_music.services.metrics.registry import (
+    db_pool_acquire_duration,
+    db_pool_connections,
+    db_pool_utilization,
+    record_db_pool_acquire,
+)
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """Test that a histogram is rendered with cumulative buckets, sum and count."""
+    histogram = Histogram("latency", "Latency.", labels=("route",), buckets=(1, 2))
+    for latency in (0.5, 1.5, 3):
+        histogram.labels("get_track").observe(latency)
+    counter = Counter("lookups_total", "Lookups.")
+    counter.labels().inc()
+
+    assert render([histogram, counter]).splitlines() == [
+        "# HELP latency Latency.",
+        "# TYPE latency histogram",
+        'latency_bucket{route="get_track",le="1.0"} 1',
+        'latency_bucket{route="get_track",le="2.0"} 2',
+        'latency_bucket{route="get_track",le="+Inf"} 3',
+        'latency_sum{route="get_track"} 5.0',
+        'latency_count{route="get_track"} 3',
+        "# HELP lookups_total Lookups.",
+        "# TYPE lookups_total counter",
+        "lookups_total 1.0",
+    ]
+
+
+def test_db_pool_usage_is_recorded() -> None:
+    """Test that the wait for a pooled connection and the pool usage are recorded."""
+    acquired = db_pool_acquire_duration.labels().count
+
+    record_db_pool_acquire(0.01, size=4, idle=1, max_size=6)
+
+    assert db_pool_acquire_duration.labels().count == acquired + 1
+    assert db_pool_connections.labels("in_use").metric_value == 3
+    assert db_pool_connections.labels("idle").metric_value == 1
+    assert db_pool_utilization.labels().metric_value == pytest.approx(0.5)
@@ -0,0 +1,135 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from benchmarks.fake_upstream import ALBUM_TRACKS, PLAYLIST_TRACKS
+from fefu_music.services.yandex_music_api.utils import iter_album_tracks
+from fefu_music.web.api.pagination import TracksPagination, encode_cursor
+from fefu_music.web.api.streaming import NDJSON_MEDIA_TYPE
+
+
+def test_album_pages_follow_cursor() -> None:
+    """Test that album pages resume from the cursor across volumes."""
+    volumes: List[List[Any]] = [["a", "b", "c"], ["d", "e"]]
+    pages: List[List[Any]] = []
+    cursor: Optional[str] = None
+    while True:
+        pagination = TracksPagination(limit=2, offset=0, cursor=cursor)
+        positioned_tracks = iter_album_tracks(volumes, *pagination.start(size=2))
+        tracks, cursor = pagination.page(positioned_tracks)
+        pages.append(tracks)
+        if cursor is None:
+            break
+
+    assert pages == [["a", "b"], ["c", "d"], ["e"]]
+
+
+@pytest.mark.anyio
+async def test_album_tracks_are_streamed_as_ndjson(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test that every track of an album is sent on its own line.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("stream_album_tracks", album_id=1)
+    response = await client.get(url)
+    *lines, last_line = response.text.split("\n")
+    track_ids = [json.loads(line)["id"] for line in lines]
+
+    assert response.headers["Content-Type"] == NDJSON_MEDIA_TYPE
+    assert not last_line
+    assert track_ids == list(range(ALBUM_TRACKS, ALBUM_TRACKS * 2))
+
+
+@pytest.mark.anyio
+async def test_playlist_tracks_are_streamed_as_ndjson(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test that every track of a playlist is sent on its own line.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("stream_playlist_tracks", user_id=1, kind=3)
+    response = await client.get(url)
+    *lines, last_line = response.text.split("\n")
+    track_ids = [json.loads(line)["id"] for line in lines]
+
+    assert response.headers["Content-Type"] == NDJSON_MEDIA_TYPE
+    assert not last_line
+    assert track_ids == list(range(1, PLAYLIST_TRACKS + 1))
+
+
+@pytest.mark.anyio
+async def test_playlist_pages_follow_cursor(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test that the pages of a playlist follow the cursor to its last track.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("get_playlist", user_id=1, kind=3)
+    params: Dict[str, Any] = {"limit": 30}
+    pages: List[List[int]] = []
+    while True:
+        response = await client.get(url, params=params)
+        pages.append([track["id"] for track in response.json()["tracks"]])
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"limit": 30, "cursor": next_cursor}
+
+    assert [len(page) for page in pages] == [30, 30, 30, 10]
+    assert sum(pages, []) == list(range(1, PLAYLIST_TRACKS + 1))
+
+
+@pytest.mark.anyio
+async def test_malformed_cursor_is_rejected(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test for error when a malformed cursor is provided to get_album.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    url = fastapi_app.url_path_for("get_album", album_id=1)
+    response = await client.get(url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_foreign_cursor_is_rejected(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+) -> None:
+    """
+    Test for error when a cursor of an album is used for a playlist and back.
+
+    :param fastapi_app: The FastAPI application.
+    :param client: The HTTP client.
+    """
+    playlist_url = fastapi_app.url_path_for("get_playlist", user_id=1, kind=3)
+    album_url = fastapi_app.url_path_for("get_album", album_id=1)
+    playlist_response = await client.get(
+        playlist_url,
+        params={"cursor": encode_cursor(0, 5)},
+    )
+    album_response = await client.get(album_url, params={"cursor": encode_cursor(5)})
+
+    assert playlist_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert album_response.status_code == status.HTTP_400_BAD_REQUEST
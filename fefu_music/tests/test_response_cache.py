@@ -0,0 +1,43 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from fefu_music.settings import settings
+from fefu_music.web.api.response_cache import ResponseCacheRoute, response_cache
+
+
+@pytest.mark.anyio
+async def test_response_cache_answers_not_modified(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the cached response is reused and revalidated with ETag.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setitem(settings.response_cache_max_age, "get_counter", 60)
+    response_cache.clear()
+    calls = []
+    router = APIRouter(route_class=ResponseCacheRoute)
+
+    @router.get("/counter")
+    async def get_counter() -> int:  # noqa: WPS430
+        calls.append(1)
+        return len(calls)
+
+    application = FastAPI()
+    application.include_router(router)
+    async with AsyncClient(app=application, base_url="http://test") as client:
+        response = await client.get("/counter")
+        repeated_response = await client.get("/counter")
+        not_modified_response = await client.get(
+            "/counter",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+    assert len(calls) == 1
+    assert repeated_response.content == response.content
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not not_modified_response.content
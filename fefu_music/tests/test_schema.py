@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pydantic import HttpUrl
+from starlette import status
+from ymdantic.models import DownloadInfoDirect, Track
+
+from benchmarks.fixtures import make_track
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.web.api.schema import TrackShortDTO
+
+
+def test_track_projection() -> None:
+    """Test that the projected track serializes like a validated one."""
+    track = Track.model_validate(make_track(1))
+
+    track_dto = TrackShortDTO.project(track)
+
+    assert track_dto.model_dump(mode="json") == {
+        "id": 1,
+        "available": True,
+        "type": "music",
+        "title": "Track 1",
+        "cover_url": "https://avatars.yandex.net/get-music-content/1/100x100",
+        "duration_ms": 180000,
+        "duration_text": "03:00",
+        "artists": [
+            {
+                "id": 1,
+                "name": "Artist 1",
+                "cover_url": "https://avatars.yandex.net/get-music-content/1/100x100",
+            },
+            {
+                "id": 2,
+                "name": "Artist 2",
+                "cover_url": "https://avatars.yandex.net/get-music-content/2/100x100",
+            },
+        ],
+    }
+
+
+@pytest.mark.anyio
+async def test_download_info_route(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Test that the download information route responds with projected DTOs.
+
+    :param client: The HTTP client.
+    :param fastapi_app: The FastAPI application.
+    """
+    direct_url = "https://storage.yandex.net/get-mp3/track.mp3"
+    download_info = Mock(
+        spec=DownloadInfoDirect,
+        codec="mp3",
+        bitrate_in_kbps=320,
+        direct_url=HttpUrl(direct_url),
+    )
+    yandex_music_client = Mock(spec=CachedYMClient)
+    yandex_music_client.get_track_download_info_direct = AsyncMock(
+        return_value=[download_info],
+    )
+    fastapi_app.dependency_overrides[get_ymclient] = lambda: yandex_music_client
+
+    response = await client.get(
+        fastapi_app.url_path_for("get_download_info", track_id="1"),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"codec": "mp3", "bitrate_in_kbps": 320, "direct_url": direct_url},
+    ]
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from ymdantic.exceptions import YandexMusicError
+from ymdantic.models.error import YandexMusicErrorModel
+
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.client import CachedYMClient
+from fefu_music.services.yandex_music_api.deadline import deadline_scope
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that the cache evicts the least recently used entry when it is full."""
+    cache = TTLCache(max_size=2)
+    cache.set("first", 1, ttl=60)
+    cache.set("second", 2, ttl=60)
+    cache.get("first")
+    cache.set("third", 3, ttl=60)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") is None
+    assert cache.get("third") == 3
+
+
+def test_cache_expires_entries() -> None:
+    """Test that expired entries are treated as misses."""
+    cache = TTLCache(max_size=2)
+    cache.set("expired", 1, ttl=0)
+
+    assert cache.get("expired") is None
+    assert cache.misses == 1
+    assert not cache
+
+
+@pytest.mark.anyio
+async def test_cached_client_answers_from_cache() -> None:
+    """Test that repeated calls with the same arguments hit the upstream once."""
+    track = Mock()
+    ym_client = Mock()
+    ym_client.get_track = AsyncMock(return_value=track)
+    client = CachedYMClient(
+        client=ym_client,
+        cache=TTLCache(max_size=10),
+        ttls={"get_track": 60},
+    )
+
+    assert await client.get_track(1) is track
+    assert await client.get_track(1) is track
+    await client.get_track(2)
+
+    assert ym_client.get_track.await_count == 2
+    assert client.cache.hits == 1
+    assert client.cache.misses == 2
+
+
+@pytest.mark.anyio
+async def test_cached_client_skips_methods_without_ttl() -> None:
+    """Test that methods without a configured TTL always call the upstream."""
+    ym_client = Mock()
+    ym_client.get_track_download_info_direct = AsyncMock(return_value=[])
+    client = CachedYMClient(client=ym_client, cache=TTLCache(max_size=10), ttls={})
+
+    await client.get_track_download_info_direct(1)
+    await client.get_track_download_info_direct(1)
+
+    assert ym_client.get_track_download_info_direct.await_count == 2
+    assert not client.cache
+
+
+@pytest.mark.anyio
+async def test_cached_client_coalesces_concurrent_calls() -> None:
+    """Test that concurrent calls for the same key share one upstream request."""
+    ym_client = Mock()
+    error = YandexMusicError(
+        error=YandexMusicErrorModel(name="not-found", message=""),
+    )
+    ym_client.get_album_with_tracks = AsyncMock(side_effect=error)
+    client = CachedYMClient(client=ym_client, cache=TTLCache(max_size=10), ttls={})
+
+    responses = await asyncio.gather(
+        *(client.get_album_with_tracks(1) for _ in range(10)),
+        return_exceptions=True,
+    )
+
+    assert ym_client.get_album_with_tracks.await_count == 1
+    assert all(isinstance(response, YandexMusicError) for response in responses)
+    assert not client.single_flight
+
+
+@pytest.mark.anyio
+async def test_download_info_expires_with_url() -> None:
+    """Test that download information is cached until its signed URL expires."""
+    signed_at = int(time.time() * 10**6)
+    signed_url = Mock(ts=f"{signed_at:x}")
+    fresh_info = Mock(codec="mp3", direct_url_info=signed_url)
+    expired_info = Mock(codec="mp3", direct_url_info=Mock(ts="0"))
+    ym_client = Mock()
+    ym_client.get_track_download_info_direct = AsyncMock(
+        side_effect=[[fresh_info], [expired_info], [expired_info]],
+    )
+    client = CachedYMClient(client=ym_client, cache=TTLCache(max_size=10), ttls={})
+
+    assert await client.get_track_download_info_direct(1) == [fresh_info]
+    assert not await client.get_track_download_info_direct(1, codec="aac")
+    await client.get_track_download_info_direct(2)
+    await client.get_track_download_info_direct(2)
+
+    assert ym_client.get_track_download_info_direct.await_count == 3
+
+
+@pytest.mark.anyio
+async def test_cached_client_batches_missing_tracks() -> None:
+    """Test that missing tracks are fetched in one request and cached one by one."""
+    tracks = [Mock(id=str(track_id)) for track_id in range(3)]
+    ym_client = Mock()
+    ym_client.get_track = AsyncMock(return_value=tracks[1])
+    ym_client.get_tracks = AsyncMock(return_value=[tracks[2], tracks[0]])
+    client = CachedYMClient(
+        client=ym_client,
+        cache=TTLCache(max_size=10),
+        ttls={"get_track": 60},
+    )
+
+    await client.get_track(1)
+    assert await client.get_tracks([2, 1, 0, 2]) == [
+        tracks[2],
+        tracks[1],
+        tracks[0],
+        tracks[2],
+    ]
+    assert await client.get_track(0) is tracks[0]
+
+    ym_client.get_tracks.assert_awaited_once_with(track_ids=[2, 0])
+
+
+@pytest.mark.anyio
+async def test_cached_client_stops_at_deadline() -> None:
+    """Test that a call waits for the upstream only until the deadline."""
+    ym_client = Mock()
+    ym_client.get_track = lambda track_id: asyncio.Event().wait()
+    client = CachedYMClient(client=ym_client, cache=TTLCache(max_size=10), ttls={})
+
+    with deadline_scope(0.01):
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get_track(1)
+
+
+@pytest.mark.anyio
+async def test_cancelled_track_cancels_download_info() -> None:
+    """Test that cancelling the track request cancels its download information."""
+    ym_client = Mock()
+    ym_client.get_track = lambda track_id: asyncio.Event().wait()
+    ym_client.get_track_download_info_direct = ym_client.get_track
+    client = CachedYMClient(client=ym_client, cache=TTLCache(max_size=10), ttls={})
+    request = asyncio.create_task(client.get_track_with_download_info(1))
+    await asyncio.sleep(0.01)
+    download_tasks = [
+        running_task
+        for running_task in asyncio.all_tasks()
+        if "get_track_download_info_direct()" in repr(running_task)
+    ]
+
+    request.cancel()
+    await asyncio.gather(request, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert [download_task.cancelled() for download_task in download_tasks] == [True]
@@ -0,0 +1,20 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from fefu_music.services.yandex_music_api.pool import RateLimitError, YMClientPool
+
+
+@pytest.mark.anyio
+async def test_pool_backs_off_rate_limited_token() -> None:
+    """Test that a rate limited token is skipped and the call is retried."""
+    pool = YMClientPool(["first-token", "second-token"])
+    limited_client, healthy_client = pool.clients
+    limited_client.client = Mock(get_track=AsyncMock(side_effect=RateLimitError(60)))
+    healthy_client.client = Mock(get_track=AsyncMock(return_value="track"))
+
+    assert await pool.get_track(track_id=1) == "track"
+    assert await pool.get_track(track_id=1) == "track"
+
+    assert [usage["requests"] for usage in pool.usage()] == [1, 2]
+    assert [usage["backing_off"] for usage in pool.usage()] == [True, False]
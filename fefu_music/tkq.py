@@ -1,5 +1,6 @@
 import taskiq_fastapi
-from taskiq import InMemoryBroker, ZeroMQBroker
+from taskiq import InMemoryBroker, TaskiqScheduler, ZeroMQBroker
+from taskiq.schedule_sources import LabelScheduleSource
 
 from fefu_music.settings import settings
 
@@ -12,3 +13,8 @@ taskiq_fastapi.init(
     broker,
     "fefu_music.web.application:get_app",
 )
+
+scheduler = TaskiqScheduler(
+    broker=broker,
+    sources=[LabelScheduleSource(broker)],
+)
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional, Sequence
 
-from pydantic import ConfigDict, model_validator
-from ymdantic.models import Album
+from pydantic import ConfigDict
+from typing_extensions import Self
+from ymdantic.models import Album, TrackType
 
 from fefu_music.web.api.schema import AlbumShortDTO, TrackShortDTO
 
@@ -13,14 +14,22 @@ class AlbumDTO(AlbumShortDTO):
 
     tracks: List[TrackShortDTO]
 
-    @model_validator(mode="before")
-    def tracks_validator(cls, obj: Album) -> Album:
+    @classmethod
+    def project(  # type: ignore[override]
+        cls,
+        album: Album,
+        tracks: Optional[Sequence[TrackType]] = None,
+    ) -> Self:
         """
-        Validate the tracks.
+        Project the album with its tracks to the DTO without validation.
 
-        :param obj: The album to validate.
-        :return: The validated album.
+        :param album: The album to project.
+        :param tracks: A page of the tracks, the tracks of all volumes by default.
+        :return: The album DTO.
         """
-        return obj.model_copy(
-            update={"tracks": [track for volume in obj.volumes for track in volume]},
+        if tracks is None:
+            tracks = [track for volume in album.volumes for track in volume]
+        return super().project(
+            album,
+            tracks=[TrackShortDTO.project(track) for track in tracks],
         )
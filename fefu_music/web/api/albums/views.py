@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
-from ymdantic import YMClient, models
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 
-from fefu_music.services.yandex_music_api import get_ymclient
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.services.yandex_music_api.utils import iter_album_tracks
 from fefu_music.web.api.albums.schema import AlbumDTO
+from fefu_music.web.api.pagination import TracksPagination
+from fefu_music.web.api.response_cache import ResponseCacheRoute
+from fefu_music.web.api.streaming import stream_tracks
 
-router = APIRouter()
+router = APIRouter(route_class=ResponseCacheRoute)
 
 
 @router.get(
@@ -13,16 +17,53 @@ router = APIRouter()
 )
 async def get_album(
     album_id: int,
-    ym_client: YMClient = Depends(get_ymclient),
-) -> models.Album:
+    response: Response,
+    pagination: TracksPagination = Depends(),
+    ym_client: CachedYMClient = Depends(get_ymclient),
+) -> AlbumDTO:
     """
     Asynchronous function to get an album from Yandex Music.
 
     This function uses the Yandex Music API to fetch an album by its ID. It fetches
-    the album along with its tracks.
+    the album along with its tracks, which can be paginated.
+
+    A page that is not the last one has the 'X-Next-Cursor' header. The cursor
+    points to a volume of the album and a track in it, so the next page starts
+    right there without walking the previous volumes.
 
     :param album_id: The ID of the album to fetch.
+    :param response: FastAPI response.
+    :param pagination: Pagination parameters of the tracks.
     :param ym_client: An instance of the Yandex Music client.
     :return: An AlbumDTO object containing the album data and its tracks.
     """
-    return await ym_client.get_album_with_tracks(album_id)
+    start_volume, start_index = pagination.start(size=2)
+    album = await ym_client.get_album_with_tracks(album_id)
+    tracks, next_cursor = pagination.page(
+        iter_album_tracks(album.volumes, start_volume, start_index),
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return AlbumDTO.project(album, tracks=tracks)
+
+
+@router.get(
+    "/albums/{album_id}/tracks",
+    response_class=StreamingResponse,
+)
+async def stream_album_tracks(
+    album_id: int,
+    ym_client: CachedYMClient = Depends(get_ymclient),
+) -> StreamingResponse:
+    """
+    Asynchronous function to stream the tracks of an album from Yandex Music.
+
+    The tracks of all volumes are sent as newline delimited JSON, one track DTO
+    per line.
+
+    :param album_id: The ID of the album.
+    :param ym_client: An instance of the Yandex Music client.
+    :return: Streaming response with the tracks of the album.
+    """
+    album = await ym_client.get_album_with_tracks(album_id)
+    return stream_tracks(track for _, track in iter_album_tracks(album.volumes))
@@ -0,0 +1,17 @@
+from fefu_music.db.dao.refresh_token_dao import RefreshTokenDAO
+from fefu_music.settings import settings
+from fefu_music.tkq import broker
+
+
+@broker.task(schedule=[{"cron": settings.refresh_token_purge_cron}])
+async def purge_expired_refresh_tokens() -> None:
+    """
+    Delete the expired refresh tokens.
+
+    They are deleted in batches of 'refresh_token_purge_batch_size' tokens
+    until a batch is not full, so every statement holds its locks briefly.
+    """
+    batch_size = settings.refresh_token_purge_batch_size
+    deleted = batch_size
+    while deleted == batch_size:
+        deleted = await RefreshTokenDAO.delete_expired(limit=batch_size)
@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Response
 from starlette import status
 
-from fefu_music.db.dao.refresh_token_dao import RefreshTokenDAO
+from fefu_music.db.dao.refresh_token_dao import RotatedRefreshToken
 from fefu_music.db.dao.user_dao import UserDAO
-from fefu_music.db.models.refresh_token_model import RefreshTokenModel
 from fefu_music.services.auth.schema import TokenDTO, User
-from fefu_music.services.auth.utils import create_and_get_access_data
+from fefu_music.services.auth.utils import (
+    cache_user,
+    create_access_token,
+    create_and_get_access_data,
+    get_current_user,
+    refresh_security,
+)
 from fefu_music.services.github.dependencies import get_github_user_data
 from fefu_music.services.github.schema import GithubUser
-from fefu_music.web.api.auth.dependencies import validate_refresh_token
+from fefu_music.web.api.auth.dependencies import rotate_refresh_token
 
 router = APIRouter()
 
@@ -26,9 +31,9 @@ async def request_access_token(
     """
     Asynchronous function to request an access token.
 
-    This function uses the GitHub user data to check if the user exists in the database.
-    If the user does not exist, a new user is created. Then, an access token is created
-    and returned.
+    This function uses the GitHub user data to create the user or to refresh the name
+    and the avatar of the existing one by a single statement. Then, an access token
+    is created and returned.
 
     :param response: FastAPI response.
     :param github_user: The GitHub user data obtained from the GitHub API.
@@ -43,14 +48,13 @@ async def request_access_token(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email in github profile is required",
         )
-    user_model = await user_dao.get_by_email(github_user.email)
-    if user_model is None:
-        user_model = await user_dao.create(
-            name=github_user.name if github_user.name is not None else "Fefu Music",
-            email=github_user.email,
-            avatar_url=str(github_user.avatar_url),
-        )
+    user_model = await user_dao.upsert_by_email(
+        name=github_user.name if github_user.name is not None else "Fefu Music",
+        email=github_user.email,
+        avatar_url=str(github_user.avatar_url),
+    )
     user_dto = User.model_validate(user_model)
+    cache_user(user_dto)
 
     access_token = await create_and_get_access_data(
         response=response,
@@ -65,28 +69,31 @@ async def request_access_token(
 )
 async def refresh_token_from_cookies(
     response: Response,
-    refresh_token: RefreshTokenModel = Depends(validate_refresh_token),
-    refresh_token_dao: RefreshTokenDAO = Depends(),
+    refresh_token: RotatedRefreshToken = Depends(rotate_refresh_token),
 ) -> TokenDTO:
     """
     Asynchronous function to refresh an access token.
 
     This function uses the refresh token provided in the cookies to generate a new
     access token.
-    The old refresh token is deleted from the database, and a new one
-    is created and set in the cookies. The function returns the new access token.
+    The old refresh token is replaced in the database with a new one, which is
+    set in the cookies. The function returns the new access token.
 
     :param response: FastAPI response.
-    :param refresh_token: The refresh token obtained from the cookies.
-    :param refresh_token_dao: The RefreshToken Data Access Object (DAO)
-                              used to interact with the database.
+    :param refresh_token: The new refresh token with its user.
     :return: A TokenDTO object containing the new access token.
     """
-    await refresh_token_dao.delete_by_id(refresh_token=refresh_token.id)
+    refresh_security.set_refresh_cookie(response, refresh_token.id)
     user_dto = User.model_validate(refresh_token.user)
+    return TokenDTO(access_token=create_access_token(user_dto))
 
-    access_token = await create_and_get_access_data(
-        response=response,
-        user_dto=user_dto,
-    )
-    return TokenDTO(access_token=access_token)
+
+@router.get(path="/oauth/me", response_model=User)
+async def get_current_user_profile(user: User = Depends(get_current_user)) -> User:
+    """
+    Get the profile of the user of the access token.
+
+    :param user: The user of the access token.
+    :return: The user.
+    """
+    return user
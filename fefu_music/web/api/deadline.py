@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+
+from fefu_music.services.yandex_music_api import deadline_scope
+from fefu_music.settings import settings
+
+RouteHandler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+class DeadlineRoute(APIRoute):
+    """
+    Route answering within its latency budget.
+
+    The budget of the route is taken from 'route_latency_budget' setting by
+    the route name, 'route_latency_budget_default' is used for the rest.
+    The deadline of the request is passed down to the Yandex Music calls,
+    which wait for the upstream only for the time left.
+
+    When the budget is exhausted, the handler is cancelled and the request is
+    answered with 504. Streaming responses are bound until they start only.
+    """
+
+    def get_route_handler(self) -> RouteHandler:
+        """
+        Wrap the route handler with the latency budget.
+
+        :return: The route handler.
+        """
+        route_handler = super().get_route_handler()
+        budget = settings.route_latency_budget.get(
+            self.name,
+            settings.route_latency_budget_default,
+        )
+
+        async def deadline_route_handler(request: Request) -> Response:  # noqa: WPS430
+            with deadline_scope(budget):
+                try:
+                    return await asyncio.wait_for(route_handler(request), budget)
+                except asyncio.TimeoutError:
+                    raise HTTPException(
+                        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                        detail="Yandex Music did not answer in time",
+                    )
+
+        return deadline_route_handler
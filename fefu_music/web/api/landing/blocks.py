@@ -0,0 +1,130 @@
+from typing import Any, Awaitable, Callable, Dict, List
+
+from pydantic import TypeAdapter
+from ymdantic import enums
+
+from fefu_music.db.dao.landing_block_dao import LandingBlockDAO
+from fefu_music.db.models.landing_block_model import LandingBlockModel
+from fefu_music.services.yandex_music_api import CachedYMClient
+from fefu_music.settings import settings
+from fefu_music.web.api.landing.schema import LikedPlaylistDTO, NewReleaseDTO
+from fefu_music.web.api.schema import TrackShortDTO
+
+CHART = "chart"
+NEW_RELEASES = "new-releases"
+NEW_YEAR_PLAYLISTS = "new-year-playlists"
+
+BlockFetcher = Callable[[CachedYMClient], Awaitable[Any]]
+
+tracks_adapter: TypeAdapter[List[TrackShortDTO]] = TypeAdapter(List[TrackShortDTO])
+new_releases_adapter: TypeAdapter[List[NewReleaseDTO]] = TypeAdapter(
+    List[NewReleaseDTO],
+)
+liked_playlists_adapter: TypeAdapter[List[LikedPlaylistDTO]] = TypeAdapter(
+    List[LikedPlaylistDTO],
+)
+
+
+def version_key(key: str, version: int) -> str:
+    """
+    Get the key of a saved version of a landing block.
+
+    :param key: The key of the landing block.
+    :param version: The version of the block.
+    :return: The key of the version.
+    """
+    return f"{key}@{version}"
+
+
+async def fetch_chart(yandex_music_client: CachedYMClient) -> Dict[str, Any]:
+    """
+    Fetch the whole chart and serialize its tracks.
+
+    The tracks are projected to DTOs once, so every page of the chart is
+    a slice of this list.
+
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: The revision of the chart and serialized track DTOs.
+    """
+    chart_info = await yandex_music_client.get_chart()
+    tracks = [
+        TrackShortDTO.project(chart_track.track)
+        for chart_track in chart_info.chart.tracks
+    ]
+    return {
+        "revision": chart_info.chart.revision,
+        "tracks": tracks_adapter.dump_python(tracks, mode="json"),
+    }
+
+
+async def fetch_new_releases(
+    yandex_music_client: CachedYMClient,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the new album releases and serialize them.
+
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: Serialized album data transfer objects (DTOs).
+    """
+    new_releases = await yandex_music_client.get_editorial_new_releases(
+        block_type=enums.EditorialNewReleasesEnum.ALL_ALBUMS_OF_THE_MONTH,
+    )
+    return new_releases_adapter.dump_python(
+        [NewReleaseDTO.project(new_release) for new_release in new_releases],
+        mode="json",
+        exclude_none=True,
+    )
+
+
+async def fetch_new_year_playlists(
+    yandex_music_client: CachedYMClient,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the new year playlists and serialize them.
+
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: Serialized playlist data transfer objects (DTOs).
+    """
+    playlists = await yandex_music_client.get_editorial_compilation(
+        block_type=enums.EditorialCompilationEnum.ALL_NEWYEAR,
+    )
+    liked_playlists = [
+        LikedPlaylistDTO.project(playlist)  # type: ignore[arg-type]
+        for playlist in playlists
+    ]
+    return liked_playlists_adapter.dump_python(
+        liked_playlists,
+        mode="json",
+    )
+
+
+LANDING_BLOCKS: Dict[str, BlockFetcher] = {
+    CHART: fetch_chart,
+    NEW_RELEASES: fetch_new_releases,
+    NEW_YEAR_PLAYLISTS: fetch_new_year_playlists,
+}
+
+
+async def refresh_block(
+    key: str,
+    yandex_music_client: CachedYMClient,
+) -> LandingBlockModel:
+    """
+    Fetch a landing block from Yandex Music and save it to the store.
+
+    :param key: The key of the landing block.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: The saved landing block.
+    """
+    payload = await LANDING_BLOCKS[key](yandex_music_client)
+    if key == CHART:
+        # Pages requested by cursor keep reading the chart they started with.
+        await LandingBlockDAO.save(
+            key=version_key(key, payload["revision"]),
+            payload=payload,
+        )
+        await LandingBlockDAO.delete_old_versions(
+            key=key,
+            keep=settings.landing_chart_versions,
+        )
+    return await LandingBlockDAO.save(key=key, payload=payload)
@@ -1,10 +1,17 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, HttpUrl, model_validator
-from ymdantic.models import LandingAlbum, LandingArtist, NewRelease
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import Self
+from ymdantic.models import (
+    LandingAlbum,
+    LandingArtist,
+    LandingLikedPlaylistItemData,
+    NewRelease,
+)
 
-from fefu_music.web.api.schema import PlaylistShortDTO
+from fefu_music.services.yandex_music_api import utils
+from fefu_music.web.api.schema import PlaylistShortDTO, TrustedUrl
 
 
 class LandingAlbumDTO(BaseModel):
@@ -14,19 +21,22 @@ class LandingAlbumDTO(BaseModel):
 
     id: int
     title: str
-    cover_url: HttpUrl
-    album_type: Optional[Literal["single"]] = None
+    cover_url: TrustedUrl
+    album_type: Optional[Literal["single", "compilation"]] = None
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: LandingAlbum) -> LandingAlbum:
+    @classmethod
+    def project(cls, album: LandingAlbum) -> Self:
         """
-        Inject cover url to object.
+        Project the album to the DTO without validation.
 
-        :param obj: The album to inject.
-        :return: The album with injected field.
+        :param album: The album to project.
+        :return: The album DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("400x400")},
+        return cls.model_construct(
+            id=album.id,
+            title=album.title,
+            cover_url=utils.cover_image_url(album.cover.uri, "400x400"),
+            album_type=album.album_type,
         )
 
 
@@ -37,18 +47,20 @@ class LandingArtistDTO(BaseModel):
 
     id: int
     name: str
-    cover_url: HttpUrl
+    cover_url: TrustedUrl
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: LandingArtist) -> LandingArtist:
+    @classmethod
+    def project(cls, artist: LandingArtist) -> Self:
         """
-        Inject cover url to object.
+        Project the artist to the DTO without validation.
 
-        :param obj: The artist to inject.
-        :return: The artist with injected field.
+        :param artist: The artist to project.
+        :return: The artist DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("100x100")},
+        return cls.model_construct(
+            id=artist.id,
+            name=artist.name,
+            cover_url=utils.cover_image_url(artist.cover.uri, "100x100"),
         )
 
 
@@ -57,21 +69,26 @@ class NewReleaseDTO(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    cover_url: HttpUrl
+    cover_url: TrustedUrl
     artists: List[LandingArtistDTO]
     album: LandingAlbumDTO
     release_date: datetime
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: NewRelease) -> NewRelease:
+    @classmethod
+    def project(cls, new_release: NewRelease) -> Self:
         """
-        Inject cover url to object.
+        Project the new release to the DTO without validation.
 
-        :param obj: The new release to inject.
-        :return: The new release with injected field.
+        :param new_release: The new release to project.
+        :return: The new release DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("400x400")},
+        return cls.model_construct(
+            cover_url=utils.cover_image_url(new_release.cover.uri, "400x400"),
+            artists=[
+                LandingArtistDTO.project(artist) for artist in new_release.artists
+            ],
+            album=LandingAlbumDTO.project(new_release.album),
+            release_date=new_release.release_date,
         )
 
 
@@ -80,3 +97,16 @@ class LikedPlaylistDTO(BaseModel):
 
     playlist: PlaylistShortDTO
     likes_count: int
+
+    @classmethod
+    def project(cls, liked_playlist: LandingLikedPlaylistItemData) -> Self:
+        """
+        Project the liked playlist to the DTO without validation.
+
+        :param liked_playlist: The liked playlist to project.
+        :return: The liked playlist DTO.
+        """
+        return cls.model_construct(
+            playlist=PlaylistShortDTO.project(liked_playlist.playlist),
+            likes_count=liked_playlist.likes_count,
+        )
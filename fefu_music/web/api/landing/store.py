@@ -0,0 +1,151 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from tortoise import timezone
+
+from fefu_music.db.dao.landing_block_dao import LandingBlockDAO
+from fefu_music.services.yandex_music_api import CachedYMClient
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.services.yandex_music_api.single_flight import SingleFlight
+from fefu_music.settings import settings
+from fefu_music.web.api.landing import blocks
+from fefu_music.web.api.landing.tasks import refresh_landing_block
+
+
+@dataclass
+class LandingBlock:
+    """Local copy of a landing block."""
+
+    payload: Any
+    updated_at: datetime
+    loaded_at: float
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        Check whether the block is past its soft time to live.
+
+        :return: True if the block should be refreshed.
+        """
+        soft_ttl = timedelta(seconds=settings.landing_soft_ttl)
+        return self.updated_at + soft_ttl <= timezone.now()
+
+    @property
+    def is_expired(self) -> bool:
+        """
+        Check whether the local copy should be reloaded from the database.
+
+        :return: True if the local copy is outdated.
+        """
+        return self.loaded_at + settings.landing_local_ttl <= time.monotonic()
+
+
+class LandingStore:
+    """
+    Stale-while-revalidate store of the landing blocks.
+
+    Blocks are pre-fetched by taskiq tasks into the database, every worker keeps
+    a local copy of them. A block past its soft time to live is still served,
+    while a background task refreshes it.
+
+    Saved versions of a block never change, so their local copies are not
+    reloaded from the database during the soft time to live.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: Dict[str, LandingBlock] = {}
+        self._versions = TTLCache(max_size=settings.landing_chart_versions)
+        self._refresh_requested_at: Dict[str, float] = {}
+        self._loads = SingleFlight()
+
+    async def get(self, key: str, yandex_music_client: CachedYMClient) -> Any:
+        """
+        Get the payload of a landing block.
+
+        :param key: The key of the landing block.
+        :param yandex_music_client: Client used when the block was never fetched.
+        :return: The serialized content of the block.
+        """
+        landing_block = self._blocks.get(key)
+        if landing_block is None or landing_block.is_expired:
+            landing_block = await self._reload(key, yandex_music_client)
+        if landing_block.is_stale:
+            await self._request_refresh(key)
+        return landing_block.payload
+
+    async def get_version(self, key: str, version: int) -> Optional[Any]:
+        """
+        Get the payload of a saved version of a landing block.
+
+        :param key: The key of the landing block.
+        :param version: The version of the block.
+        :return: The serialized content of the version if it is still saved.
+        """
+        version_key = blocks.version_key(key, version)
+        payload = self._versions.get(version_key)
+        if payload is None:
+            block_model = await LandingBlockDAO.get_by_key(version_key)
+            if block_model is None:
+                return None
+            payload = block_model.payload
+            self._versions.set(version_key, payload, ttl=settings.landing_soft_ttl)
+        return payload
+
+    async def _reload(
+        self,
+        key: str,
+        yandex_music_client: CachedYMClient,
+    ) -> LandingBlock:
+        """
+        Reload the local copy once for all concurrent requests.
+
+        :param key: The key of the landing block.
+        :param yandex_music_client: An instance of the Yandex Music client.
+        :return: The local copy of the block.
+        """
+        return await self._loads.do(
+            key,
+            lambda: self._load(key, yandex_music_client),
+        )
+
+    async def _load(
+        self,
+        key: str,
+        yandex_music_client: CachedYMClient,
+    ) -> LandingBlock:
+        """
+        Load the block from the database, fetching it on a cold start.
+
+        :param key: The key of the landing block.
+        :param yandex_music_client: An instance of the Yandex Music client.
+        :return: The local copy of the block.
+        """
+        block_model = await LandingBlockDAO.get_by_key(key)
+        if block_model is None:
+            block_model = await blocks.refresh_block(key, yandex_music_client)
+        landing_block = LandingBlock(
+            payload=block_model.payload,
+            updated_at=block_model.updated_at,
+            loaded_at=time.monotonic(),
+        )
+        self._blocks[key] = landing_block
+        return landing_block
+
+    async def _request_refresh(self, key: str) -> None:
+        """
+        Send the refresh task, at most once per soft time to live.
+
+        :param key: The key of the landing block.
+        """
+        requested_at = self._refresh_requested_at.get(key)
+        now = time.monotonic()
+        if requested_at is not None:
+            if requested_at + settings.landing_soft_ttl > now:
+                return
+        self._refresh_requested_at[key] = now
+        await refresh_landing_block.kiq(key)
+
+
+landing_store = LandingStore()
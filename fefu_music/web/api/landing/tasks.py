@@ -0,0 +1,33 @@
+from taskiq import TaskiqDepends
+
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.settings import settings
+from fefu_music.tkq import broker
+from fefu_music.web.api.landing import blocks
+
+
+@broker.task(schedule=[{"cron": settings.landing_refresh_cron}])
+async def refresh_landing_blocks(
+    yandex_music_client: CachedYMClient = TaskiqDepends(get_ymclient),
+) -> None:
+    """
+    Pre-fetch all landing blocks into the store.
+
+    :param yandex_music_client: An instance of the Yandex Music client.
+    """
+    for key in blocks.LANDING_BLOCKS:
+        await blocks.refresh_block(key, yandex_music_client)
+
+
+@broker.task
+async def refresh_landing_block(
+    key: str,
+    yandex_music_client: CachedYMClient = TaskiqDepends(get_ymclient),
+) -> None:
+    """
+    Refresh one landing block in the store.
+
+    :param key: The key of the landing block.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    """
+    await blocks.refresh_block(key, yandex_music_client)
@@ -1,13 +1,17 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
-from ymdantic import YMClient, enums, models
+from fastapi.responses import UJSONResponse
 
-from fefu_music.services.yandex_music_api.dependencies import get_ymclient
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.web.api.landing import blocks
 from fefu_music.web.api.landing.schema import LikedPlaylistDTO, NewReleaseDTO
+from fefu_music.web.api.landing.store import landing_store
+from fefu_music.web.api.pagination import decode_cursor, encode_cursor
+from fefu_music.web.api.response_cache import ResponseCacheRoute
 from fefu_music.web.api.schema import TrackShortDTO
 
-router = APIRouter()
+router = APIRouter(route_class=ResponseCacheRoute)
 
 
 @router.get(
@@ -17,26 +21,42 @@ router = APIRouter()
 async def get_chart(
     limit: int = Query(default=10, ge=1, le=100),  # noqa: WPS432
     offset: int = Query(default=0, ge=0, le=100),  # noqa: WPS432
-    yandex_music_client: YMClient = Depends(get_ymclient),
-) -> List[models.TrackType]:
+    cursor: Optional[str] = Query(default=None),
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> UJSONResponse:
     """
     Asynchronous function to get a chart of tracks from Yandex Music.
 
-    This function uses the Yandex Music API to fetch a chart of tracks. The number of
-    tracks fetched can be controlled by the 'limit' parameter. The 'offset' parameter
-    can be used to skip a certain number of tracks from the start.
+    The whole chart is pre-fetched into the landing store, so this function only
+    slices it. The number of tracks returned can be controlled by the 'limit'
+    parameter. The 'offset' parameter can be used to skip a certain number of
+    tracks from the start.
+
+    Every page that is not the last one has the 'X-Next-Cursor' header. Passing
+    it as the 'cursor' parameter returns the next page of the same chart
+    revision, even if the chart was refreshed in between.
 
     :param limit: The maximum number of tracks to return. Default to 10.
                   Must be between 1 and 100.
     :param offset: The number of tracks to skip from the start. Default to 0.
                    Must be between 0 and 100.
+    :param cursor: The cursor of the page, overrides the offset.
     :param yandex_music_client: An instance of the Yandex Music client.
     :return: A list of track data transfer objects (DTOs).
     """
-    chart_info = await yandex_music_client.get_chart(
-        limit=limit if offset == 0 else None,
-    )
-    return [track.track for track in chart_info.chart.tracks[offset : offset + limit]]
+    revision = None
+    if cursor is not None:
+        revision, offset = decode_cursor(cursor, size=2)
+
+    chart = await landing_store.get(blocks.CHART, yandex_music_client)
+    if revision is not None:
+        chart = await landing_store.get_version(blocks.CHART, revision) or chart
+
+    page_end = offset + limit
+    response = UJSONResponse(chart["tracks"][offset:page_end])
+    if page_end < len(chart["tracks"]):
+        response.headers["X-Next-Cursor"] = encode_cursor(chart["revision"], page_end)
+    return response
 
 
 @router.get(
@@ -47,14 +67,15 @@ async def get_chart(
 async def get_new_releases(
     limit: int = Query(default=10, ge=1, le=50),  # noqa: WPS432
     offset: int = Query(default=0, ge=0, le=50),  # noqa: WPS432
-    yandex_music_client: YMClient = Depends(get_ymclient),
-) -> List[models.NewRelease]:
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> UJSONResponse:
     """
     Asynchronous function to get new album releases from Yandex Music.
 
-    This function uses the Yandex Music API to fetch new album releases. The number of
-    albums fetched can be controlled by the 'limit' parameter. The 'offset' parameter
-    can be used to skip a certain number of albums from the start.
+    The new releases are pre-fetched into the landing store, so this function only
+    slices them. The number of albums returned can be controlled by the 'limit'
+    parameter. The 'offset' parameter can be used to skip a certain number of
+    albums from the start.
 
     :param limit: The maximum number of albums to return. Default to 10.
                   Must be between 1 and 50.
@@ -63,10 +84,8 @@ async def get_new_releases(
     :param yandex_music_client: An instance of the Yandex Music client.
     :return: A list of album data transfer objects (DTOs).
     """
-    new_releases = await yandex_music_client.get_editorial_new_releases(
-        block_type=enums.EditorialNewReleasesEnum.ALL_ALBUMS_OF_THE_MONTH,
-    )
-    return new_releases[offset : offset + limit]
+    new_releases = await landing_store.get(blocks.NEW_RELEASES, yandex_music_client)
+    return UJSONResponse(new_releases[offset : offset + limit])
 
 
 @router.get(
@@ -74,16 +93,18 @@ async def get_new_releases(
     response_model=List[LikedPlaylistDTO],
 )
 async def get_new_year_playlists(
-    yandex_music_client: YMClient = Depends(get_ymclient),
-) -> List[models.LandingLikedPlaylistItemData]:
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> UJSONResponse:
     """
     Asynchronous function to get new year playlists from Yandex Music.
 
-    This function uses the Yandex Music API to fetch new year playlists.
+    The playlists are pre-fetched into the landing store.
 
     :param yandex_music_client: An instance of the Yandex Music client.
     :return: A list of playlist data transfer objects (DTOs).
     """
-    return await yandex_music_client.get_editorial_compilation(  # type: ignore
-        block_type=enums.EditorialCompilationEnum.ALL_NEWYEAR,
+    playlists = await landing_store.get(
+        blocks.NEW_YEAR_PLAYLISTS,
+        yandex_music_client,
     )
+    return UJSONResponse(playlists)
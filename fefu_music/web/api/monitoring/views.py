@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from fefu_music.services.metrics import render_metrics
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.web.load_shedding import loop_lag_monitor
 
 router = APIRouter()
 
@@ -10,3 +17,42 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/health/yandex-music-tokens")
+def get_yandex_music_tokens_usage(
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> List[Dict[str, Any]]:
+    """
+    Get the usage of every Yandex Music token.
+
+    The tokens are masked, only their last characters are shown.
+
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: Requests in flight, sent and rate limited of every token.
+    """
+    return yandex_music_client.client.usage()
+
+
+@router.get("/health/loop-lag")
+def get_loop_lag() -> Dict[str, float]:
+    """
+    Get the lag of the event loop of the worker.
+
+    :return: The last and the maximum measured lag in seconds.
+    """
+    return {"lag": loop_lag_monitor.lag, "max_lag": loop_lag_monitor.max_lag}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> str:
+    """
+    Get the metrics of the worker in the text format of Prometheus.
+
+    Every worker keeps its own metrics, they are not aggregated.
+
+    :return: The latency of the routes, Yandex Music and database queries,
+        the hit ratios of the caches, the requests in flight and the event
+        loop lag.
+    """
+    return render_metrics()
@@ -0,0 +1,96 @@
+import base64
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+from ymdantic.models import TrackType
+
+from fefu_music.services.yandex_music_api.utils import PositionedTrack
+
+
+def encode_cursor(*positions: int) -> str:
+    """
+    Encode positions into an opaque pagination cursor.
+
+    :param positions: Positions identifying the start of the next page.
+    :return: The cursor.
+    """
+    raw_cursor = ".".join(str(position) for position in positions)
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[int, ...]:
+    """
+    Decode positions from a pagination cursor.
+
+    :param cursor: The cursor returned with the previous page.
+    :param size: The number of positions encoded in the cursor.
+    :raises HTTPException: If the cursor is malformed.
+    :return: The positions.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw_cursor = base64.urlsafe_b64decode(cursor + padding).decode()
+        positions = tuple(int(position) for position in raw_cursor.split("."))
+    except ValueError:
+        positions = ()
+    if len(positions) != size or min(positions) < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return positions
+
+
+class TracksPagination:
+    """
+    Pagination parameters of track lists.
+
+    The page starts at the cursor (the first track by default), skips 'offset'
+    tracks and contains at most 'limit' tracks. All tracks are returned when
+    the limit is not set.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(default=None, ge=1, le=1000),  # noqa: WPS432
+        offset: int = Query(default=0, ge=0),
+        cursor: Optional[str] = Query(default=None),
+    ) -> None:
+        self.limit = limit
+        self.offset = offset
+        self.cursor = cursor
+
+    def start(self, size: int) -> Tuple[int, ...]:
+        """
+        Get the position the page starts from.
+
+        :param size: The number of indexes in a position.
+        :return: The position decoded from the cursor or the first position.
+        """
+        if self.cursor is None:
+            return (0,) * size
+        return decode_cursor(self.cursor, size=size)
+
+    def page(
+        self,
+        positioned_tracks: Iterable[PositionedTrack],
+    ) -> Tuple[List[TrackType], Optional[str]]:
+        """
+        Take the page of tracks.
+
+        Only the tracks of the page and the one after it are consumed.
+
+        :param positioned_tracks: Tracks with their positions, from the start.
+        :return: The tracks of the page and the cursor of the next page if any.
+        """
+        page_end = None
+        if self.limit is not None:
+            # One more track tells whether there is a next page.
+            page_end = self.offset + self.limit + 1
+        page = list(islice(positioned_tracks, self.offset, page_end))
+        next_cursor = None
+        if self.limit is not None and len(page) > self.limit:
+            next_position, _ = page.pop()
+            next_cursor = encode_cursor(*next_position)
+        return [track for _, track in page], next_cursor
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from pydantic import ConfigDict, computed_field, model_validator
-from ymdantic.models import Playlist
+from pydantic import ConfigDict, computed_field
+from typing_extensions import Self
+from ymdantic.models import Playlist, TrackType
 
 from fefu_music.services.yandex_music_api import utils
 from fefu_music.web.api.schema import PlaylistShortDTO, TrackShortDTO
@@ -13,7 +14,7 @@ class PlaylistDTO(PlaylistShortDTO):
 
     model_config = ConfigDict(from_attributes=True)
 
-    description: str
+    description: Optional[str] = None
     track_count: int
     duration_ms: int
     modified: datetime
@@ -31,14 +32,32 @@ class PlaylistDTO(PlaylistShortDTO):
         """
         return utils.format_duration(self.duration_ms)
 
-    @model_validator(mode="before")
-    def tracks_validator(cls, obj: Playlist) -> Playlist:
+    @classmethod
+    def project(  # type: ignore[override]
+        cls,
+        playlist: Playlist,
+        tracks: Optional[Sequence[TrackType]] = None,
+    ) -> Self:
         """
-        Validate the tracks.
+        Project the playlist with its tracks to the DTO without validation.
 
-        :param obj: The album to validate.
-        :return: The validated album.
+        :param playlist: The playlist to project.
+        :param tracks: A page of the tracks, all tracks of the playlist by default.
+        :return: The playlist DTO.
         """
-        return obj.model_copy(
-            update={"tracks": [playlist_track.track for playlist_track in obj.tracks]},
+        if tracks is None:
+            tracks = [playlist_track.track for playlist_track in playlist.tracks]
+        similar_playlists = playlist.similar_playlists or []
+        return super().project(
+            playlist,
+            description=playlist.description,
+            track_count=playlist.track_count,
+            duration_ms=playlist.duration_ms,
+            modified=playlist.modified,
+            likes_count=playlist.likes_count,
+            tracks=[TrackShortDTO.project(track) for track in tracks],
+            similar_playlists=[
+                PlaylistShortDTO.project(similar_playlist)
+                for similar_playlist in similar_playlists
+            ],
         )
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
-from ymdantic import YMClient, models
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 
-from fefu_music.services.yandex_music_api import get_ymclient
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.services.yandex_music_api.utils import iter_playlist_tracks
+from fefu_music.web.api.pagination import TracksPagination
 from fefu_music.web.api.playlists.schema import PlaylistDTO
+from fefu_music.web.api.response_cache import ResponseCacheRoute
+from fefu_music.web.api.streaming import stream_tracks
 
-router = APIRouter()
+router = APIRouter(route_class=ResponseCacheRoute)
 
 
 @router.get(
@@ -14,19 +18,58 @@ router = APIRouter()
 async def get_playlist(
     user_id: int,
     kind: int,
-    yandex_music_client: YMClient = Depends(get_ymclient),
-) -> models.Playlist:
+    response: Response,
+    pagination: TracksPagination = Depends(),
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> PlaylistDTO:
     """
     Asynchronous function to get a playlist from Yandex Music.
 
     This function uses the Yandex Music API to fetch a playlist by its kind and user ID.
+    The tracks of the playlist can be paginated, a page that is not the last one
+    has the 'X-Next-Cursor' header.
 
     :param user_id: The ID of the user.
     :param kind: The kind of the playlist.
+    :param response: FastAPI response.
+    :param pagination: Pagination parameters of the tracks.
     :param yandex_music_client: An instance of the Yandex Music client.
-    :return: A Playlist object containing the playlist data.
+    :return: A PlaylistDTO object containing the playlist data.
     """
-    return await yandex_music_client.get_playlist(
+    start_index = pagination.start(size=1)[0]
+    playlist = await yandex_music_client.get_playlist(
         user_id=user_id,
         playlist_id=kind,
     )
+    tracks, next_cursor = pagination.page(
+        iter_playlist_tracks(playlist.tracks, start_index),
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return PlaylistDTO.project(playlist, tracks=tracks)
+
+
+@router.get(
+    "/users/{user_id}/playlists/{kind}/tracks",
+    response_class=StreamingResponse,
+)
+async def stream_playlist_tracks(
+    user_id: int,
+    kind: int,
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> StreamingResponse:
+    """
+    Asynchronous function to stream the tracks of a playlist from Yandex Music.
+
+    The tracks are sent as newline delimited JSON, one track DTO per line.
+
+    :param user_id: The ID of the user.
+    :param kind: The kind of the playlist.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: Streaming response with the tracks of the playlist.
+    """
+    playlist = await yandex_music_client.get_playlist(
+        user_id=user_id,
+        playlist_id=kind,
+    )
+    return stream_tracks(track for _, track in iter_playlist_tracks(playlist.tracks))
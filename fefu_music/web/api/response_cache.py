@@ -0,0 +1,167 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from fefu_music.services.metrics import record_cache_lookup
+from fefu_music.services.yandex_music_api import track_staleness
+from fefu_music.services.yandex_music_api.cache import TTLCache
+from fefu_music.settings import settings
+from fefu_music.web.api.deadline import DeadlineRoute, RouteHandler
+
+# Headers computed from the body again when the cached response is sent.
+SKIPPED_HEADERS = frozenset(("content-length",))
+# Seconds since the oldest stale upstream response used for the response.
+STALE_AGE_HEADER = "X-Stale-Age"
+ETAG_DIGEST_SIZE = 16
+
+
+@dataclass
+class CachedResponse:
+    """Encoded response kept in the response cache."""
+
+    body: bytes
+    headers: Dict[str, str]
+    etag: str
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """
+        Check whether the client already has this response.
+
+        :param if_none_match: The value of the 'If-None-Match' header.
+        :return: True if one of the entity tags matches the response.
+        """
+        if if_none_match is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses the weak comparison.
+        entity_tags = (tag.strip() for tag in if_none_match.split(","))
+        return self.etag in {tag.removeprefix("W/") for tag in entity_tags}
+
+
+response_cache = TTLCache(max_size=settings.response_cache_size)
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Make a strong entity tag of the response body.
+
+    :param body: The encoded response body.
+    :return: The entity tag.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=ETAG_DIGEST_SIZE).hexdigest()}"'
+
+
+class ResponseCacheRoute(DeadlineRoute):
+    """
+    Route keeping encoded responses in the response cache.
+
+    Successful responses of routes listed in 'response_cache_max_age' setting
+    are cached as bytes per path and query, so repeated requests skip
+    the dependencies, the validation and the encoding of the response.
+
+    Responses carry a strong ETag and 'Cache-Control' with the max age of
+    the route. Requests with a matching 'If-None-Match' header are answered
+    with 304 without a body.
+
+    Responses built from stale upstream responses, used while Yandex Music
+    fails, carry the 'X-Stale-Age' header and are not cached. Cached responses
+    are sent without spending the latency budget of the route.
+    """
+
+    def get_route_handler(self) -> RouteHandler:
+        """
+        Wrap the route handler with the response cache.
+
+        :return: The route handler.
+        """
+        route_handler = self._mark_stale(super().get_route_handler())
+        max_age = settings.response_cache_max_age.get(self.name)
+        if max_age is None:
+            return route_handler
+
+        async def cached_route_handler(request: Request) -> Response:  # noqa: WPS430
+            key = self._cache_key(request)
+            cached_response = response_cache.get(key)
+            record_cache_lookup("response", self.name, cached_response is not None)
+            if cached_response is None:
+                response = await route_handler(request)
+                if not self._is_cacheable(response):
+                    return response
+                cached_response = self._encode(response, max_age)
+                response_cache.set(key, cached_response, ttl=max_age)
+            if cached_response.matches(request.headers.get("If-None-Match")):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={
+                        "ETag": cached_response.etag,
+                        "Cache-Control": cached_response.headers["cache-control"],
+                    },
+                )
+            return Response(
+                content=cached_response.body,
+                headers=cached_response.headers,
+            )
+
+        return cached_route_handler
+
+    def _mark_stale(self, route_handler: RouteHandler) -> RouteHandler:
+        """
+        Wrap the route handler to mark responses built from stale data.
+
+        :param route_handler: The route handler.
+        :return: The route handler adding the staleness header.
+        """
+
+        async def stale_route_handler(request: Request) -> Response:  # noqa: WPS430
+            with track_staleness() as staleness:
+                response = await route_handler(request)
+                if staleness.age is not None:
+                    response.headers[STALE_AGE_HEADER] = str(int(staleness.age))
+            return response
+
+        return stale_route_handler
+
+    def _cache_key(self, request: Request) -> Hashable:
+        """
+        Get the key of the request in the response cache.
+
+        :param request: The request.
+        :return: The key made of the route, the path and the sorted query.
+        """
+        query = tuple(sorted(request.query_params.multi_items()))
+        return (self.name, request.url.path, query)
+
+    def _is_cacheable(self, response: Response) -> bool:
+        """
+        Check whether the response of the route can be cached.
+
+        :param response: The response of the route.
+        :return: True for fresh successful responses with the body in memory.
+        """
+        if isinstance(response, StreamingResponse):
+            return False
+        if STALE_AGE_HEADER in response.headers:
+            return False
+        return response.status_code == status.HTTP_200_OK
+
+    def _encode(self, response: Response, max_age: int) -> CachedResponse:
+        """
+        Make a cached response from the response of the route.
+
+        :param response: The response of the route.
+        :param max_age: Seconds the response can be cached for.
+        :return: The cached response.
+        """
+        etag = make_etag(response.body)
+        headers = {
+            header: header_value
+            for header, header_value in response.headers.items()
+            if header not in SKIPPED_HEADERS
+        }
+        headers["etag"] = etag
+        headers["cache-control"] = f"public, max-age={max_age}"
+        return CachedResponse(body=response.body, headers=headers, etag=etag)
@@ -1,12 +1,20 @@
 from datetime import datetime
-from typing import List, Literal, Optional, Union
+from typing import Annotated, Any, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, HttpUrl, computed_field, model_validator
-from ymdantic.models import Album, Artist, LandingArtist, TrackType
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing_extensions import Self
+from ymdantic.models import Album, Artist, LandingArtist, Playlist, TrackType
+from ymdantic.models.landing.playlist import LandingPlaylist
+from ymdantic.models.playlists.playlist import ShortPlaylist
 
 from fefu_music.services.yandex_music_api import utils
 
 ArtistType = Union[LandingArtist, Artist]
+PlaylistType = Union[Playlist, ShortPlaylist, LandingPlaylist]
+
+# URLs built from the data of Yandex Music are trusted and not parsed again.
+# They are still documented as URIs.
+TrustedUrl = Annotated[str, Field(json_schema_extra={"format": "uri"})]
 
 
 class ArtistShortDTO(BaseModel):
@@ -16,18 +24,23 @@ class ArtistShortDTO(BaseModel):
 
     id: int
     name: str
-    cover_url: Optional[HttpUrl] = None
+    cover_url: Optional[TrustedUrl] = None
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: Artist) -> Artist:
+    @classmethod
+    def project(cls, artist: ArtistType) -> Self:
         """
-        Inject cover url to object.
+        Project the artist to the DTO without validation.
 
-        :param obj: The artist to inject.
-        :return: The artist with injected field.
+        :param artist: The artist to project.
+        :return: The artist DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("100x100")},
+        cover_uri = None
+        if artist.cover is not None:
+            cover_uri = artist.cover.uri
+        return cls.model_construct(
+            id=artist.id,
+            name=artist.name,
+            cover_url=utils.cover_image_url(cover_uri, "100x100"),
         )
 
 
@@ -48,22 +61,10 @@ class TrackShortDTO(BaseModel):
         "comment",
     ]
     title: str
-    cover_url: Optional[HttpUrl] = None
+    cover_url: Optional[TrustedUrl] = None
     duration_ms: int
     artists: List[ArtistShortDTO]
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: TrackType) -> TrackType:
-        """
-        Inject cover url to object.
-
-        :param obj: The track to inject.
-        :return: The track with injected field.
-        """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("100x100")},
-        )
-
     @computed_field  # type: ignore[misc]
     @property
     def duration_text(self) -> str:
@@ -74,6 +75,27 @@ class TrackShortDTO(BaseModel):
         """
         return utils.format_duration(self.duration_ms)
 
+    @classmethod
+    def project(cls, track: TrackType, **fields: Any) -> Self:
+        """
+        Project the track to the DTO without validation.
+
+        :param track: The track to project.
+        :param fields: Fields of the subclasses.
+        :return: The track DTO.
+        """
+        return cls.model_construct(
+            id=int(track.id),
+            available=track.available,
+            type=track.type,
+            title=track.title,
+            cover_url=utils.cover_image_url(track.cover_uri, "100x100"),
+            # Unavailable tracks may come without the duration.
+            duration_ms=track.duration_ms or 0,
+            artists=[ArtistShortDTO.project(artist) for artist in track.artists],
+            **fields,
+        )
+
 
 class AlbumShortDTO(BaseModel):
     """DTO to represent short information about the album."""
@@ -82,21 +104,28 @@ class AlbumShortDTO(BaseModel):
 
     id: int
     title: str
-    cover_url: Optional[HttpUrl] = None
+    cover_url: Optional[TrustedUrl] = None
     track_count: int
     artists: List[ArtistShortDTO]
-    release_date: datetime
+    release_date: Optional[datetime] = None
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: Album) -> Album:
+    @classmethod
+    def project(cls, album: Album, **fields: Any) -> Self:
         """
-        Inject cover url to object.
+        Project the album to the DTO without validation.
 
-        :param obj: The album to inject.
-        :return: The album with injected field.
+        :param album: The album to project.
+        :param fields: Fields of the subclasses.
+        :return: The album DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("400x400")},
+        return cls.model_construct(
+            id=album.id,
+            title=album.title,
+            cover_url=utils.cover_image_url(album.cover_uri, "400x400"),
+            track_count=album.track_count,
+            artists=[ArtistShortDTO.project(artist) for artist in album.artists],
+            release_date=album.release_date,
+            **fields,
         )
 
 
@@ -108,16 +137,22 @@ class PlaylistShortDTO(BaseModel):
     uid: int
     kind: int
     title: str
-    cover_url: HttpUrl
+    cover_url: TrustedUrl
 
-    @model_validator(mode="before")
-    def cover_url_validator(cls, obj: Album) -> Album:
+    @classmethod
+    def project(cls, playlist: PlaylistType, **fields: Any) -> Self:
         """
-        Inject cover url to object.
+        Project the playlist to the DTO without validation.
 
-        :param obj: The album to inject.
-        :return: The album with injected field.
+        :param playlist: The playlist to project.
+        :param fields: Fields of the subclasses.
+        :return: The playlist DTO.
         """
-        return obj.model_copy(
-            update={"cover_url": obj.get_cover_image_url("400x400")},
+        cover_uri = utils.playlist_cover_uri(playlist.cover)
+        return cls.model_construct(
+            uid=playlist.uid,
+            kind=playlist.kind,
+            title=playlist.title,
+            cover_url=utils.cover_image_url(cover_uri, "400x400"),
+            **fields,
         )
@@ -0,0 +1,36 @@
+from typing import AsyncIterator, Iterable
+
+from fastapi.responses import StreamingResponse
+from ymdantic.models import TrackType
+
+from fefu_music.web.api.schema import TrackShortDTO
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def stream_tracks(tracks: Iterable[TrackType]) -> StreamingResponse:
+    """
+    Stream tracks as newline delimited JSON.
+
+    Every track is projected to a DTO and sent right away, so the response
+    is never held in memory as a whole.
+
+    :param tracks: The tracks to stream.
+    :return: Streaming response with one track DTO per line.
+    """
+    return StreamingResponse(
+        _project_tracks(tracks),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+async def _project_tracks(tracks: Iterable[TrackType]) -> AsyncIterator[bytes]:
+    """
+    Project tracks to serialized DTOs one by one.
+
+    :param tracks: The tracks to project.
+    :yields: Serialized track DTO followed by a newline.
+    """
+    for track in tracks:
+        track_dto = TrackShortDTO.project(track)
+        yield f"{track_dto.model_dump_json()}\n".encode()
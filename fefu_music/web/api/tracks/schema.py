@@ -1,9 +1,17 @@
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, HttpUrl, ValidationInfo, model_validator
-from ymdantic.models import TrackType
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import Self
+from ymdantic.models import DownloadInfoDirect, TrackType
 
-from fefu_music.web.api.schema import TrackShortDTO
+from fefu_music.settings import settings
+from fefu_music.web.api.schema import TrackShortDTO, TrustedUrl
+
+
+class TrackIdsInputDTO(BaseModel):
+    """DTO for IDs of the tracks to get at once."""
+
+    ids: List[int] = Field(min_length=1, max_length=settings.tracks_batch_max_size)
 
 
 class DownloadInfoDTO(BaseModel):
@@ -13,7 +21,21 @@ class DownloadInfoDTO(BaseModel):
 
     codec: str
     bitrate_in_kbps: int
-    direct_url: HttpUrl
+    direct_url: TrustedUrl
+
+    @classmethod
+    def project(cls, download_info: DownloadInfoDirect) -> Self:
+        """
+        Project the download information to the DTO without validation.
+
+        :param download_info: The download information to project.
+        :return: The download information DTO.
+        """
+        return cls.model_construct(
+            codec=download_info.codec,
+            bitrate_in_kbps=download_info.bitrate_in_kbps,
+            direct_url=str(download_info.direct_url),
+        )
 
 
 class TrackDTO(TrackShortDTO):
@@ -21,19 +43,25 @@ class TrackDTO(TrackShortDTO):
 
     model_config = ConfigDict(from_attributes=True)
 
-    download_info: List[DownloadInfoDTO]
+    download_info: Optional[List[DownloadInfoDTO]] = None
 
-    @model_validator(mode="before")
-    def download_info_validator(cls, obj: TrackType, info: ValidationInfo) -> TrackType:
+    @classmethod
+    def project(  # type: ignore[override]
+        cls,
+        track: TrackType,
+        download_info: Optional[List[DownloadInfoDirect]] = None,
+    ) -> Self:
         """
-        Inject download information to object.
+        Project the track with its download information to the DTO.
 
-        :param obj: The track to inject.
-        :param info: The validation info.
-        :return: The track with injected field.
+        :param track: The track to project.
+        :param download_info: The download information of the track, if it
+            was requested.
+        :return: The track DTO.
         """
-        if info.context is None:
-            return obj
-        return obj.model_copy(
-            update={"download_info": info.context.get("download_info")},
+        if download_info is None:
+            return super().project(track, download_info=None)
+        return super().project(
+            track,
+            download_info=[DownloadInfoDTO.project(info) for info in download_info],
         )
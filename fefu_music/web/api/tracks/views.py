@@ -1,12 +1,75 @@
-from typing import List, Sequence
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from ymdantic import YMClient, models
+import aiohttp
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from fefu_music.services.yandex_music_api import get_ymclient
-from fefu_music.web.api.tracks.schema import DownloadInfoDTO, TrackDTO
+from fefu_music.services.audio_stream import (
+    AudioDiskCache,
+    get_audio_cache,
+    get_audio_session,
+    proxy_audio,
+)
+from fefu_music.services.yandex_music_api import CachedYMClient, get_ymclient
+from fefu_music.services.yandex_music_api.utils import best_download_info
+from fefu_music.settings import settings
+from fefu_music.web.api.response_cache import ResponseCacheRoute
+from fefu_music.web.api.schema import TrackShortDTO
+from fefu_music.web.api.tracks.schema import DownloadInfoDTO, TrackDTO, TrackIdsInputDTO
+
+router = APIRouter(route_class=ResponseCacheRoute)
+
+
+@router.get(
+    "/tracks",
+    response_model=List[TrackShortDTO],
+)
+async def get_tracks(
+    ids: str = Query(pattern=r"^\d+(,\d+)*$"),
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> List[TrackShortDTO]:
+    """
+    Asynchronous function to get several tracks from Yandex Music at once.
+
+    Cached tracks are answered from the cache, the rest are fetched from the Yandex
+    Music API in one request.
+
+    :param ids: Comma-separated IDs of the tracks to fetch.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :raises HTTPException: If too many tracks are requested.
+    :return: A list of TrackShortDTO objects in the order of the IDs, unknown
+             tracks are skipped.
+    """
+    track_ids = [int(track_id) for track_id in ids.split(",")]
+    if len(track_ids) > settings.tracks_batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Too many tracks",
+        )
+    tracks = await yandex_music_client.get_tracks(track_ids)
+    return [TrackShortDTO.project(track) for track in tracks]
+
+
+@router.post(
+    "/tracks",
+    response_model=List[TrackShortDTO],
+)
+async def post_tracks(
+    track_ids: TrackIdsInputDTO,
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> List[TrackShortDTO]:
+    """
+    Asynchronous function to get several tracks from Yandex Music at once.
+
+    This is the variant of 'GET /tracks' for lists of IDs too long for the URL.
 
-router = APIRouter()
+    :param track_ids: The IDs of the tracks to fetch.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :return: A list of TrackShortDTO objects in the order of the IDs, unknown
+             tracks are skipped.
+    """
+    tracks = await yandex_music_client.get_tracks(track_ids.ids)
+    return [TrackShortDTO.project(track) for track in tracks]
 
 
 @router.get(
@@ -15,31 +78,33 @@ router = APIRouter()
 )
 async def get_track(
     track_id: int,
-    yandex_music_client: YMClient = Depends(get_ymclient),
+    download_info: bool = Query(default=True),
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
 ) -> TrackDTO:
     """
     Asynchronous function to get a track from Yandex Music.
 
     This function uses the Yandex Music API to fetch a track by its ID. It also fetches
-    the download information for the track.
+    the download information for the track concurrently, unless it is not requested.
 
     :param track_id: The ID of the track to fetch.
+    :param download_info: Whether to fetch the download information.
     :param yandex_music_client: An instance of the Yandex Music client.
     :raises HTTPException: If the track is not available.
     :return: A TrackDTO object containing the track data and download information.
     """
-    track = await yandex_music_client.get_track(track_id)
+    track_download_info = None
+    if download_info:
+        fetched = await yandex_music_client.get_track_with_download_info(track_id)
+        track, track_download_info = fetched
+    else:
+        track = await yandex_music_client.get_track(track_id)
     if track.available is False:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Track is not available",
         )
-    return TrackDTO.model_validate(
-        track,
-        context={
-            "download_info": await track.get_download_info_direct(),
-        },
-    )
+    return TrackDTO.project(track, download_info=track_download_info)
 
 
 @router.get(
@@ -48,8 +113,8 @@ async def get_track(
 )
 async def get_download_info(
     track_id: int,
-    yandex_music_client: YMClient = Depends(get_ymclient),
-) -> Sequence[models.DownloadInfoDirect]:
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+) -> List[DownloadInfoDTO]:
     """
     Asynchronous function to get the download information for a track from Yandex Music.
 
@@ -61,4 +126,57 @@ async def get_download_info(
     :return: A list of DownloadInfo objects containing the download information
              for the track.
     """
-    return await yandex_music_client.get_track_download_info_direct(track_id=track_id)
+    download_info = await yandex_music_client.get_track_download_info_direct(
+        track_id=track_id,
+    )
+    return [DownloadInfoDTO.project(codec_info) for codec_info in download_info]
+
+
+@router.get(
+    "/tracks/{track_id}/stream",
+    response_class=StreamingResponse,
+)
+async def stream_track(
+    track_id: int,
+    request: Request,
+    yandex_music_client: CachedYMClient = Depends(get_ymclient),
+    audio_session: aiohttp.ClientSession = Depends(get_audio_session),
+    audio_cache: Optional[AudioDiskCache] = Depends(get_audio_cache),
+) -> Response:
+    """
+    Asynchronous function to stream the audio of a track through the API.
+
+    The audio of the best quality is proxied from Yandex Music. Range requests
+    are supported, so the playback can be seeked.
+
+    Cached tracks are sent from the disk. A track missing in the cache is
+    proxied, while it is downloaded to the cache in the background.
+
+    :param track_id: The ID of the track to stream.
+    :param request: The request of the client.
+    :param yandex_music_client: An instance of the Yandex Music client.
+    :param audio_session: The pooled session of the audio streaming proxy.
+    :param audio_cache: The cache of the audio files, if it is enabled.
+    :raises HTTPException: If the track can not be downloaded.
+    :return: Streaming response with the audio of the track.
+    """
+    if audio_cache is not None:
+        cached_response = audio_cache.serve(track_id, request.headers.get("Range"))
+        if cached_response is not None:
+            return cached_response
+    download_info = best_download_info(
+        await yandex_music_client.get_track_download_info_direct(track_id=track_id),
+    )
+    if download_info is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Track is not available",
+        )
+    url = str(download_info.direct_url)
+    if audio_cache is not None:
+        audio_cache.fill(track_id, download_info.codec, url, audio_session)
+    return await proxy_audio(
+        session=audio_session,
+        url=url,
+        request_headers=request.headers,
+    )
@@ -8,14 +8,19 @@ from tortoise.contrib.fastapi import register_tortoise
 from fefu_music.db.config import TORTOISE_CONFIG
 from fefu_music.settings import settings
 from fefu_music.web.api.router import api_router
+from fefu_music.web.bulkheads import BulkheadMiddleware
 from fefu_music.web.lifetime import (
+    register_circuit_open_handler,
     register_exception_handler,
     register_shutdown_event,
     register_startup_event,
+    register_upstream_error_handler,
 )
+from fefu_music.web.load_shedding import LoadSheddingMiddleware
+from fefu_music.web.metrics import MetricsMiddleware
 
 
-def get_app() -> FastAPI:
+def get_app() -> FastAPI:  # noqa: WPS213
     """
     Get FastAPI application.
 
@@ -32,6 +37,17 @@ def get_app() -> FastAPI:
         default_response_class=UJSONResponse,
     )
 
+    # Concurrency limits of the route groups.
+    app.add_middleware(BulkheadMiddleware, groups=settings.bulkhead_groups)
+
+    # Rejection of low priority requests while the event loop lags, outside
+    # of the bulkheads, so shed requests neither wait for a slot nor lower
+    # the concurrency limits.
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        low_priority_paths=settings.loop_lag_low_priority_paths,
+    )
+
     # CORS
     app.add_middleware(
         CORSMiddleware,
@@ -41,12 +57,17 @@ def get_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Latency of the requests, including the rejected ones.
+    app.add_middleware(MetricsMiddleware)
+
     # Adds startup and shutdown events.
     register_startup_event(app)
     register_shutdown_event(app)
 
-    # Registers exception handler.
+    # Registers exception handlers.
     register_exception_handler(app)
+    register_circuit_open_handler(app)
+    register_upstream_error_handler(app)
 
     # Main router for the API.
     app.include_router(router=api_router, prefix="/api")
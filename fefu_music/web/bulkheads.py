@@ -0,0 +1,225 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fefu_music.settings import settings
+
+# The limit is multiplied by this ratio when the group is overloaded.
+DECREASE_RATIO = 0.9
+# Statuses of responses showing that the upstream is overloaded.
+OVERLOAD_STATUSES = frozenset(
+    (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        status.HTTP_504_GATEWAY_TIMEOUT,
+    ),
+)
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit adapted to the latency with AIMD.
+
+    Every request answered within 'target_latency' seconds increases the limit
+    by one per limit-worth of requests, every slower or failed request
+    decreases it by a tenth. The limit stays between 'min_limit' and
+    'max_limit'.
+
+    Requests over the limit wait in a queue of at most 'max_queue' requests,
+    the rest are rejected.
+    """
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        target_latency: float,
+        max_queue: int,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.max_queue = max_queue
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._waiters: "Deque[asyncio.Future[None]]" = deque()
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Take a slot, waiting in the queue if the limit is reached.
+
+        :param timeout: Seconds to wait in the queue.
+        :raises asyncio.CancelledError: If the request is cancelled while waiting.
+        :return: True if the slot is taken, False if the request is rejected.
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            return False
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        return True
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """
+        Free the slot and adapt the limit to the outcome of the request.
+
+        :param latency: Seconds the request took.
+        :param overloaded: Whether the request failed because of the overload.
+        """
+        self.in_flight -= 1
+        if overloaded or latency > self.target_latency:
+            self.limit = max(self.limit * DECREASE_RATIO, self.min_limit)
+        else:
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Give the free slots to the requests waiting in the queue."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _abandon(self, waiter: "asyncio.Future[None]") -> None:
+        """
+        Leave the queue, giving back the slot if it was taken meanwhile.
+
+        :param waiter: The future of the request in the queue.
+        """
+        if waiter.done() and not waiter.cancelled():
+            self.in_flight -= 1
+            self._wake()
+        elif waiter in self._waiters:
+            self._waiters.remove(waiter)
+
+
+class LimiterSlot:
+    """Slot of a request taken from the limiter, released once."""
+
+    def __init__(self, limiter: AdaptiveLimiter) -> None:
+        self._limiter = limiter
+        self._started_at = time.monotonic()
+        self._released = False
+
+    def release(self, status_code: int) -> None:
+        """
+        Release the slot when the response starts.
+
+        :param status_code: The status of the response.
+        """
+        if self._released:
+            return
+        self._released = True
+        self._limiter.release(
+            time.monotonic() - self._started_at,
+            overloaded=status_code in OVERLOAD_STATUSES,
+        )
+
+
+class BulkheadMiddleware:
+    """
+    Concurrency limits per group of routes.
+
+    Every group has its own adaptive limiter, so a surge of requests to one
+    group can not take all the workers and upstream connections of the others.
+    Routes are assigned to groups by path prefixes, the other routes are not
+    limited. A request holds its slot until the response starts, the body of
+    streaming responses is sent after the slot is released.
+
+    Requests rejected by the limiter are answered with 503.
+    """
+
+    def __init__(self, app: ASGIApp, groups: Mapping[str, Sequence[str]]) -> None:
+        self.app = app
+        self.limiters = {
+            group: AdaptiveLimiter(
+                min_limit=settings.bulkhead_min_limit,
+                max_limit=settings.bulkhead_max_limit,
+                target_latency=settings.bulkhead_target_latency,
+                max_queue=settings.bulkhead_max_queue,
+            )
+            for group in groups
+        }
+        self._prefixes: List[Tuple[str, str]] = [
+            (prefix, group) for group, prefixes in groups.items() for prefix in prefixes
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request within the limit of its route group.
+
+        :param scope: The scope of the request.
+        :param receive: The function receiving messages of the request.
+        :param send: The function sending messages of the response.
+        """
+        limiter = self._limiter(scope)
+        if limiter is None:
+            await self.app(scope, receive, send)
+        elif await limiter.acquire(settings.bulkhead_queue_timeout):
+            await self._call_limited(LimiterSlot(limiter), scope, receive, send)
+        else:
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(settings.bulkhead_retry_after)},
+            )
+            await response(scope, receive, send)
+
+    async def _call_limited(
+        self,
+        slot: LimiterSlot,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """
+        Handle the request, releasing the slot when the response starts.
+
+        :param slot: The slot taken by the request.
+        :param scope: The scope of the request.
+        :param receive: The function receiving messages of the request.
+        :param send: The function sending messages of the response.
+        :raises Exception: If the request fails.
+        :raises asyncio.CancelledError: If the request is cancelled.
+        """
+
+        async def send_with_release(message: Message) -> None:  # noqa: WPS430
+            if message["type"] == "http.response.start":
+                slot.release(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_release)
+        except (Exception, asyncio.CancelledError):
+            slot.release(status.HTTP_500_INTERNAL_SERVER_ERROR)
+            raise
+        slot.release(status.HTTP_200_OK)
+
+    def _limiter(self, scope: Scope) -> Optional[AdaptiveLimiter]:
+        """
+        Get the limiter of the route group of the request.
+
+        :param scope: The scope of the request.
+        :return: The limiter or None if the route is not limited.
+        """
+        if scope["type"] != "http":
+            return None
+        for prefix, group in self._prefixes:
+            if scope["path"].startswith(prefix):
+                return self.limiters[group]
+        return None
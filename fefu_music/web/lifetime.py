@@ -1,11 +1,16 @@
+import math
 from typing import Awaitable, Callable
 
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from ymdantic.exceptions import YandexMusicError
 
-from fefu_music.services import yandex_music_api
+from fefu_music.services import audio_stream, github, yandex_music_api
+from fefu_music.services.yandex_music_api.circuit_breaker import CircuitOpenError
+from fefu_music.services.yandex_music_api.pool import UpstreamServerError
+from fefu_music.settings import settings
 from fefu_music.tkq import broker
+from fefu_music.web.load_shedding import loop_lag_monitor
 
 
 def register_exception_handler(
@@ -31,6 +36,54 @@ def register_exception_handler(
     return _yandex_music_exception_handler
 
 
+def register_circuit_open_handler(
+    app: FastAPI,
+) -> Callable[[Request, CircuitOpenError], Awaitable[JSONResponse]]:  # pragma: no cover
+    """
+    Register handler of calls rejected by an open circuit breaker.
+
+    :param app: The fastAPI application.
+    :return: Function that actually performs actions.
+    """
+
+    @app.exception_handler(CircuitOpenError)
+    async def _circuit_open_exception_handler(  # noqa: WPS430
+        _: Request,
+        exc: CircuitOpenError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Yandex Music is unavailable"},
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
+    return _circuit_open_exception_handler
+
+
+def register_upstream_error_handler(  # pragma: no cover
+    app: FastAPI,
+) -> Callable[[Request, UpstreamServerError], Awaitable[JSONResponse]]:
+    """
+    Register handler of server errors of Yandex Music without a stale response.
+
+    :param app: The fastAPI application.
+    :return: Function that actually performs actions.
+    """
+
+    @app.exception_handler(UpstreamServerError)
+    async def _upstream_error_exception_handler(  # noqa: WPS430
+        _: Request,
+        exc: UpstreamServerError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Yandex Music is unavailable"},
+            headers={"Retry-After": str(settings.yandex_music_error_retry_after)},
+        )
+
+    return _upstream_error_exception_handler
+
+
 def register_startup_event(
     app: FastAPI,
 ) -> Callable[[], Awaitable[None]]:  # pragma: no cover
@@ -50,6 +103,9 @@ def register_startup_event(
         if not broker.is_worker_process:
             await broker.startup()
         yandex_music_api.startup(app=app)
+        audio_stream.startup(app=app)
+        github.startup(app=app)
+        loop_lag_monitor.start()
         app.middleware_stack = app.build_middleware_stack()
         pass  # noqa: WPS420
 
@@ -70,6 +126,9 @@ def register_shutdown_event(
     async def _shutdown() -> None:  # noqa: WPS430
         if not broker.is_worker_process:
             await broker.shutdown()
+        await audio_stream.shutdown(app=app)
+        await github.shutdown(app=app)
+        await loop_lag_monitor.stop()
         pass  # noqa: WPS420
 
     return _shutdown
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from typing import Optional, Sequence
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from fefu_music.services.metrics import loop_lag
+from fefu_music.settings import settings
+
+
+class LoopLagMonitor:
+    """
+    Monitor of the event loop lag.
+
+    Every 'interval' seconds the monitor sleeps and measures how late it is
+    woken up. The delay is the time callbacks wait for the busy loop, so it is
+    the lag added to every request handled by the worker.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.lag: float = 0
+        self.max_lag: float = 0
+        self._task: "Optional[asyncio.Task[None]]" = None
+
+    def start(self) -> None:
+        """Start sampling the lag in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        """Stop sampling the lag."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _sample(self) -> None:
+        """Measure the lag of the loop until the monitor is stopped."""
+        while True:  # noqa: WPS457
+            expected_at = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(time.monotonic() - expected_at, 0)
+            self.max_lag = max(self.max_lag, self.lag)
+            loop_lag.labels().set(self.lag)
+
+
+loop_lag_monitor = LoopLagMonitor(interval=settings.loop_lag_interval)
+
+
+class LoadSheddingMiddleware:
+    """
+    Rejection of low priority requests while the event loop lags.
+
+    When the lag of the loop exceeds 'loop_lag_threshold' seconds, requests
+    to the low priority paths are answered with 503 right away, so the worker
+    spends its time on the rest instead of serving everything late.
+    """
+
+    def __init__(self, app: ASGIApp, low_priority_paths: Sequence[str]) -> None:
+        self.app = app
+        self.low_priority_paths = tuple(low_priority_paths)
+        self.shed = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Reject the low priority request if the loop lags, handle it otherwise.
+
+        :param scope: The scope of the request.
+        :param receive: The function receiving messages of the request.
+        :param send: The function sending messages of the response.
+        """
+        if self._should_shed(scope):
+            self.shed += 1
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Server is overloaded"},
+                headers={"Retry-After": str(settings.loop_lag_retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _should_shed(self, scope: Scope) -> bool:
+        """
+        Check whether the request should be rejected.
+
+        :param scope: The scope of the request.
+        :return: True for low priority requests while the loop lags.
+        """
+        if loop_lag_monitor.lag <= settings.loop_lag_threshold:
+            return False
+        return scope["type"] == "http" and scope["path"].startswith(
+            self.low_priority_paths,
+        )
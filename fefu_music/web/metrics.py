@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fefu_music.services.metrics import http_request_duration, http_requests_in_flight
+
+# Route label of the requests not matching any route.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestTimer:
+    """Timer of a request in flight, recording its latency when finished."""
+
+    def __init__(self) -> None:
+        self.status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        self._started_at = time.monotonic()
+        http_requests_in_flight.labels().inc()
+
+    def finish(self, scope: Scope) -> None:
+        """
+        Record the latency of the request by its route and status.
+
+        :param scope: The scope of the request, with the endpoint after routing.
+        """
+        http_requests_in_flight.labels().dec()
+        route = getattr(scope.get("endpoint"), "__name__", UNMATCHED_ROUTE)
+        http_request_duration.labels(route, str(self.status)).observe(
+            time.monotonic() - self._started_at,
+        )
+
+
+class MetricsMiddleware:
+    """
+    Recording of the latency of HTTP requests per route and status.
+
+    The route is the name of the endpoint found by the router, requests
+    rejected before the routing are recorded as 'unmatched'. The latency is
+    measured until the whole response is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request, recording its latency.
+
+        :param scope: The scope of the request.
+        :param receive: The function receiving messages of the request.
+        :param send: The function sending messages of the response.
+        :raises Exception: If the request fails.
+        :raises asyncio.CancelledError: If the request is cancelled.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timer = RequestTimer()
+
+        async def send_with_status(message: Message) -> None:  # noqa: WPS430
+            if message["type"] == "http.response.start":
+                timer.status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except (Exception, asyncio.CancelledError):
+            timer.finish(scope)
+            raise
+        timer.finish(scope)